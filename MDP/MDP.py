@@ -18,7 +18,10 @@ License
 from MDP.spaces.space import  Space
 from MDP.transition import Transition
 from MDP.objective import Objective
+from MDP.spaces.encoding import TerminalSet
+import asyncio
 import copy
+import numpy as np
 
 class MDP:
     """
@@ -64,7 +67,9 @@ class MDP:
             isAveCost [bool]: if True, MDP is average-cost, else it is
                               discounted-cost. 
             
-            terminalStates [list]: list of absorbing state for episodic MDPs
+            terminalStates [list]: list of absorbing state for episodic MDPs.
+                                   They are stored in a TerminalSet for
+                                   constant time lookups.
                                    
                               
         Raises/Returns
@@ -96,6 +101,11 @@ class MDP:
         self.objective = objective
         self.isFiniteHorizon = isFiniteHorizon
         self.isAveCost = isAveCost
+        if terminalStates is not None and len(terminalStates) > 0:
+            self.terminalSet = TerminalSet(sSpace,terminalStates)
+        else:
+            self.terminalSet = None
+        self.scenario = None
         self.reset()
         
         
@@ -110,7 +120,9 @@ class MDP:
            
         force_noise [list]: optional, an exogenous noise vector used to 
                             evaluate next state and reward. If not provided,
-                            the noise vector will be sampled randomly
+                            the noise vector is read from the scenario set
+                            by setScenario or, without scenario, sampled
+                            randomly
                             
         Returns
         -------
@@ -128,10 +140,18 @@ class MDP:
         
         #TODO This function should support generating a list of next states
         
-        if not force_noise:
-            noise = self.nSpace.sample()[0]
-        else:
+        if force_noise is not None:
             noise = force_noise
+        elif self.scenario is not None:
+            if self.scenarioStep >= len(self.scenario):
+                raise ValueError('The scenario has %d steps, step %d was '
+                                 'requested: generate longer scenarios or '
+                                 'reset the MDP' % (len(self.scenario),
+                                                    self.scenarioStep + 1))
+            noise = self.scenario[self.scenarioStep]
+            self.scenarioStep += 1
+        else:
+            noise = self.nSpace.sample()[0]
             
         nextState = self.transition.getNextStateWithExoSamples(self.currState,
                                                                action,
@@ -148,13 +168,160 @@ class MDP:
             return nextState, reward, {'t': self.t, 'noise': noise}
         
         # Infinite horizon MDP    
-        elif self.terminalStates:
-            done = nextState in self.terminalStates
+        elif self.terminalSet is not None:
+            done = self.terminalSet.contains(nextState)
             return nextState, reward, done, {'noise': noise}            
         else:
             return nextState, reward, {'noise': noise} 
         
         
+    def setScenario(self, store, episode):
+        '''
+        Replays a stored noise path
+        ---------------------------
+        Inputs
+        ------
+        store [ScenarioStore]: the store holding the noise paths. If None,
+                               noise is sampled from nSpace again.
+        
+        episode [int]: the scenario index.
+        
+        Returns
+        -------
+        
+        Explanations
+        ------------
+        Subsequent calls to step read their noise from the given path, from
+        its start. reset rewinds to the start of the path, so that several
+        policies can be evaluated on common random numbers.
+        
+        '''
+        if store is None:
+            self.scenario = None
+        else:
+            self.scenario = store.path(episode)
+        self.scenarioStep = 0
+        
+        
+    def rollout(self, policy, chunkSize=1024, numSteps=None):
+        '''
+        Streams transitions in fixed-size chunks
+        ----------------------------------------
+        Inputs
+        ------
+        policy [callable]: maps the current state to an action.
+        
+        chunkSize [int]: the number of transitions per chunk.
+        
+        numSteps [int]: optional, the total number of transitions. If None,
+                        the generator never stops.
+        
+        Returns
+        -------
+        [generator]: yields dicts of arrays with the keys
+                     'state' (n, sDim), 'action' (n, aDim), 'reward' (n,),
+                     'nextState' (n, sDim), 'done' (n,), 't' (n,) and
+                     'noise' (n, nDim), where n is chunkSize except for the
+                     last chunk.
+        
+        Explanations
+        ------------
+        The MDP is reset first. 't' is the period of the transition within
+        its episode and 'done' flags the last transition of an episode,
+        i.e. the horizon of finite horizon MDPs or an absorbing state; the
+        MDP is then reset and the stream continues with a new episode.
+        Each chunk is only simulated when it is requested and owns its
+        arrays, so memory stays bounded by the chunks the consumer keeps.
+        '''
+        
+        assert(chunkSize > 0)
+        self.reset()
+        t = 0
+        remaining = numSteps
+        while remaining is None or remaining > 0:
+            n = chunkSize if remaining is None else min(chunkSize,remaining)
+            chunk = None
+            for i in range(n):
+                state = self.currState
+                action = policy(state)
+                out = self.step(action)
+                nextState, reward, info = out[0], out[1], out[-1]
+                if self.isFiniteHorizon:
+                    done = t + 1 >= self.isFiniteHorizon
+                else:
+                    done = len(out) == 4 and bool(out[2])
+                
+                if chunk is None:
+                    chunk = self._allocateChunk(n,state,action,info['noise'])
+                chunk['state'][i] = state
+                chunk['action'][i] = action
+                chunk['reward'][i] = reward
+                chunk['nextState'][i] = nextState
+                chunk['done'][i] = done
+                chunk['t'][i] = t
+                chunk['noise'][i] = info['noise']
+                
+                t = 0 if done else t + 1
+                if done and not self.isFiniteHorizon:
+                    self.reset()
+            if remaining is not None:
+                remaining -= n
+            yield chunk
+            
+            
+    async def arollout(self, policy, chunkSize=1024, numSteps=None):
+        '''
+        Asynchronous variant of rollout
+        -------------------------------
+        Inputs
+        ------
+        policy [callable]: maps the current state to an action.
+        
+        chunkSize [int]: the number of transitions per chunk.
+        
+        numSteps [int]: optional, the total number of transitions.
+        
+        Returns
+        -------
+        [async generator]: yields the chunks of rollout.
+        
+        Explanations
+        ------------
+        Each chunk is simulated in a worker thread, so that the event loop
+        keeps running while it is computed. The next chunk is only
+        simulated once the consumer asks for it.
+        '''
+        
+        chunks = self.rollout(policy,chunkSize,numSteps)
+        while True:
+            chunk = await asyncio.to_thread(next,chunks,None)
+            if chunk is None:
+                return
+            yield chunk
+            
+            
+    def _allocateChunk(self, n, state, action, noise):
+        '''
+        Allocates the arrays of a chunk of n transitions, with the dtypes of
+        the given state, action and noise. Values of continuous spaces are
+        stored as floats, even when the given ones happen to be integers.
+        '''
+        def valueType(space, value):
+            dtype = np.asarray(value).dtype
+            return np.result_type(dtype,float) if space.isContinuous else dtype
+
+        stateType = valueType(self.sSpace,state)
+        return {'state': np.empty((n,self.sDim),dtype=stateType),
+                'action': np.empty((n,self.aDim),
+                                   dtype=valueType(self.aSpace,action)),
+                'reward': np.empty(n,dtype=float),
+                'nextState': np.empty((n,self.sDim),dtype=stateType),
+                'done': np.zeros(n,dtype=bool),
+                't': np.empty(n,dtype=np.int64),
+                'noise': np.empty((n,self.nDim),
+                                  dtype=valueType(self.nSpace,noise))}
+        
+        
     def reset(self,):
         '''
         Resets the state back to the initial state
@@ -169,6 +336,7 @@ class MDP:
                               
         '''
         self.currState = copy.deepcopy(self.initState)
+        self.scenarioStep = 0
         if self.isFiniteHorizon:
             self.t = 0
             return (self.currState,self.t)
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+GitHub Homepage
+----------------
+    https://github.com/ADP-Benchmarks
+
+Contact information
+-------------------
+    ADP.Benchmarks@gmail.com.
+
+License
+-------
+    The MIT License
+"""
+
+import numpy as np
+
+def flattenBatch(curStates, curActions, exoSamples):
+    """
+    Inputs
+    ------
+        curStates [ndarray]: (N, sDim) array of current states.
+
+        curActions [ndarray]: (N, aDim) array of current actions.
+
+        exoSamples [ndarray]: either a (N, nDim) array holding one exogenous
+                              sample per state-action pair, or a
+                              (N, M, nDim) array holding M samples per pair.
+
+    Raises/Returns
+    --------------
+        states [ndarray]: (K, sDim) flattened states.
+
+        actions [ndarray]: (K, aDim) flattened actions.
+
+        noise [ndarray]: (K, nDim) flattened exogenous samples.
+
+        leadShape [tuple]: (N,) or (N, M), the shape the K = prod(leadShape)
+                           results should be reshaped to.
+
+    Explanations
+    ------------
+        Broadcasts states and actions against the exogenous samples so that
+        row k of the three outputs forms one (state, action, noise) triple.
+        Leading dimensions of size one are broadcast, e.g. a (1, M, nDim)
+        noise array shares the same M samples across all N pairs.
+    """
+
+    curStates = np.asarray(curStates)
+    curActions = np.asarray(curActions)
+    exoSamples = np.asarray(exoSamples)
+    assert(curStates.ndim == 2 and curActions.ndim == 2)
+    assert(exoSamples.ndim in (2,3)),"exoSamples should be a (N, nDim) or\
+    (N, M, nDim) array"
+
+    pad = (1,)*(exoSamples.ndim - 2)
+    leadShape = np.broadcast_shapes(curStates.shape[:-1] + pad,
+                                    curActions.shape[:-1] + pad,
+                                    exoSamples.shape[:-1])
+
+    states = np.broadcast_to(curStates.reshape(curStates.shape[:1] + pad +
+                                               curStates.shape[1:]),
+                             leadShape + curStates.shape[-1:])
+    actions = np.broadcast_to(curActions.reshape(curActions.shape[:1] + pad +
+                                                 curActions.shape[1:]),
+                              leadShape + curActions.shape[-1:])
+    noise = np.broadcast_to(exoSamples, leadShape + exoSamples.shape[-1:])
+
+    return (states.reshape(-1,curStates.shape[-1]),
+            actions.reshape(-1,curActions.shape[-1]),
+            noise.reshape(-1,exoSamples.shape[-1]),
+            leadShape)
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+GitHub Homepage
+----------------
+    https://github.com/ADP-Benchmarks
+
+Contact information
+-------------------
+    ADP.Benchmarks@gmail.com.
+
+License
+-------
+    The MIT License
+"""
+
+import sys
+from collections import OrderedDict
+
+def nbytes(value):
+    """
+    Returns the size in bytes of a value: the nbytes of arrays, summed over
+    the items of tuples and lists, and sys.getsizeof otherwise.
+    """
+    if hasattr(value,'nbytes'):
+        return int(value.nbytes)
+    if isinstance(value,(tuple,list)):
+        return sum(nbytes(item) for item in value)
+    return sys.getsizeof(value)
+
+class LRUCache():
+    """
+    Description
+    -----------
+        This class provides a bounded memoization table. When more than
+        maxSize entries, or more than maxBytes bytes, are stored, the least
+        recently used entries are evicted. Hits, misses and evictions are
+        counted.
+    """
+
+    def __init__(self, maxSize=1024, maxBytes=None, sizeof=None):
+        """
+        Inputs
+        ------
+            maxSize [int]: the maximum number of entries, or None for no
+                           limit on the number of entries.
+
+            maxBytes [int]: optional, the maximum total size of the values.
+
+            sizeof [callable]: maps a value to its size in bytes. Defaults
+                               to nbytes.
+
+        Raises/Returns
+        --------------
+
+        Explanations
+        ------------
+            The constructor of LRUCache object.
+        """
+
+        assert(maxSize is None or (isinstance(maxSize,int) and maxSize > 0)
+               ),"Cache size should be a positive integer"
+        assert(maxBytes is None or maxBytes > 0),"The byte budget should be\
+        positive"
+
+        self.maxSize = maxSize
+        self.maxBytes = maxBytes
+        self.sizeof = nbytes if sizeof is None else sizeof
+        self.entries = OrderedDict()
+        self.sizes = {}
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key, default=None):
+        """
+        Inputs
+        ------
+            key [hashable]: the entry key.
+
+            default [object]: returned when the key is not stored.
+
+        Raises/Returns
+        --------------
+            [object]: the stored value, or default.
+
+        Explanations
+        ------------
+            Looks up a key and marks it as most recently used.
+        """
+
+        try:
+            value = self.entries[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """
+        Inputs
+        ------
+            key [hashable]: the entry key.
+
+            value [object]: the entry value.
+
+        Raises/Returns
+        --------------
+
+        Explanations
+        ------------
+            Stores a value and evicts the least recently used entries
+            beyond maxSize or maxBytes. A value larger than maxBytes on
+            its own is evicted right away.
+        """
+
+        size = self.sizeof(value) if self.maxBytes is not None else 0
+        self.bytes += size - self.sizes.get(key,0)
+        self.sizes[key] = size
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while self.entries and (
+                (self.maxSize is not None and len(self.entries) > self.maxSize)
+                or (self.maxBytes is not None and self.bytes > self.maxBytes)):
+            oldest,_ = self.entries.popitem(last=False)
+            self.bytes -= self.sizes.pop(oldest)
+            self.evictions += 1
+
+    def clear(self):
+        """
+        Drops every entry, the statistics are kept.
+        """
+        self.entries.clear()
+        self.sizes.clear()
+        self.bytes = 0
+
+    def stats(self):
+        """
+        Inputs
+        ------
+
+        Raises/Returns
+        --------------
+            [dict]: 'size', 'bytes', 'hits', 'misses', 'evictions' and
+                    'hitRate'. 'bytes' is only tracked with a byte budget.
+
+        Explanations
+        ------------
+            Reports the cache statistics.
+        """
+
+        lookups = self.hits + self.misses
+        return {'size': len(self.entries),
+                'bytes': self.bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hitRate': self.hits/lookups if lookups else 0.0}
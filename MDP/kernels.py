@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+GitHub Homepage
+----------------
+    https://github.com/ADP-Benchmarks
+
+Contact information
+-------------------
+    ADP.Benchmarks@gmail.com.
+
+License
+-------
+    The MIT License
+"""
+
+import numpy as np
+from functools import partial
+from MDP.transition import Transition
+from MDP.objective import Objective
+from MDP.batch import flattenBatch
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+class ArrayKernel():
+    """
+    Description
+    -----------
+        This class wraps a pure function of (states, actions, noise) arrays
+        of K rows each, returning one result row per triple. When jit is
+        requested and Numba is installed, the function is compiled with
+        numba.njit. Numba specializes the compiled function to the dtype
+        and ndim of its inputs, so the first compiled call of every input
+        signature is checked against the plain function. The compiled
+        version is dropped if it fails or does not give identical results,
+        so that the output never depends on the backend.
+
+        Parameterized kernels are given as functools.partial objects of
+        module-level functions, e.g. partial(fn, capacity), whose leading
+        arguments are the parameters: the underlying function is compiled
+        and the kernel can be pickled, unlike a closure.
+    """
+
+    def __init__(self, fn, jit=True):
+        """
+        Inputs
+        ------
+            fn [callable]: fn(states, actions, noise) with (K, sDim),
+                           (K, aDim) and (K, nDim) arrays, returning a
+                           (K, ...) array, or a functools.partial binding
+                           the leading parameters of such a function.
+
+            jit [bool]: if True, fn is compiled when Numba is installed.
+
+        Raises/Returns
+        --------------
+
+        Explanations
+        ------------
+            The constructor of ArrayKernel object.
+        """
+        self.fn = fn
+        self.jit = jit
+        self.compile()
+
+    def compile(self):
+        """
+        Compiles fn, or the function of a partial, when jit is requested
+        and Numba is installed.
+        """
+        if isinstance(self.fn,partial):
+            assert(not self.fn.keywords),"Kernel parameters should be bound\
+            positionally"
+            function,self.params = self.fn.func,self.fn.args
+        else:
+            function,self.params = self.fn,()
+        self.compiled = (numba.njit(function) if self.jit and numba is not None
+                         else None)
+        # Input signatures whose compiled results were checked
+        self.verified = set()
+
+    def __getstate__(self):
+        # Compiled functions are rebuilt, and checked again, on unpickling
+        return {'fn': self.fn, 'jit': self.jit}
+
+    def __setstate__(self, state):
+        self.fn = state['fn']
+        self.jit = state['jit']
+        self.compile()
+
+    @property
+    def isCompiled(self):
+        """
+        True if the calls run the compiled function.
+        """
+        return self.compiled is not None
+
+    def __call__(self, states, actions, noise):
+        states = np.ascontiguousarray(states)
+        actions = np.ascontiguousarray(actions)
+        noise = np.ascontiguousarray(noise)
+        if self.compiled is None:
+            return np.asarray(self.fn(states,actions,noise))
+        signature = tuple((array.dtype.str,array.ndim)
+                          for array in (states,actions,noise))
+        if signature in self.verified:
+            return self.compiled(*self.params,states,actions,noise)
+
+        result = np.asarray(self.fn(states,actions,noise))
+        try:
+            compiled = np.asarray(self.compiled(*self.params,states,actions,
+                                                noise))
+            same = (compiled.shape == result.shape and
+                    compiled.dtype == result.dtype and
+                    np.array_equal(compiled,result,equal_nan=True))
+        except Exception:
+            same = False
+        if same:
+            self.verified.add(signature)
+        else:
+            self.compiled = None
+        return result
+
+
+class KernelTransition(Transition):
+    """
+    Description
+    -----------
+        This class provides a transition defined by an array kernel
+        returning the (K, sDim) next states of K (state, action, noise)
+        triples, e.g. the inventory balance s' = s + a - w. The single
+        sample and the batched methods both run the kernel, so they give
+        identical results.
+    """
+
+    def __init__(self, sSpace, aSpace, kernel, jit=True, nSpace=None):
+        """
+        Inputs
+        ------
+            sSpace [Space]: MDP state space.
+
+            aSpace [Space]: MDP action space.
+
+            kernel [callable]: kernel(states, actions, noise) returning the
+                               (K, sDim) next states.
+
+            jit [bool]: if True, the kernel is compiled when Numba is
+                        installed.
+
+            nSpace [Space]: optional, as in Transition.
+
+        Raises/Returns
+        --------------
+
+        Explanations
+        ------------
+            The constructor of KernelTransition object.
+        """
+        super(KernelTransition,self).__init__(sSpace,aSpace,nSpace)
+        self.kernel = ArrayKernel(kernel,jit)
+
+    def getNextStateWithExoSamples(self, curState,curAction,exoSamples):
+        assert(self.sSpace.isStateFeasble(curState))
+        assert(self.aSpace.isStateActionFeasble(curState,curAction))
+        return self.kernel(np.asarray(curState)[np.newaxis],
+                           np.asarray(curAction)[np.newaxis],
+                           np.asarray(exoSamples)[np.newaxis])[0]
+
+    def getNextStatesBatch(self, curStates,curActions,exoSamples):
+        states,actions,noise,leadShape = flattenBatch(curStates,
+                                                      curActions,
+                                                      exoSamples)
+        return self.kernel(states,actions,noise).reshape(leadShape + (-1,))
+
+
+class KernelObjective(Objective):
+    """
+    Description
+    -----------
+        This class provides an objective defined by an array kernel
+        returning the (K,) costs or rewards of K (state, action, noise)
+        triples. The single sample and the batched methods both run the
+        kernel, so they give identical results.
+    """
+
+    def __init__(self, sSpace, aSpace, kernel, jit=True, isDeterministic=True,
+                 isMinCost=True, nSpace=None, cacheSize=None):
+        """
+        Inputs
+        ------
+            sSpace [Space]: MDP state space.
+
+            aSpace [Space]: MDP action space.
+
+            kernel [callable]: kernel(states, actions, noise) returning the
+                               (K,) costs/rewards.
+
+            jit [bool]: if True, the kernel is compiled when Numba is
+                        installed.
+
+            isDeterministic, isMinCost, nSpace, cacheSize: as in Objective.
+
+        Raises/Returns
+        --------------
+
+        Explanations
+        ------------
+            The constructor of KernelObjective object.
+        """
+        super(KernelObjective,self).__init__(sSpace,aSpace,isDeterministic,
+                                             isMinCost,nSpace,cacheSize)
+        self.kernel = ArrayKernel(kernel,jit)
+
+    def getObjectiveWithExoSamples(self,curState,curAction,exoSamples):
+        assert(self.sSpace.isStateFeasble(curState))
+        assert(self.aSpace.isStateActionFeasble(curState,curAction))
+        return float(self.kernel(np.asarray(curState)[np.newaxis],
+                                 np.asarray(curAction)[np.newaxis],
+                                 np.asarray(exoSamples)[np.newaxis])[0])
+
+    def getObjectivesBatch(self,curStates,curActions,exoSamples):
+        states,actions,noise,leadShape = flattenBatch(curStates,
+                                                      curActions,
+                                                      exoSamples)
+        return self.kernel(states,actions,noise).reshape(leadShape)
@@ -16,6 +16,10 @@ License
 """
 import numpy as np
 from MDP.spaces.space import Space
+from MDP.batch import flattenBatch
+from MDP.cache import LRUCache
+from MDP.spaces.encoding import exactKey
+from sampling.sequential import sequentialMean
 
 class Objective:
     """
@@ -28,7 +32,9 @@ class Objective:
     def __init__(self, sSpace,
                        aSpace,
                        isDeterministic = True,
-                       isMinCost = True):
+                       isMinCost = True,
+                       nSpace = None,
+                       cacheSize = None):
         
         """
         Inputs
@@ -44,6 +50,14 @@ class Objective:
             
             isMinCost [bool]: if True, MDP is min-cost, else it is
                               max-reward.    
+            
+            nSpace [Space]: MDP exogenous noise space. It is needed to
+                            sample the noise in exceptObjective.
+            
+            cacheSize [int]: if not None, exceptObjective memoizes up to
+                             cacheSize expected costs of discrete
+                             state-action pairs, least recently used
+                             entries being evicted first.
                               
         Raises/Returns
         --------------
@@ -62,6 +76,8 @@ class Objective:
         self.aSpace = aSpace
         self.isMinCost = isMinCost
         self.isDeterministic = isDeterministic
+        self.nSpace = nSpace
+        self.cache = None if cacheSize is None else LRUCache(cacheSize)
     
     def exceptObjective(self,curState,curAction,numNextState=None):
         """
@@ -85,11 +101,108 @@ class Objective:
         ------------
             This function computes cost/expected cost given a state-action pair
             and the number of samples needed for sample average approximation.
+            All samples are drawn from nSpace at once and evaluated by a
+            single call to getObjectivesBatch. When the cache is enabled and
+            both spaces are discrete, results are memoized by the encoded
+            state-action pair.
         """
         
         assert(self.sSpace.isStateFeasble(curState))
         assert(self.aSpace.isStateActionFeasble(curState,curAction))
-        pass
+        assert(self.nSpace is not None),"nSpace is needed to sample the noise"
+        if self.isDeterministic:
+            numNextState = 1
+        assert(isinstance(numNextState,int) and numNextState > 0),"The number\
+        of samples should be a positive integer"
+        
+        curState = np.asarray(curState)
+        curAction = np.asarray(curAction)
+        key = self.cacheKey(curState,curAction,numNextState)
+        if key is not None:
+            value = self.cache.get(key)
+            if value is not None:
+                return value
+        
+        exoSamples = np.asarray(self.nSpace.sample(numNextState))
+        value = float(np.mean(self.getObjectivesBatch(curState[np.newaxis],
+                                                      curAction[np.newaxis],
+                                                      exoSamples[np.newaxis])))
+        if key is not None:
+            self.cache.put(key,value)
+        return value
+    
+    def estimateObjective(self,curState,curAction,absTol=None,relTol=None,
+                          confidence=0.95,initial=32,maxSamples=65536):
+        """
+        Inputs
+        ------
+            curState [list]: current state vector.
+            
+            curAction [list]: current action vector.
+            
+            absTol, relTol, confidence, initial, maxSamples: the stopping
+                rule, see sampling.sequential.sequentialMean.
+                
+        Raises/Returns
+        --------------
+            [dict]: 'estimate' of the expected cost, its 'stdError', the
+                    'numSamples' used and whether it 'converged'.
+        
+        Explanations
+        ------------
+            Adaptive counterpart of exceptObjective: batches of growing
+            size are drawn from nSpace until the confidence interval of
+            the expected cost is narrow enough, so that low variance pairs
+            use few samples. Deterministic objectives use one sample.
+        """
+        
+        assert(self.sSpace.isStateFeasble(curState))
+        assert(self.aSpace.isStateActionFeasble(curState,curAction))
+        assert(self.nSpace is not None),"nSpace is needed to sample the noise"
+        
+        curState = np.asarray(curState)[np.newaxis]
+        curAction = np.asarray(curAction)[np.newaxis]
+        def draw(n):
+            exoSamples = np.asarray(self.nSpace.sample(n))
+            return self.getObjectivesBatch(curState,curAction,
+                                           exoSamples[np.newaxis])[0]
+        
+        if self.isDeterministic:
+            return {'estimate': float(draw(1)[0]),'stdError': 0.0,
+                    'numSamples': 1,'converged': True}
+        return sequentialMean(draw,absTol,relTol,confidence,initial,
+                              maxSamples=maxSamples)
+    
+    def cacheKey(self,curState,curAction,numNextState):
+        """
+        Inputs
+        ------
+            curState [ndarray]: current state vector.
+            
+            curAction [ndarray]: current action vector.
+            
+            numNextState [int]: the number of samples.
+                
+        Raises/Returns
+        --------------
+            [tuple]: the memoization key, or None if the pair is not cached.
+        
+        Explanations
+        ------------
+            Pairs are cached only when the cache is enabled and both spaces
+            are discrete, the key being the encoded state, the encoded
+            action and the number of samples. Pairs that are not exact
+            points of the spaces are not cached, their keys would alias the
+            ones of nearby points.
+        """
+        if (self.cache is None or self.sSpace.isContinuous
+                or self.aSpace.isContinuous):
+            return None
+        stateKey = exactKey(self.sSpace,curState)
+        actionKey = exactKey(self.aSpace,curAction)
+        if stateKey is None or actionKey is None:
+            return None
+        return (stateKey,actionKey,numNextState)
     
         
     def getObjectiveWithExoSamples(self,curState,curAction,exoSamples):
@@ -118,6 +231,36 @@ class Objective:
         assert(self.sSpace.isStateFeasble(curState))
         assert(self.aSpace.isStateActionFeasble(curState,curAction))
         raise NotImplementedError
-    
-    
-        
\ No newline at end of file
+
+    def getObjectivesBatch(self,curStates,curActions,exoSamples):
+        """
+        Inputs
+        ------
+            curStates [ndarray]: (N, sDim) array of current states.
+
+            curActions [ndarray]: (N, aDim) array of current actions.
+
+            exoSamples [ndarray]: (N, nDim) array with one exogenous sample
+                                  per state-action pair, or (N, M, nDim)
+                                  array with M samples per pair.
+
+        Raises/Returns
+        --------------
+            [ndarray]: (N,) or (N, M) array of costs/rewards.
+
+        Explanations
+        ------------
+            This function computes the cost/reward of a batch of
+            state-action pairs. The default implementation loops over
+            getObjectiveWithExoSamples, subclasses should override it with
+            an array implementation for speed.
+        """
+        states,actions,noise,leadShape = flattenBatch(curStates,
+                                                      curActions,
+                                                      exoSamples)
+        objectives = np.asarray([self.getObjectiveWithExoSamples(states[k],
+                                                                 actions[k],
+                                                                 noise[k])
+                                 for k in range(states.shape[0])],
+                                dtype=float)
+        return objectives.reshape(leadShape)
@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+GitHub Homepage
+----------------
+    https://github.com/ADP-Benchmarks
+
+Contact information
+-------------------
+    ADP.Benchmarks@gmail.com.
+
+License
+-------
+    The MIT License
+"""
+
+import functools
+import json
+import marshal
+import math
+import time
+
+# The hot-path methods instrumented on each component, with the function
+# giving the batch size of a call from its positional arguments
+def _one(args):
+    return 1
+
+def _leading(args):
+    return len(args[0]) if args else 1
+
+def _count(args):
+    return args[0] if args else 1
+
+MDP_METHODS = {'step': _one}
+TRANSITION_METHODS = {'getNextState': _one,
+                      'getNextStateWithExoSamples': _one,
+                      'getNextStatesBatch': _leading}
+OBJECTIVE_METHODS = {'getObjectiveWithExoSamples': _one,
+                     'getObjectivesBatch': _leading,
+                     'exceptObjective': _one}
+SPACE_METHODS = {'isStateFeasble': _one,
+                 'isStateActionFeasble': _one,
+                 'isStateFeasbleBatch': _leading,
+                 'isStateActionFeasbleBatch': _leading}
+SAMPLER_METHODS = {'sample': _count,
+                   'drawBlock': _count}
+
+
+class CallStats():
+    """
+    Description
+    -----------
+        This class accumulates the statistics of one instrumented method:
+        the number of calls, the cumulative time and the time spent outside
+        of other instrumented methods, a log-scale histogram of the per-call
+        times, and the batch sizes.
+    """
+    # Histogram bins are quarter decades, from 100ns to 100s
+    binsPerDecade = 4
+    minExponent = -7
+    numBins = 4*9 + 1
+
+    def __init__(self):
+        """
+        Inputs
+        ------
+
+        Raises/Returns
+        --------------
+
+        Explanations
+        ------------
+            The constructor of CallStats object.
+        """
+        self.calls = 0
+        self.cumTime = 0.0
+        self.totTime = 0.0
+        self.histogram = [0]*self.numBins
+        self.items = 0
+        self.minBatch = None
+        self.maxBatch = None
+        self.callers = {}
+
+    def record(self, elapsed, ownTime, batch, caller):
+        """
+        Adds one call of elapsed seconds, ownTime of which outside of
+        instrumented callees, on a batch of the given size.
+        """
+        self.calls += 1
+        self.cumTime += elapsed
+        self.totTime += ownTime
+        if elapsed > 0:
+            b = int(math.floor((math.log10(elapsed) - self.minExponent)
+                               *self.binsPerDecade))
+            self.histogram[min(max(b,0),self.numBins - 1)] += 1
+        else:
+            self.histogram[0] += 1
+        self.items += batch
+        self.minBatch = batch if self.minBatch is None else min(self.minBatch,
+                                                                batch)
+        self.maxBatch = batch if self.maxBatch is None else max(self.maxBatch,
+                                                                batch)
+        stats = self.callers.get(caller,[0,0.0,0.0])
+        stats[0] += 1
+        stats[1] += ownTime
+        stats[2] += elapsed
+        self.callers[caller] = stats
+
+    def binEdges(self):
+        """
+        Returns the numBins + 1 edges of the histogram bins, in seconds. The
+        first and last bins also hold the faster and slower calls.
+        """
+        return [10 ** (self.minExponent + b/self.binsPerDecade)
+                for b in range(self.numBins + 1)]
+
+    def toDict(self):
+        """
+        Returns the statistics as a JSON serializable dict.
+        """
+        return {'calls': self.calls,
+                'cumTime': self.cumTime,
+                'totTime': self.totTime,
+                'meanTime': self.cumTime/self.calls if self.calls else 0.0,
+                'histogram': {'edges': self.binEdges(),
+                              'counts': list(self.histogram)},
+                'batch': {'items': self.items,
+                          'mean': self.items/self.calls if self.calls else 0.0,
+                          'min': self.minBatch,
+                          'max': self.maxBatch},
+                'callers': {caller: stats[0]
+                            for caller,stats in self.callers.items()}}
+
+
+class Profiler():
+    """
+    Description
+    -----------
+        This class provides opt-in instrumentation of the hot paths of an
+        MDP: MDP.step, the Transition and Objective methods, the feasibility
+        checks of the spaces and their samplers. Attaching wraps the methods
+        of the given objects only, so that un-profiled runs execute the
+        original code without any overhead. Nested calls are attributed
+        like cProfile does: cumTime includes instrumented callees, totTime
+        excludes them.
+
+        Usage:
+            profiler = Profiler()
+            with profiler.attach(mdp):
+                ...
+            profiler.printStats()
+    """
+
+    def __init__(self):
+        """
+        Inputs
+        ------
+
+        Raises/Returns
+        --------------
+
+        Explanations
+        ------------
+            The constructor of Profiler object.
+        """
+        self.stats = {}
+        self.stack = []
+        self.patched = []
+
+    def attach(self, mdp):
+        """
+        Inputs
+        ------
+            mdp [MDP]: the MDP to instrument.
+
+        Raises/Returns
+        --------------
+            [Profiler]: self, to be used as a context manager that detaches
+                        on exit.
+
+        Explanations
+        ------------
+            Instruments the MDP, its transition and objective, and the
+            state, action and noise spaces with their samplers. Objects
+            shared by several roles are instrumented once.
+        """
+        self.instrument(mdp,MDP_METHODS,'MDP')
+        self.instrument(mdp.transition,TRANSITION_METHODS,'Transition')
+        self.instrument(mdp.objective,OBJECTIVE_METHODS,'Objective')
+        for name,space in (('sSpace',mdp.sSpace),('aSpace',mdp.aSpace),
+                           ('nSpace',mdp.nSpace)):
+            self.instrument(space,SPACE_METHODS,name)
+            sampler = getattr(space,'sampler',None)
+            if sampler is not None:
+                self.instrument(sampler,SAMPLER_METHODS,name + '.sampler')
+        return self
+
+    def instrument(self, obj, methods, prefix):
+        """
+        Inputs
+        ------
+            obj [object]: the object to instrument.
+
+            methods [dict]: maps the method names to a function giving the
+                            batch size of a call from its positional
+                            arguments.
+
+            prefix [str]: the prefix of the statistics names.
+
+        Raises/Returns
+        --------------
+
+        Explanations
+        ------------
+            Shadows the methods of obj by timed wrappers stored in its
+            instance dict. Methods that obj does not define are skipped.
+        """
+        if any(patched is obj for patched,_ in self.patched):
+            return
+        names = []
+        for method,batchSize in methods.items():
+            original = getattr(obj,method,None)
+            if original is None or method in vars(obj):
+                continue
+            setattr(obj,method,self.wrap(original,prefix + '.' + method,
+                                         batchSize))
+            names.append(method)
+        self.patched.append((obj,names))
+
+    def wrap(self, fn, name, batchSize):
+        """
+        Returns fn wrapped to record its calls under name.
+        """
+        stats = self.stats.setdefault(name,CallStats())
+        stack = self.stack
+        clock = time.perf_counter
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            # Callees add their time to the entry and read the caller name
+            frame = [0.0,name]
+            stack.append(frame)
+            start = clock()
+            try:
+                return fn(*args,**kwargs)
+            finally:
+                elapsed = clock() - start
+                stack.pop()
+                if stack:
+                    stack[-1][0] += elapsed
+                    caller = stack[-1][1]
+                else:
+                    caller = None
+                stats.record(elapsed,elapsed - frame[0],batchSize(args),
+                             caller)
+        return wrapper
+
+    def detach(self):
+        """
+        Inputs
+        ------
+
+        Raises/Returns
+        --------------
+
+        Explanations
+        ------------
+            Restores the original methods. The statistics are kept.
+        """
+        for obj,names in self.patched:
+            for method in names:
+                delattr(obj,method)
+        self.patched = []
+
+    def reset(self):
+        """
+        Clears the statistics.
+        """
+        for name in self.stats:
+            self.stats[name].__init__()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.detach()
+        return False
+
+    def report(self):
+        """
+        Inputs
+        ------
+
+        Raises/Returns
+        --------------
+            [dict]: maps the names of the called methods to their
+                    statistics.
+
+        Explanations
+        ------------
+            Summarizes the instrumented calls, methods that were never
+            called are omitted.
+        """
+        return {name: stats.toDict() for name,stats in self.stats.items()
+                if stats.calls}
+
+    def toJSON(self, filename=None):
+        """
+        Inputs
+        ------
+            filename [str]: optional, the output file.
+
+        Raises/Returns
+        --------------
+            [str]: the JSON report.
+
+        Explanations
+        ------------
+            Serializes report, and writes it to filename if given.
+        """
+        text = json.dumps(self.report(),indent=2)
+        if filename is not None:
+            with open(filename,'w') as f:
+                f.write(text)
+        return text
+
+    def pstats(self):
+        """
+        Inputs
+        ------
+
+        Raises/Returns
+        --------------
+            [dict]: the statistics in the format of the pstats module, i.e.
+                    (file, line, name) -> (primitive calls, calls, tottime,
+                    cumtime, callers).
+
+        Explanations
+        ------------
+            Converts the statistics to the pstats format, with the prefix
+            of the names standing for the file.
+        """
+        def key(name):
+            prefix,_,method = name.rpartition('.')
+            return (prefix,0,method)
+
+        table = {}
+        for name,stats in self.stats.items():
+            if not stats.calls:
+                continue
+            callers = {key(caller): (calls,calls,tt,ct)
+                       for caller,(calls,tt,ct) in stats.callers.items()
+                       if caller is not None}
+            table[key(name)] = (stats.calls,stats.calls,stats.totTime,
+                                stats.cumTime,callers)
+        return table
+
+    def dumpStats(self, filename):
+        """
+        Inputs
+        ------
+            filename [str]: the output file.
+
+        Raises/Returns
+        --------------
+
+        Explanations
+        ------------
+            Writes the statistics in the binary format of
+            cProfile.Profile.dump_stats, readable by pstats.Stats and the
+            usual profile viewers.
+        """
+        with open(filename,'wb') as f:
+            marshal.dump(self.pstats(),f)
+
+    def printStats(self, sort='cumulative', stream=None):
+        """
+        Inputs
+        ------
+            sort [str]: a pstats sort key, e.g. 'cumulative', 'tottime' or
+                        'calls'.
+
+            stream [file]: optional, the output stream.
+
+        Raises/Returns
+        --------------
+
+        Explanations
+        ------------
+            Prints a cProfile-like table of the instrumented calls.
+        """
+        import pstats
+
+        class _Source():
+            def create_stats(source):
+                source.stats = self.pstats()
+
+        stats = pstats.Stats(_Source(),stream=stream)
+        stats.sort_stats(sort).print_stats()
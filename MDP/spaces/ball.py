@@ -19,6 +19,7 @@ from MDP.spaces.space import Space
 import numpy as np
 from numpy import ndarray
 from sampling.sampler import BallSampler
+from MDP.spaces.lattice import LatticeIndex
 
 class Ball(Space):
     """
@@ -27,7 +28,8 @@ class Ball(Space):
         This class provides an implementation of d-dimensional balls.
         A ball object can be used to define the MDP state/action space.
     """   
-    def __init__(self,center,radius,isContinuous=True):
+    def __init__(self,center,radius,isContinuous=True,blockSize=1024,
+                 seed=None,samplingMethod='uniform'):
         """
         Inputs
         ------
@@ -38,6 +40,16 @@ class Ball(Space):
             isContinuous [bool]: if True, the ball is considered as a
                                  continuous set, else it is treated as a
                                  discrete set
+
+            blockSize [int]: the number of samples pre-drawn at once by the
+                             ball sampler.
+
+            seed [int, SeedSequence or Generator]: optional, the seed of the
+                                                   sampler random generator.
+
+            samplingMethod [str]: 'uniform', 'lhs' (Latin hypercube),
+                                  'sobol' or 'halton' (scrambled quasi-Monte
+                                  Carlo sequences) mapped into the ball.
             
         Raises/Returns
         --------------
@@ -59,7 +71,50 @@ class Ball(Space):
         self.center = center
         self.radius = radius
         self.shape = center.shape
+        # Built on first use, see the lattice property
+        self._lattice = None
+        self.sampler = BallSampler(self,blockSize=blockSize,seed=seed,
+                                   method=samplingMethod)
     
+    @property
+    def lattice(self):
+        """
+        Returns the LatticeIndex of a discrete ball, None for a continuous
+        one. The index is built on first use, so that balls that are only
+        sampled or checked for feasibility never build it.
+        """
+        if self.isContinuous:
+            return None
+        if self._lattice is None:
+            # Lattice points are the center plus integer offsets
+            self._lattice = LatticeIndex(self.center,self.radius)
+        return self._lattice
+
+    @property
+    def encoder(self):
+        """
+        Same as lattice, the encoder of the discrete ball.
+        """
+        return self.lattice
+
+    @property
+    def cardinality(self):
+        """
+        Returns the number of lattice points of a discrete ball, None for a
+        continuous one.
+        """
+        lattice = self.lattice
+        return None if lattice is None else lattice.cardinality
+
+    def isLatticeBatch(self, states):
+        """
+        Returns the (...) boolean array, True for the states whose offsets
+        to the center are integral and of norm at most radius.
+        """
+        offsets = np.asarray(states) - self.center
+        return (np.all(np.rint(offsets) == offsets,axis=-1)
+                & (np.sum(np.square(offsets),axis=-1) <= self.radius ** 2))
+
     def sample(self,numSamples=1):
         """
         Inputs
@@ -68,7 +123,7 @@ class Ball(Space):
             
         Raises/Returns
         --------------
-            [list]: a list of samples from the ball.
+            [ndarray]: (numSamples, dim) array of samples from the ball.
             
         Explanations
         ------------
@@ -76,7 +131,7 @@ class Ball(Space):
         """
         
         assert(isinstance(numSamples,int))
-        return BallSampler(self).sample(numSamples)
+        return self.sampler.sample(numSamples)
         
     def isStateFeasble(self, s):
         """
@@ -94,6 +149,8 @@ class Ball(Space):
         """ 
         
         s = np.array(s) if isinstance(s, list) else s
+        if not self.isContinuous:
+            return s.shape == self.shape and bool(self.isLatticeBatch(s))
         return s.shape == self.shape and np.sum(np.square(s - self.center)) <= self.radius ** 2
 
     def isStateActionFeasble(self, s, a):
@@ -116,5 +173,102 @@ class Ball(Space):
             a = np.array(a)  
         elif isinstance(a, int):    
             a = np.array([a])  
-        pass
-        
\ No newline at end of file
+        return self.isStateFeasble(a)
+
+    def isStateFeasbleBatch(self, states):
+        """
+        Inputs
+        ------
+            states [ndarray]: (N, dim) array of states.
+
+        Raises/Returns
+        --------------
+            mask [ndarray]: (N,) boolean array, True for the feasible states.
+
+            violations [ndarray]: indices of the infeasible states.
+
+        Explanations
+        ------------
+            Checks a batch of states against the ball in one pass.
+        """
+        states = np.asarray(states)
+        if states.ndim != 2 or states.shape[1:] != self.shape:
+            mask = np.zeros(len(states),dtype=bool)
+        elif not self.isContinuous:
+            mask = self.isLatticeBatch(states)
+        else:
+            mask = (np.sum(np.square(states - self.center),axis=1)
+                    <= self.radius ** 2)
+        return mask, np.flatnonzero(~mask)
+
+    def isStateActionFeasbleBatch(self, states, actions):
+        """
+        Inputs
+        ------
+            states [ndarray]: (N, sDim) array of states.
+
+            actions [ndarray]: (N, dim) array of actions.
+
+        Raises/Returns
+        --------------
+            mask [ndarray]: (N,) boolean array, True for the feasible actions.
+
+            violations [ndarray]: indices of the infeasible actions.
+
+        Explanations
+        ------------
+            Checks a batch of actions against the ball in one pass. As in
+            isStateActionFeasble, the states are not used.
+        """
+        return self.isStateFeasbleBatch(actions)
+
+    def encode(self, states):
+        """
+        Inputs
+        ------
+            states [ndarray]: (..., dim) array of lattice points of the ball.
+            
+        Raises/Returns
+        --------------
+            [ndarray]: (...) int64 array of indices in [0, cardinality).
+            
+        Explanations
+        ------------
+            Maps the points of a discrete ball to their dense index in the
+            lattice index, -1 for points outside the lattice.
+        """ 
+        assert(not self.isContinuous),"Only discrete balls are encoded"
+        return self.lattice.index(states)
+
+    def decode(self, keys):
+        """
+        Inputs
+        ------
+            keys [ndarray]: (...) array of indices.
+            
+        Raises/Returns
+        --------------
+            [ndarray]: (..., dim) array of states.
+            
+        Explanations
+        ------------
+            Inverse of encode.
+        """ 
+        assert(not self.isContinuous),"Only discrete balls are encoded"
+        return self.lattice.decode(keys)
+
+    def enumerate(self):
+        """
+        Inputs
+        ------
+            
+        Raises/Returns
+        --------------
+            [ndarray]: (cardinality, dim) array of all lattice points.
+            
+        Explanations
+        ------------
+            Enumerates the points of a discrete ball, in index order.
+        """ 
+        assert(not self.isContinuous),"Only discrete balls are enumerated"
+        return self.lattice.enumerate()
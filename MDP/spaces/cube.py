@@ -18,6 +18,7 @@ License
 from MDP.spaces.space import Space
 import numpy as np
 from sampling.sampler import CubeSampler
+from MDP.spaces.encoding import MixedRadixEncoder
 
 class Cube(Space):
     """
@@ -27,7 +28,8 @@ class Cube(Space):
         A hypercube object can be used to define the MDP state/action space.
     """ 
     
-    def __init__(self,intervals,isContinuous=True):
+    def __init__(self,intervals,isContinuous=True,blockSize=1024,seed=None,
+                 samplingMethod='uniform'):
         """
         Inputs
         ------
@@ -36,6 +38,20 @@ class Cube(Space):
                                  np.asarray([[-2,3] , [4,5], [2,3] , [-6,5]])
                                  defines 4-dimensional hypercube given by
                                  [-2,3]*[4,5]*[2,3]*[-6,5].
+
+            isContinuous [bool]: if True, the hypercube is considered as a
+                                 continuous set, else it is treated as a
+                                 discrete set
+
+            blockSize [int]: the number of samples pre-drawn at once by the
+                             hypercube sampler.
+
+            seed [int, SeedSequence or Generator]: optional, the seed of the
+                                                   sampler random generator.
+
+            samplingMethod [str]: 'uniform', 'lhs' (Latin hypercube),
+                                  'sobol' or 'halton' (scrambled quasi-Monte
+                                  Carlo sequences).
                 
         Raises/Returns
         --------------
@@ -59,6 +75,13 @@ class Cube(Space):
             self.low  = self.intervals[:,0]
             self.high = self.intervals[:,1]
             self.shape = self.low.shape 
+        self.sampler = CubeSampler(self,blockSize=blockSize,seed=seed,
+                                   method=samplingMethod)
+        if isContinuous:
+            self.encoder = None
+        else:
+            self.encoder = MixedRadixEncoder(self.low,self.high)
+            self.cardinality = self.encoder.cardinality
     
     
     def sample(self,numSamples=1):
@@ -69,14 +92,14 @@ class Cube(Space):
             
         Raises/Returns
         --------------
-            [list]: a list of samples from the hypercube. 
+            [ndarray]: (numSamples, dim) array of samples from the hypercube.
             
         Explanations
         ------------
             This function samples a batch of uniform points in a hypercube.
         """ 
         assert(isinstance(numSamples,int))
-        return CubeSampler(self).sample(numSamples)
+        return self.sampler.sample(numSamples)
     
     
     def isStateFeasble(self, s):
@@ -129,4 +152,98 @@ class Cube(Space):
         elif isinstance(a, int):    
             a = np.array([a])  
         return a.shape == self.shape and np.all(a >= self.low) and np.all(a <= self.high)
-        
+
+    def isStateFeasbleBatch(self, states):
+        """
+        Inputs
+        ------
+            states [ndarray]: (N, dim) array of states.
+
+        Raises/Returns
+        --------------
+            mask [ndarray]: (N,) boolean array, True for the feasible states.
+
+            violations [ndarray]: indices of the infeasible states.
+
+        Explanations
+        ------------
+            Checks a batch of states against the hypercube in one pass.
+        """
+        states = np.asarray(states)
+        if states.ndim != 2 or states.shape[1:] != self.shape:
+            mask = np.zeros(len(states),dtype=bool)
+        else:
+            mask = np.all((states >= self.low) & (states <= self.high),axis=1)
+        return mask, np.flatnonzero(~mask)
+
+    def isStateActionFeasbleBatch(self, states, actions):
+        """
+        Inputs
+        ------
+            states [ndarray]: (N, sDim) array of states.
+
+            actions [ndarray]: (N, dim) array of actions.
+
+        Raises/Returns
+        --------------
+            mask [ndarray]: (N,) boolean array, True for the feasible actions.
+
+            violations [ndarray]: indices of the infeasible actions.
+
+        Explanations
+        ------------
+            Checks a batch of actions against the hypercube in one pass. As
+            in isStateActionFeasble, the states are not used.
+        """
+        return self.isStateFeasbleBatch(actions)
+
+    def encode(self, states):
+        """
+        Inputs
+        ------
+            states [ndarray]: (..., dim) array of states.
+            
+        Raises/Returns
+        --------------
+            [ndarray]: (...) int64 array of keys in [0, cardinality).
+            
+        Explanations
+        ------------
+            Maps the points of a discrete hypercube to dense integer keys by
+            mixed-radix encoding of the intervals.
+        """ 
+        assert(not self.isContinuous),"Only discrete hypercubes are encoded"
+        return self.encoder.encode(states)
+
+    def decode(self, keys):
+        """
+        Inputs
+        ------
+            keys [ndarray]: (...) array of keys.
+            
+        Raises/Returns
+        --------------
+            [ndarray]: (..., dim) array of states.
+            
+        Explanations
+        ------------
+            Inverse of encode.
+        """ 
+        assert(not self.isContinuous),"Only discrete hypercubes are encoded"
+        return self.encoder.decode(keys)
+
+    def enumerate(self):
+        """
+        Inputs
+        ------
+            
+        Raises/Returns
+        --------------
+            [ndarray]: (cardinality, dim) array of all points, in key order.
+            
+        Explanations
+        ------------
+            Enumerates the points of a discrete hypercube.
+        """ 
+        assert(not self.isContinuous),"Only discrete hypercubes are enumerated"
+        return self.encoder.enumerate()
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+GitHub Homepage
+----------------
+    https://github.com/ADP-Benchmarks
+
+Contact information
+-------------------
+    ADP.Benchmarks@gmail.com.
+
+License
+-------
+    The MIT License
+"""
+
+import numpy as np
+
+class MixedRadixEncoder():
+    """
+    Description
+    -----------
+        This class maps the integer points of a box [low, high] to dense
+        int64 keys 0, ..., cardinality-1 by mixed-radix arithmetic, the last
+        component varying fastest, and back.
+    """
+
+    def __init__(self, low, high):
+        """
+        Inputs
+        ------
+            low [ndarray]: the lower bounds of the box, included.
+
+            high [ndarray]: the upper bounds of the box, included.
+
+        Raises/Returns
+        --------------
+
+        Explanations
+        ------------
+            The constructor of MixedRadixEncoder object.
+        """
+
+        self.low = np.atleast_1d(np.asarray(low)).astype(np.int64)
+        self.high = np.atleast_1d(np.asarray(high)).astype(np.int64)
+        assert(self.low.shape == self.high.shape)
+        assert(np.all(self.high >= self.low))
+
+        self.dim = self.low.shape[0]
+        self.radices = self.high - self.low + 1
+        assert(np.sum(np.log2(self.radices)) < 63),"The box is too large to\
+        be encoded in int64 keys"
+        self.strides = np.ones(self.dim,dtype=np.int64)
+        self.strides[:-1] = np.cumprod(self.radices[::-1])[::-1][1:]
+        self.cardinality = int(np.prod(self.radices))
+
+    def encode(self, points):
+        """
+        Inputs
+        ------
+            points [ndarray]: (..., dim) array of integer points of the box.
+
+        Raises/Returns
+        --------------
+            [ndarray]: (...) int64 array of keys.
+
+        Explanations
+        ------------
+            Maps points to keys. Points outside the box give meaningless
+            keys, they should be checked for feasibility beforehand.
+        """
+
+        points = np.asarray(points).astype(np.int64,copy=False)
+        return (points - self.low) @ self.strides
+
+    def decode(self, keys):
+        """
+        Inputs
+        ------
+            keys [ndarray]: (...) array of keys.
+
+        Raises/Returns
+        --------------
+            [ndarray]: (..., dim) int64 array of points.
+
+        Explanations
+        ------------
+            Maps keys back to points.
+        """
+
+        keys = np.asarray(keys,dtype=np.int64)
+        return (keys[...,np.newaxis] // self.strides) % self.radices + self.low
+
+    def enumerate(self):
+        """
+        Inputs
+        ------
+
+        Raises/Returns
+        --------------
+            [ndarray]: (cardinality, dim) array of all points, in key order.
+
+        Explanations
+        ------------
+            Enumerates the integer points of the box.
+        """
+
+        return self.decode(np.arange(self.cardinality,dtype=np.int64))
+
+
+def encodeExact(space, states):
+    """
+    Inputs
+    ------
+        space [Space]: an encodable discrete space.
+
+        states [ndarray]: (N, dim) array of states of the space.
+
+    Raises/Returns
+    --------------
+        keys [ndarray]: (N,) int64 array of keys.
+
+        exact [ndarray]: (N,) boolean mask, True for the states that decode
+                         back to themselves.
+
+    Explanations
+    ------------
+        Encoders cast states to integers, so that states between points of
+        the space, e.g. non-integer states of a discrete Cube, alias the
+        key of a nearby point. Only the keys of exact states are valid.
+    """
+    states = np.asarray(states)
+    keys = space.encode(states)
+    exact = (keys >= 0) & (keys < space.cardinality)
+    exact[exact] = np.all(space.decode(keys[exact]) == states[exact],axis=1)
+    return keys, exact
+
+def exactKey(space, state):
+    """
+    Returns the int key of a single state, None if the state is not an
+    exact point of the space, see encodeExact.
+    """
+    keys,exact = encodeExact(space,np.asarray(state).reshape(1,-1))
+    return int(keys[0]) if exact[0] else None
+
+
+class TerminalSet():
+    """
+    Description
+    -----------
+        This class stores a set of absorbing states for constant time
+        membership tests. States of encodable discrete spaces are stored as
+        a bitmask over the key range when it is at most maxBitmask long,
+        and as a sorted array of keys otherwise. States of other spaces are
+        stored as a hashed set of tuples.
+    """
+
+    def __init__(self, space, states, maxBitmask=2**26):
+        """
+        Inputs
+        ------
+            space [Space]: the state space.
+
+            states [list]: the absorbing states.
+
+            maxBitmask [int]: the largest key range stored as a bitmask.
+
+        Raises/Returns
+        --------------
+
+        Explanations
+        ------------
+            The constructor of TerminalSet object.
+        """
+
+        self.space = space
+        self.bitmask = None
+        self.keys = None
+        self.tuples = None
+        states = np.asarray(states).reshape(-1,space.dim)
+        if getattr(space,'cardinality',None) is None:
+            self.tuples = set(tuple(s) for s in states.tolist())
+            return
+        assert(space.isStateFeasbleBatch(states)[1].size == 0),"Absorbing\
+        states should belong to the state space"
+        keys,exact = encodeExact(space,states)
+        assert(np.all(exact)),"Absorbing states should be points of the\
+        state space"
+        if space.cardinality <= maxBitmask:
+            self.bitmask = np.zeros(space.cardinality,dtype=bool)
+            self.bitmask[keys] = True
+        else:
+            self.keys = np.unique(keys)
+
+    def containsBatch(self, states):
+        """
+        Inputs
+        ------
+            states [ndarray]: (N, dim) array of states.
+
+        Raises/Returns
+        --------------
+            [ndarray]: (N,) boolean mask, True for the absorbing states.
+
+        Explanations
+        ------------
+            Vectorized membership test, one bitmask lookup or binary search
+            per state.
+        """
+
+        states = np.asarray(states)
+        if self.tuples is not None:
+            return np.fromiter((tuple(s) in self.tuples
+                                for s in states.tolist()),
+                               dtype=bool,count=states.shape[0])
+        # Infeasible or inexact states are never absorbing and may alias
+        # valid keys
+        feasible = self.space.isStateFeasbleBatch(states)[0]
+        keys,exact = encodeExact(self.space,states[feasible])
+        feasible[feasible] = exact
+        keys = keys[exact]
+        mask = np.zeros(states.shape[0],dtype=bool)
+        if self.bitmask is not None:
+            mask[feasible] = self.bitmask[keys]
+        else:
+            pos = np.minimum(np.searchsorted(self.keys,keys),
+                             self.keys.shape[0] - 1)
+            mask[feasible] = self.keys[pos] == keys
+        return mask
+
+    def contains(self, state):
+        """
+        Inputs
+        ------
+            state [list]: a state vector.
+
+        Raises/Returns
+        --------------
+            [bool]: True if state is absorbing.
+
+        Explanations
+        ------------
+            Single-state membership test.
+        """
+
+        return bool(self.containsBatch(np.asarray(state)[np.newaxis])[0])
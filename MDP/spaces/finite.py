@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+GitHub Homepage
+----------------
+    https://github.com/ADP-Benchmarks
+
+Contact information
+-------------------
+    ADP.Benchmarks@gmail.com.
+
+License
+-------
+    The MIT License
+"""
+
+from MDP.spaces.space import Space
+import numpy as np
+from sampling.sampler import FiniteSetSampler
+
+class FiniteSet(Space):
+    """
+    Description
+    -----------
+        This class provides an implementation of a finite set of points,
+        e.g. an explicit list of actions. Points are indexed in the order
+        they are given. Membership is tested by a binary search over the
+        sorted raw bytes of the points.
+    """
+
+    def __init__(self,points,blockSize=1024,seed=None,samplingMethod='uniform'):
+        """
+        Inputs
+        ------
+            points [ndarray]: (numPoints, dim) array of distinct points.
+
+            blockSize [int]: the number of samples pre-drawn at once by the
+                             set sampler.
+
+            seed [int, SeedSequence or Generator]: optional, the seed of the
+                                                   sampler random generator.
+
+            samplingMethod [str]: 'uniform', 'lhs', 'sobol' or 'halton',
+                                  used to draw the point indices.
+
+        Raises/Returns
+        --------------
+
+        Explanations
+        ------------
+            The constructor of FiniteSet object.
+        """
+
+        assert(isinstance(points,np.ndarray))
+        assert(points.ndim == 2 and points.shape[0] > 0)
+
+        super(FiniteSet,self).__init__(isContinuous=False,
+                                       dim=points.shape[1])
+        # Adding 0 maps -0.0 to 0.0 so that equal points have equal bytes
+        self.points = np.ascontiguousarray(points + points.dtype.type(0))
+        self.shape = (self.dim,)
+        self.cardinality = points.shape[0]
+        self.rowType = np.dtype((np.void,self.points.dtype.itemsize*self.dim))
+
+        rows = self.points.view(self.rowType).ravel()
+        self.order = np.argsort(rows,kind='stable')
+        self.sortedRows = rows[self.order]
+        assert(np.all(self.sortedRows[1:] != self.sortedRows[:-1])),"Points\
+        should be distinct"
+
+        self.sampler = FiniteSetSampler(self,blockSize=blockSize,seed=seed,
+                                        method=samplingMethod)
+
+    def sample(self,numSamples=1):
+        """
+        Inputs
+        ------
+            numSamples [int]: the number of samples.
+
+        Raises/Returns
+        --------------
+            [ndarray]: (numSamples, dim) array of points of the set.
+
+        Explanations
+        ------------
+            This function samples a batch of uniform points of the set.
+        """
+        assert(isinstance(numSamples,int))
+        return self.sampler.sample(numSamples)
+
+    def index(self, states):
+        """
+        Inputs
+        ------
+            states [ndarray]: (..., dim) array of states.
+
+        Raises/Returns
+        --------------
+            [ndarray]: (...) int64 array of point indices, -1 for states
+                       that are not in the set.
+
+        Explanations
+        ------------
+            Maps states to the index of the matching point.
+        """
+
+        states = np.asarray(states)
+        leadShape = states.shape[:-1]
+        rows = np.ascontiguousarray(states.reshape(-1,self.dim).astype(
+                    self.points.dtype) + self.points.dtype.type(0)
+                    ).view(self.rowType).ravel()
+        pos = np.minimum(np.searchsorted(self.sortedRows,rows),
+                         self.cardinality - 1)
+        found = self.sortedRows[pos] == rows
+        # Points that do not survive the cast to the point type never match
+        found &= np.all(self.points[self.order[pos]] ==
+                        states.reshape(-1,self.dim),axis=1)
+        return np.where(found,self.order[pos],-1).reshape(leadShape)
+
+    def isStateFeasble(self, s):
+        """
+        Inputs
+        ------
+            s [list]: state vector.
+
+        Raises/Returns
+        --------------
+            [bool]: True if the state is feasible, False otherwise.
+
+        Explanations
+        ------------
+            Checks if the provided state is one of the points of the set.
+        """
+
+        s = np.array(s) if isinstance(s, list) else s
+        return s.shape == self.shape and bool(self.index(s) >= 0)
+
+    def isStateActionFeasble(self, s, a):
+        """
+        Inputs
+        ------
+            s [list]: the state vecor.
+
+            a [list]: the action vector
+
+        Raises/Returns
+        --------------
+            [bool]: True if the provided action is feasible, False otherwise.
+
+        Explanations
+        ------------
+            Checks if the action is one of the points of the set, the state
+            is not used.
+        """
+        return self.isStateFeasble(a)
+
+    def isStateFeasbleBatch(self, states):
+        """
+        Inputs
+        ------
+            states [ndarray]: (N, dim) array of states.
+
+        Raises/Returns
+        --------------
+            mask [ndarray]: (N,) boolean array, True for the feasible states.
+
+            violations [ndarray]: indices of the infeasible states.
+
+        Explanations
+        ------------
+            Checks a batch of states against the set in one pass.
+        """
+        states = np.asarray(states)
+        if states.ndim != 2 or states.shape[1:] != self.shape:
+            mask = np.zeros(len(states),dtype=bool)
+        else:
+            mask = self.index(states) >= 0
+        return mask, np.flatnonzero(~mask)
+
+    def isStateActionFeasbleBatch(self, states, actions):
+        """
+        Inputs
+        ------
+            states [ndarray]: (N, sDim) array of states.
+
+            actions [ndarray]: (N, dim) array of actions.
+
+        Raises/Returns
+        --------------
+            mask [ndarray]: (N,) boolean array, True for the feasible actions.
+
+            violations [ndarray]: indices of the infeasible actions.
+
+        Explanations
+        ------------
+            Checks a batch of actions against the set in one pass.
+        """
+        return self.isStateFeasbleBatch(actions)
+
+    def encode(self, states):
+        """
+        Inputs
+        ------
+            states [ndarray]: (..., dim) array of points of the set.
+
+        Raises/Returns
+        --------------
+            [ndarray]: (...) int64 array of indices in [0, cardinality).
+
+        Explanations
+        ------------
+            Same as index, for states known to be in the set.
+        """
+        return self.index(states)
+
+    def decode(self, keys):
+        """
+        Inputs
+        ------
+            keys [ndarray]: (...) array of indices.
+
+        Raises/Returns
+        --------------
+            [ndarray]: (..., dim) array of points.
+
+        Explanations
+        ------------
+            Inverse of encode.
+        """
+        return self.points[keys]
+
+    def enumerate(self):
+        """
+        Inputs
+        ------
+
+        Raises/Returns
+        --------------
+            [ndarray]: (cardinality, dim) array of all points.
+
+        Explanations
+        ------------
+            Enumerates the points of the set, in index order.
+        """
+        return self.points
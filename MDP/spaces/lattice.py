@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+GitHub Homepage
+----------------
+    https://github.com/ADP-Benchmarks
+
+Contact information
+-------------------
+    ADP.Benchmarks@gmail.com.
+
+License
+-------
+    The MIT License
+"""
+
+import numpy as np
+
+class LatticeIndex():
+    """
+    Description
+    -----------
+        This class indexes the lattice points of a discrete ball, that is
+        the points center + z with z an integer vector and |z| <= radius.
+        Points are indexed 0, ..., cardinality-1 in lexicographic order of
+        their offsets z. Indices are computed by counting rather than by
+        enumerating the bounding box: T[k, s], the number of integer vectors
+        of length k with squared norm at most s, gives the number of lattice
+        points preceding a given prefix. Building the tables costs
+        O(dim * radius**3), independently of the size of the bounding box.
+    """
+
+    def __init__(self, center, radius):
+        """
+        Inputs
+        ------
+            center [ndarray]: the vector defining center of the ball.
+
+            radius [float]: the radius of the ball.
+
+        Raises/Returns
+        --------------
+
+        Explanations
+        ------------
+            The constructor of LatticeIndex object.
+        """
+
+        self.center = center
+        self.radius = radius
+        self.dim = center.shape[0]
+        self.bound = int(np.floor(radius))
+        # Squared norms of integer vectors are integers
+        self.limit = int(np.floor(radius ** 2))
+        values = np.arange(-self.bound,self.bound + 1)
+
+        # Exact counts with Python integers, to detect int64 overflows
+        counts = [[1]*(self.limit + 1)]
+        for k in range(1,self.dim + 1):
+            prev = counts[-1]
+            counts.append([sum(prev[s - v*v] for v in values.tolist()
+                               if v*v <= s)
+                           for s in range(self.limit + 1)])
+        assert(counts[-1][-1] < 2 ** 63),"The ball has too many lattice\
+        points to be encoded in int64 keys"
+        self.cardinality = counts[-1][-1]
+        self.counts = np.array(counts,dtype=np.int64)
+
+        # before[k, s, j]: the number of vectors of length k + 1 with squared
+        # norm at most s whose first component is below values[j]
+        sq = values*values
+        rem = np.arange(self.limit + 1)[:,np.newaxis] - sq
+        tails = np.where(rem >= 0,self.counts[:-1][:,np.clip(rem,0,None)],0)
+        self.before = np.zeros((self.dim,self.limit + 1,values.shape[0] + 1),
+                               dtype=np.int64)
+        self.before[:,:,1:] = np.cumsum(tails,axis=-1)
+
+    def index(self, points):
+        """
+        Inputs
+        ------
+            points [ndarray]: (..., dim) array of points.
+
+        Raises/Returns
+        --------------
+            [ndarray]: (...) int64 array of indices, -1 for the points that
+                       are not lattice points of the ball.
+
+        Explanations
+        ------------
+            Ranks the points among the lattice points, one table lookup per
+            component.
+        """
+
+        offsets = np.asarray(points) - self.center
+        lattice = np.rint(offsets)
+        valid = np.all((lattice == offsets) & (np.abs(lattice) <= self.bound),
+                       axis=-1)
+        z = np.where(valid[...,np.newaxis],lattice,0).astype(np.int64)
+        sqNorm = np.sum(z*z,axis=-1)
+        valid &= sqNorm <= self.limit
+
+        rank = np.zeros(z.shape[:-1],dtype=np.int64)
+        rem = np.full(z.shape[:-1],self.limit,dtype=np.int64)
+        for i in range(self.dim):
+            k = self.dim - 1 - i
+            rank += self.before[k,rem,z[...,i] + self.bound]
+            rem = np.maximum(rem - z[...,i]*z[...,i],0)
+        return np.where(valid,rank,-1)
+
+    def contains(self, points):
+        """
+        Inputs
+        ------
+            points [ndarray]: (..., dim) array of points.
+
+        Raises/Returns
+        --------------
+            [ndarray]: (...) boolean array, True for the lattice points.
+
+        Explanations
+        ------------
+            Vectorized membership test.
+        """
+
+        return self.index(points) >= 0
+
+    def encode(self, points):
+        """
+        Inputs
+        ------
+            points [ndarray]: (..., dim) array of lattice points.
+
+        Raises/Returns
+        --------------
+            [ndarray]: (...) int64 array of indices.
+
+        Explanations
+        ------------
+            Same as index, for points known to be lattice points.
+        """
+
+        return self.index(points)
+
+    def decode(self, keys):
+        """
+        Inputs
+        ------
+            keys [ndarray]: (...) array of indices.
+
+        Raises/Returns
+        --------------
+            [ndarray]: (..., dim) array of lattice points.
+
+        Explanations
+        ------------
+            Maps indices back to points, choosing every component as the
+            last value whose preceding count does not exceed the key.
+        """
+
+        keys = np.asarray(keys,dtype=np.int64).copy()
+        assert(np.all((keys >= 0) & (keys < self.cardinality)))
+        rem = np.full(keys.shape,self.limit,dtype=np.int64)
+        z = np.empty(keys.shape + (self.dim,),dtype=np.int64)
+        for i in range(self.dim):
+            k = self.dim - 1 - i
+            table = self.before[k,rem]
+            j = np.sum(table[...,1:] <= keys[...,np.newaxis],axis=-1)
+            keys -= np.take_along_axis(table,j[...,np.newaxis],axis=-1)[...,0]
+            z[...,i] = j - self.bound
+            rem -= z[...,i]*z[...,i]
+        return z + self.center
+
+    def enumerate(self):
+        """
+        Inputs
+        ------
+
+        Raises/Returns
+        --------------
+            [ndarray]: (cardinality, dim) array of all lattice points.
+
+        Explanations
+        ------------
+            Enumerates the lattice points, in index order.
+        """
+
+        return self.decode(np.arange(self.cardinality,dtype=np.int64))
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+GitHub Homepage
+----------------
+    https://github.com/ADP-Benchmarks
+
+Contact information
+-------------------
+    ADP.Benchmarks@gmail.com.
+
+License
+-------
+    The MIT License
+"""
+
+from MDP.spaces.space import Space
+import numpy as np
+from MDP.spaces.encoding import MixedRadixEncoder
+
+class ProductSpace(Space):
+    """
+    Description
+    -----------
+        This class provides an implementation of the Cartesian product of
+        spaces, e.g. inventory level x price regime. Points are flat vectors
+        made of the components of each space, in order. When every space is
+        discrete and encodable, the product key is the mixed-radix
+        combination of the component keys.
+    """
+
+    def __init__(self,spaces):
+        """
+        Inputs
+        ------
+            spaces [list]: the component Space objects.
+
+        Raises/Returns
+        --------------
+
+        Explanations
+        ------------
+            The constructor of ProductSpace object.
+        """
+
+        assert(len(spaces) > 0)
+        assert(all(isinstance(space,Space) for space in spaces))
+
+        super(ProductSpace,self).__init__(
+                isContinuous=any(space.isContinuous for space in spaces),
+                dim=int(sum(space.dim for space in spaces)))
+        self.spaces = list(spaces)
+        self.shape = (self.dim,)
+        self.bounds = np.cumsum([0] + [space.dim for space in spaces])
+
+        # Built on first use, see the encoder property
+        self._encoder = None
+
+    @property
+    def encoder(self):
+        """
+        Returns the mixed-radix encoder of the component keys, None unless
+        every component is discrete and encodable. The encoder is built on
+        first use, so that the lazy indexes of the components, e.g. the
+        lattice of a discrete Ball, are not built with the product.
+        """
+        if self._encoder is None and not self.isContinuous:
+            cardinalities = [getattr(space,'cardinality',None)
+                             for space in self.spaces]
+            if all(cardinality is not None for cardinality in cardinalities):
+                self._encoder = MixedRadixEncoder(
+                        np.zeros(len(self.spaces),dtype=np.int64),
+                        np.array(cardinalities) - 1)
+        return self._encoder
+
+    @property
+    def cardinality(self):
+        """
+        Returns the number of points of an encodable product, else None.
+        """
+        encoder = self.encoder
+        return None if encoder is None else encoder.cardinality
+
+    def split(self, states):
+        """
+        Inputs
+        ------
+            states [ndarray]: (..., dim) array of points.
+
+        Raises/Returns
+        --------------
+            [list]: the (..., space.dim) component views, one per space.
+
+        Explanations
+        ------------
+            Splits flat points into their components, without copying.
+        """
+        states = np.asarray(states)
+        return [states[...,lo:hi] for lo,hi in zip(self.bounds[:-1],
+                                                    self.bounds[1:])]
+
+    def seed(self,seed=None):
+        """
+        Inputs
+        ------
+            seed [int or SeedSequence]: the new seed.
+
+        Raises/Returns
+        --------------
+
+        Explanations
+        ------------
+            Re-seeds every component with an independent child stream.
+        """
+        if not isinstance(seed,np.random.SeedSequence):
+            seed = np.random.SeedSequence(seed)
+        for space,child in zip(self.spaces,seed.spawn(len(self.spaces))):
+            space.seed(child)
+
+    def sample(self,numSamples=1):
+        """
+        Inputs
+        ------
+            numSamples [int]: the number of samples.
+
+        Raises/Returns
+        --------------
+            [ndarray]: (numSamples, dim) array of samples.
+
+        Explanations
+        ------------
+            Samples every component in one batched call and concatenates
+            the columns.
+        """
+        assert(isinstance(numSamples,int))
+        return np.concatenate([np.asarray(space.sample(numSamples))
+                               for space in self.spaces],axis=1)
+
+    def isStateFeasble(self, s):
+        """
+        Inputs
+        ------
+            s [list]: state vector.
+
+        Raises/Returns
+        --------------
+            [bool]: True if the state is feasible, False otherwise.
+
+        Explanations
+        ------------
+            Checks every component against its space.
+        """
+        s = np.array(s) if isinstance(s, list) else s
+        return s.shape == self.shape and all(
+                space.isStateFeasble(part)
+                for space,part in zip(self.spaces,self.split(s)))
+
+    def isStateActionFeasble(self, s, a):
+        """
+        Inputs
+        ------
+            s [list]: the state vecor.
+
+            a [list]: the action vector
+
+        Raises/Returns
+        --------------
+            [bool]: True if the provided action is feasible, False otherwise.
+
+        Explanations
+        ------------
+            Checks every action component against its space, the state is
+            not used.
+        """
+        return self.isStateFeasble(a)
+
+    def isStateFeasbleBatch(self, states):
+        """
+        Inputs
+        ------
+            states [ndarray]: (N, dim) array of states.
+
+        Raises/Returns
+        --------------
+            mask [ndarray]: (N,) boolean array, True for the feasible states.
+
+            violations [ndarray]: indices of the infeasible states.
+
+        Explanations
+        ------------
+            Combines the batch checks of the components.
+        """
+        states = np.asarray(states)
+        if states.ndim != 2 or states.shape[1:] != self.shape:
+            mask = np.zeros(len(states),dtype=bool)
+        else:
+            mask = np.ones(states.shape[0],dtype=bool)
+            for space,part in zip(self.spaces,self.split(states)):
+                mask &= space.isStateFeasbleBatch(part)[0]
+        return mask, np.flatnonzero(~mask)
+
+    def isStateActionFeasbleBatch(self, states, actions):
+        """
+        Inputs
+        ------
+            states [ndarray]: (N, sDim) array of states.
+
+            actions [ndarray]: (N, dim) array of actions.
+
+        Raises/Returns
+        --------------
+            mask [ndarray]: (N,) boolean array, True for the feasible actions.
+
+            violations [ndarray]: indices of the infeasible actions.
+
+        Explanations
+        ------------
+            Combines the batch checks of the components.
+        """
+        return self.isStateFeasbleBatch(actions)
+
+    def encode(self, states):
+        """
+        Inputs
+        ------
+            states [ndarray]: (..., dim) array of points.
+
+        Raises/Returns
+        --------------
+            [ndarray]: (...) int64 array of keys in [0, cardinality).
+
+        Explanations
+        ------------
+            Combines the component keys by mixed-radix encoding.
+        """
+        assert(self.encoder is not None),"Every component should be encodable"
+        keys = [space.encode(part)
+                for space,part in zip(self.spaces,self.split(states))]
+        return self.encoder.encode(np.stack(keys,axis=-1))
+
+    def decode(self, keys):
+        """
+        Inputs
+        ------
+            keys [ndarray]: (...) array of keys.
+
+        Raises/Returns
+        --------------
+            [ndarray]: (..., dim) array of points.
+
+        Explanations
+        ------------
+            Inverse of encode.
+        """
+        assert(self.encoder is not None),"Every component should be encodable"
+        parts = self.encoder.decode(keys)
+        return np.concatenate([space.decode(parts[...,i])
+                               for i,space in enumerate(self.spaces)],
+                              axis=-1)
+
+    def enumerate(self):
+        """
+        Inputs
+        ------
+
+        Raises/Returns
+        --------------
+            [ndarray]: (cardinality, dim) array of all points, in key order.
+
+        Explanations
+        ------------
+            Enumerates the points of a discrete product space.
+        """
+        return self.decode(np.arange(self.cardinality,dtype=np.int64))
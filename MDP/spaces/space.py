@@ -15,6 +15,8 @@ License
     The MIT License  
 """
 
+import numpy as np
+
 class Space():
     """
     Description
@@ -63,6 +65,22 @@ class Space():
         raise NotImplementedError
     
         
+    def seed(self,seed=None):
+        """
+        Inputs
+        ------
+            seed [int, SeedSequence or Generator]: the new seed.
+            
+        Raises/Returns
+        --------------
+            
+        Explanations
+        ------------
+            Re-seeds the random generator used by sample.
+        """ 
+        self.sampler.seed(seed)
+    
+        
     def isStateFeasble(self,curState):
         """
         Inputs
@@ -97,6 +115,84 @@ class Space():
         """ 
         raise NotImplementedError
 
+    def isStateFeasbleBatch(self, states):
+        """
+        Inputs
+        ------
+            states [ndarray]: (N, dim) array of states.
+
+        Raises/Returns
+        --------------
+            mask [ndarray]: (N,) boolean array, True for the feasible states.
+
+            violations [ndarray]: indices of the infeasible states.
+
+        Explanations
+        ------------
+            Checks a batch of states against the space. The default
+            implementation loops over isStateFeasble.
+        """
+        mask = np.fromiter((self.isStateFeasble(s) for s in states),
+                           dtype=bool, count=len(states))
+        return mask, np.flatnonzero(~mask)
+
+    def isStateActionFeasbleBatch(self, states, actions):
+        """
+        Inputs
+        ------
+            states [ndarray]: (N, sDim) array of states.
+
+            actions [ndarray]: (N, dim) array of actions.
+
+        Raises/Returns
+        --------------
+            mask [ndarray]: (N,) boolean array, True for the feasible actions.
+
+            violations [ndarray]: indices of the infeasible actions.
+
+        Explanations
+        ------------
+            Checks a batch of actions in their paired states. The default
+            implementation loops over isStateActionFeasble.
+        """
+        mask = np.fromiter((self.isStateActionFeasble(s,a)
+                            for s,a in zip(states,actions)),
+                           dtype=bool, count=len(actions))
+        return mask, np.flatnonzero(~mask)
+
+    def encode(self, states):
+        """
+        Inputs
+        ------
+            states [ndarray]: (..., dim) array of states.
+            
+        Raises/Returns
+        --------------
+            [ndarray]: (...) int64 array of keys.
+            
+        Explanations
+        ------------
+            Maps the points of a discrete space to integer keys. Spaces that
+            support it also define cardinality, the size of the key range.
+        """ 
+        raise NotImplementedError
+
+    def decode(self, keys):
+        """
+        Inputs
+        ------
+            keys [ndarray]: (...) array of keys.
+            
+        Raises/Returns
+        --------------
+            [ndarray]: (..., dim) array of states.
+            
+        Explanations
+        ------------
+            Inverse of encode.
+        """ 
+        raise NotImplementedError
+
     def getObjectiveWithExoSamples(self,curState,curAction):
         """
         Inputs
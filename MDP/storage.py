@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+GitHub Homepage
+----------------
+    https://github.com/ADP-Benchmarks
+
+Contact information
+-------------------
+    ADP.Benchmarks@gmail.com.
+
+License
+-------
+    The MIT License
+"""
+
+import json
+import os
+import numpy as np
+from MDP.tabular import TabularModel
+from MDP.spaces.finite import FiniteSet
+
+# A directory holds one .npy file per array and a manifest.json describing
+# them. Readers accept any version up to FORMAT_VERSION.
+FORMAT_VERSION = 1
+MANIFEST = 'manifest.json'
+
+def saveArrays(directory, kind, arrays, meta=None):
+    """
+    Inputs
+    ------
+        directory [str]: the output directory, created if needed.
+
+        kind [str]: the kind of the stored object, checked on load.
+
+        arrays [dict]: name -> ndarray.
+
+        meta [dict]: optional, JSON serializable metadata.
+
+    Raises/Returns
+    --------------
+
+    Explanations
+    ------------
+        Writes every array to its own .npy file, so that each can be
+        memory-mapped on load, then writes the manifest last: a directory
+        without manifest is an interrupted save.
+    """
+
+    os.makedirs(directory,exist_ok=True)
+    entries = {}
+    for name,array in arrays.items():
+        array = np.asarray(array)
+        np.save(os.path.join(directory,name + '.npy'),array)
+        entries[name] = {'shape': list(array.shape),'dtype': array.dtype.str}
+    manifest = {'format': 'adp-benchmarks','kind': kind,
+                'version': FORMAT_VERSION,'arrays': entries,
+                'meta': meta or {}}
+    with open(os.path.join(directory,MANIFEST),'w') as f:
+        json.dump(manifest,f,indent=2)
+
+def loadArrays(directory, kind, mmap=True):
+    """
+    Inputs
+    ------
+        directory [str]: a directory written by saveArrays.
+
+        kind [str]: the expected kind.
+
+        mmap [bool]: if True, the arrays are read-only memory maps, else
+                     they are read in memory.
+
+    Raises/Returns
+    --------------
+        arrays [dict]: name -> ndarray.
+
+        meta [dict]: the stored metadata.
+
+    Explanations
+    ------------
+        Checks the manifest and loads the arrays it lists.
+    """
+
+    with open(os.path.join(directory,MANIFEST)) as f:
+        manifest = json.load(f)
+    assert(manifest.get('format') == 'adp-benchmarks'),"Not a stored object"
+    assert(manifest['kind'] == kind),"Expected a stored " + kind
+    assert(manifest['version'] <= FORMAT_VERSION),"Stored with a newer\
+    format version"
+
+    arrays = {}
+    for name,entry in manifest['arrays'].items():
+        array = np.load(os.path.join(directory,name + '.npy'),
+                        mmap_mode='r' if mmap else None)
+        assert(list(array.shape) == entry['shape'])
+        arrays[name] = array
+    return arrays, manifest['meta']
+
+def saveModel(model, directory, saveEncodings=True):
+    """
+    Inputs
+    ------
+        model [TabularModel]: the compiled model.
+
+        directory [str]: the output directory.
+
+        saveEncodings [bool]: if True, the enumerated states and actions are
+                              stored as well, so that the model can be
+                              loaded without its spaces.
+
+    Raises/Returns
+    --------------
+
+    Explanations
+    ------------
+        The per-action transition matrices are stacked into a single
+        (numActions*numStates, numStates) CSR matrix, stored as its data,
+        indices and indptr arrays.
+    """
+
+    import scipy.sparse as sp
+    P = sp.vstack(model.P,format='csr')
+    arrays = {'data': P.data,'indices': P.indices,'indptr': P.indptr,
+              'C': model.C,'actionMask': model.actionMask}
+    if saveEncodings:
+        arrays['states'] = model.sSpace.enumerate()
+        arrays['actions'] = model.aSpace.enumerate()
+    saveArrays(directory,'TabularModel',arrays,
+               {'numStates': model.numStates,
+                'numActions': model.numActions,
+                'isMinCost': bool(model.isMinCost)})
+
+def loadModel(directory, sSpace=None, aSpace=None, mmap=True):
+    """
+    Inputs
+    ------
+        directory [str]: a directory written by saveModel.
+
+        sSpace [Space]: optional, the encoded state space. Defaults to a
+                        FiniteSet of the stored states.
+
+        aSpace [Space]: optional, the encoded action space. Defaults to a
+                        FiniteSet of the stored actions.
+
+        mmap [bool]: if True, the arrays are memory-mapped.
+
+    Raises/Returns
+    --------------
+        [TabularModel]: the model.
+
+    Explanations
+    ------------
+        The transition matrices of the actions are CSR matrices over slices
+        of the stored arrays, so memory-mapped data is not copied. Stored
+        FiniteSet encodings index the points in stored order, which are the
+        keys of the original spaces.
+    """
+
+    import scipy.sparse as sp
+    arrays,meta = loadArrays(directory,'TabularModel',mmap)
+    nS,nA = meta['numStates'],meta['numActions']
+    data,indices,indptr = arrays['data'],arrays['indices'],arrays['indptr']
+    P = []
+    for a in range(nA):
+        lo,hi = int(indptr[a*nS]),int(indptr[(a + 1)*nS])
+        P.append(sp.csr_matrix((data[lo:hi],indices[lo:hi],
+                                indptr[a*nS:(a + 1)*nS + 1] - lo),
+                               shape=(nS,nS),copy=False))
+    if sSpace is None:
+        assert('states' in arrays),"The state encoding was not saved"
+        sSpace = FiniteSet(np.asarray(arrays['states']))
+    if aSpace is None:
+        assert('actions' in arrays),"The action encoding was not saved"
+        aSpace = FiniteSet(np.asarray(arrays['actions']))
+    assert(sSpace.cardinality == nS and aSpace.cardinality == nA)
+    return TabularModel(P,arrays['C'],arrays['actionMask'],sSpace,aSpace,
+                        meta['isMinCost'])
+
+def saveSolution(directory, V, policy, stats=None):
+    """
+    Inputs
+    ------
+        directory [str]: the output directory.
+
+        V [ndarray]: (numStates,) value function, or (H+1, numStates) value
+                     functions per period.
+
+        policy [ndarray]: (numStates,) action keys, or (H, numStates)
+                          per-period action keys.
+
+        stats [dict]: optional, the solver statistics. Their scalar entries
+                      are stored in the metadata.
+
+    Raises/Returns
+    --------------
+
+    Explanations
+    ------------
+        Stores the output of the exact solvers.
+    """
+
+    meta = {key: value for key,value in (stats or {}).items()
+            if isinstance(value,(bool,int,float,str))}
+    saveArrays(directory,'Solution',{'V': V,'policy': policy},
+               {'stats': meta})
+
+def loadSolution(directory, mmap=True):
+    """
+    Inputs
+    ------
+        directory [str]: a directory written by saveSolution.
+
+        mmap [bool]: if True, the arrays are memory-mapped.
+
+    Raises/Returns
+    --------------
+        V [ndarray]: the value function(s).
+
+        policy [ndarray]: the policy.
+
+        stats [dict]: the stored scalar statistics.
+
+    Explanations
+    ------------
+        Loads a stored solution.
+    """
+
+    arrays,meta = loadArrays(directory,'Solution',mmap)
+    return arrays['V'], arrays['policy'], meta['stats']
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+GitHub Homepage
+----------------
+    https://github.com/ADP-Benchmarks
+
+Contact information
+-------------------
+    ADP.Benchmarks@gmail.com.
+
+License
+-------
+    The MIT License
+"""
+
+import numpy as np
+from MDP.spaces.encoding import encodeExact
+
+class TabularModel():
+    """
+    Description
+    -----------
+        This class holds an indexed model of a discrete MDP: one sparse
+        (numStates, numStates) transition matrix per action and the
+        expected cost/reward of every state-action pair. States and actions
+        are indexed by the keys of the state and action space encodings.
+        Compiling models requires scipy, imported on first use.
+    """
+
+    def __init__(self, P, C, actionMask, sSpace, aSpace, isMinCost=True):
+        """
+        Inputs
+        ------
+            P [list]: numActions sparse CSR matrices, P[a][i,j] is the
+                      probability of moving from state i to state j under
+                      action a.
+
+            C [ndarray]: (numActions, numStates) expected cost/reward.
+
+            actionMask [ndarray]: (numActions, numStates) boolean array,
+                                  True for the feasible state-action pairs.
+                                  Rows of P and entries of C of infeasible
+                                  pairs are zero.
+
+            sSpace [Space]: the encoded MDP state space.
+
+            aSpace [Space]: the encoded MDP action space.
+
+            isMinCost [bool]: if True, C is a cost, else it is a reward.
+
+        Raises/Returns
+        --------------
+
+        Explanations
+        ------------
+            The constructor of TabularModel object.
+        """
+
+        assert(len(P) == C.shape[0] == actionMask.shape[0])
+        assert(C.shape == actionMask.shape)
+
+        self.P = P
+        self.C = C
+        self.actionMask = actionMask
+        self.sSpace = sSpace
+        self.aSpace = aSpace
+        self.isMinCost = isMinCost
+        self.numActions, self.numStates = C.shape
+
+
+def compileMDP(mdp, numNoiseSamples=None, chunkSize=4096):
+    """
+    Inputs
+    ------
+        mdp [MDP]: an MDP with discrete, encodable state and action spaces.
+
+        numNoiseSamples [int]: if None, the noise space is enumerated and
+                               must be discrete. Else, this many noise
+                               samples are drawn once and shared by all
+                               state-action pairs.
+
+        chunkSize [int]: the number of states pushed through the transition
+                         kernel at once, which bounds the memory used.
+
+    Raises/Returns
+    --------------
+        [TabularModel]: the compiled model.
+
+    Explanations
+    ------------
+        Enumerates the states and actions and pushes the noise outcomes,
+        each with probability 1/K, through getNextStatesBatch and
+        getObjectivesBatch. Next states are encoded and accumulated into
+        one sparse matrix per action, duplicates summed.
+    """
+
+    import scipy.sparse as sp
+    sSpace,aSpace,nSpace = mdp.sSpace,mdp.aSpace,mdp.nSpace
+    assert(not sSpace.isContinuous and not aSpace.isContinuous),"Only\
+    discrete state and action spaces can be compiled"
+
+    if numNoiseSamples is None:
+        assert(not nSpace.isContinuous),"A continuous noise space should be\
+        sampled, set numNoiseSamples"
+        noise = nSpace.enumerate()
+    else:
+        noise = np.asarray(nSpace.sample(numNoiseSamples))
+    numNoise = noise.shape[0]
+    weight = 1.0/numNoise
+
+    states = sSpace.enumerate()
+    actions = aSpace.enumerate()
+    numStates,numActions = states.shape[0],actions.shape[0]
+
+    P = []
+    C = np.zeros((numActions,numStates))
+    actionMask = np.zeros((numActions,numStates),dtype=bool)
+    for a in range(numActions):
+        action = np.broadcast_to(actions[a],(numStates,actions.shape[1]))
+        actionMask[a] = aSpace.isStateActionFeasbleBatch(states,action)[0]
+        rows,cols = [],[]
+        for start in range(0,numStates,chunkSize):
+            idx = start + np.flatnonzero(actionMask[a,start:start+chunkSize])
+            if idx.size == 0:
+                continue
+            nextStates = mdp.transition.getNextStatesBatch(states[idx],
+                                                           action[idx],
+                                                           noise[np.newaxis])
+            flat = nextStates.reshape(-1,states.shape[1])
+            violations = sSpace.isStateFeasbleBatch(flat)[1]
+            assert(violations.size == 0),"Next states should belong to the\
+            state space"
+            rows.append(np.repeat(idx,numNoise))
+            keys,exact = encodeExact(sSpace,flat)
+            assert(np.all(exact)),"Next states should be points of the\
+            state space, round them in the transition"
+            cols.append(keys)
+            C[a,idx] = mdp.objective.getObjectivesBatch(states[idx],
+                                                        action[idx],
+                                                        noise[np.newaxis]
+                                                        ).mean(axis=1)
+        rows = np.concatenate(rows) if rows else np.zeros(0,dtype=np.int64)
+        cols = np.concatenate(cols) if cols else np.zeros(0,dtype=np.int64)
+        P.append(sp.csr_matrix((np.full(rows.shape[0],weight),(rows,cols)),
+                               shape=(numStates,numStates)))
+
+    return TabularModel(P,C,actionMask,sSpace,aSpace,
+                        isMinCost=mdp.objective.isMinCost)
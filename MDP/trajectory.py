@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+GitHub Homepage
+----------------
+    https://github.com/ADP-Benchmarks
+
+Contact information
+-------------------
+    ADP.Benchmarks@gmail.com.
+
+License
+-------
+    The MIT License
+"""
+
+import json
+import os
+import numpy as np
+
+class TrajectoryBuffer():
+    """
+    Description
+    -----------
+        This class records MDP transitions into preallocated
+        structure-of-arrays buffers: one array per field ('state', 'action',
+        'reward', 'noise', 't' and 'done'). Rows are written into fixed-size
+        chunks of chunkSize rows, a full chunk being kept aside and a new one
+        allocated, so recorded rows are never copied while recording. The
+        chunks are concatenated once by arrays.
+        When a directory is given and the buffers exceed maxBytes, the
+        recorded rows are spilled to one raw binary file per field, that
+        load memory-maps back without copying.
+    """
+
+    def __init__(self, sDim, aDim, nDim, chunkSize=65536, maxBytes=None,
+                 directory=None, dtypes=None):
+        """
+        Inputs
+        ------
+            sDim [int]: the state dimension.
+
+            aDim [int]: the action dimension.
+
+            nDim [int]: the exogenous noise dimension.
+
+            chunkSize [int]: the number of rows of each chunk.
+
+            maxBytes [int]: optional, the memory budget of the in-memory
+                            buffers. Requires directory.
+
+            directory [str]: optional, where spilled rows are written.
+
+            dtypes [dict]: optional, overrides of the field types, e.g.
+                           {'state': 'float32'} for compact records. The
+                           defaults are float64 for states, actions, noise
+                           and rewards, int64 for t and bool for done.
+
+        Raises/Returns
+        --------------
+
+        Explanations
+        ------------
+            The constructor of TrajectoryBuffer object.
+        """
+
+        assert(isinstance(chunkSize,int) and chunkSize > 0)
+        assert(maxBytes is None or directory is not None),"A directory is\
+        needed to spill the buffers"
+
+        self.fields = {'state': ((sDim,),np.dtype('float64')),
+                       'action': ((aDim,),np.dtype('float64')),
+                       'reward': ((),np.dtype('float64')),
+                       'noise': ((nDim,),np.dtype('float64')),
+                       't': ((),np.dtype('int64')),
+                       'done': ((),np.dtype('bool'))}
+        for name,dtype in (dtypes or {}).items():
+            self.fields[name] = (self.fields[name][0],np.dtype(dtype))
+
+        self.chunkSize = chunkSize
+        self.maxBytes = maxBytes
+        self.directory = directory
+        # Full chunks, then the chunk being filled, pos rows of which are
+        # recorded
+        self.chunks = []
+        self.buffers = self.newChunk()
+        self.pos = 0
+        self.size = 0
+        self.numSpilled = 0
+        if directory is not None:
+            os.makedirs(directory,exist_ok=True)
+            for name in self.fields:
+                open(os.path.join(directory,name + '.bin'),'wb').close()
+
+    def __len__(self):
+        return self.numSpilled + self.size
+
+    def newChunk(self):
+        """
+        Returns a dict of empty chunkSize-row arrays, one per field.
+        """
+        return {name: np.empty((self.chunkSize,) + shape,dtype=dtype)
+                for name,(shape,dtype) in self.fields.items()}
+
+    def rowBytes(self):
+        """
+        Returns the number of bytes of one recorded transition.
+        """
+        return sum(int(np.prod(shape,dtype=np.int64))*dtype.itemsize
+                   for shape,dtype in self.fields.values())
+
+    def numBytes(self):
+        """
+        Returns the number of bytes allocated by the in-memory chunks.
+        """
+        return (len(self.chunks) + 1)*self.chunkSize*self.rowBytes()
+
+    def extend(self, states, actions, rewards, noise, t, dones):
+        """
+        Inputs
+        ------
+            states [ndarray]: (N, sDim) states.
+
+            actions [ndarray]: (N, aDim) actions.
+
+            rewards [ndarray]: (N,) rewards/costs.
+
+            noise [ndarray]: (N, nDim) exogenous noise outcomes.
+
+            t [ndarray]: (N,) periods.
+
+            dones [ndarray]: (N,) done flags.
+
+        Raises/Returns
+        --------------
+
+        Explanations
+        ------------
+            Records a batch of N transitions, e.g. one VectorMDP step.
+        """
+
+        values = {'state': states, 'action': actions, 'reward': rewards,
+                  'noise': noise, 't': t, 'done': dones}
+        num = np.shape(rewards)[0]
+        values = {name: np.broadcast_to(value,(num,) + self.fields[name][0])
+                  for name,value in values.items()}
+        done = 0
+        while done < num:
+            if self.pos == self.chunkSize:
+                self.grow()
+            step = min(num - done,self.chunkSize - self.pos)
+            for name,value in values.items():
+                self.buffers[name][self.pos:self.pos + step] = \
+                    value[done:done + step]
+            self.pos += step
+            self.size += step
+            done += step
+        if (self.maxBytes is not None
+                and self.numBytes() > self.maxBytes):
+            self.spill()
+
+    def append(self, state, action, reward, noise, t, done):
+        """
+        Inputs
+        ------
+            state [list]: the state vector.
+
+            action [list]: the action vector.
+
+            reward [float]: the reward/cost.
+
+            noise [list]: the exogenous noise vector.
+
+            t [int]: the period.
+
+            done [bool]: the done flag.
+
+        Raises/Returns
+        --------------
+
+        Explanations
+        ------------
+            Records a single transition, e.g. one MDP step.
+        """
+
+        if self.pos == self.chunkSize:
+            self.grow()
+        row = self.pos
+        self.buffers['state'][row] = state
+        self.buffers['action'][row] = action
+        self.buffers['reward'][row] = reward
+        self.buffers['noise'][row] = noise
+        self.buffers['t'][row] = t
+        self.buffers['done'][row] = done
+        self.pos += 1
+        self.size += 1
+        if (self.maxBytes is not None and self.pos == self.chunkSize
+                and self.numBytes() > self.maxBytes):
+            self.spill()
+
+    def grow(self):
+        """
+        Keeps the full current chunk aside and starts a new one.
+        """
+        self.chunks.append(self.buffers)
+        self.buffers = self.newChunk()
+        self.pos = 0
+
+    def rows(self, name):
+        """
+        Returns the list of arrays holding the in-memory rows of a field, in
+        recording order.
+        """
+        return ([chunk[name] for chunk in self.chunks]
+                + [self.buffers[name][:self.pos]])
+
+    def spill(self):
+        """
+        Appends the in-memory rows to the files of the directory and empties
+        the buffers, keeping a single chunk.
+        """
+        for name in self.fields:
+            with open(os.path.join(self.directory,name + '.bin'),'ab') as f:
+                for rows in self.rows(name):
+                    f.write(rows.tobytes())
+        self.numSpilled += self.size
+        self.chunks = []
+        self.pos = 0
+        self.size = 0
+
+    def close(self):
+        """
+        Inputs
+        ------
+
+        Raises/Returns
+        --------------
+
+        Explanations
+        ------------
+            Spills the remaining rows and writes the metadata read by load.
+            Only needed when a directory is used.
+        """
+
+        assert(self.directory is not None)
+        self.spill()
+        meta = {'length': self.numSpilled,
+                'fields': {name: {'shape': list(shape), 'dtype': dtype.str}
+                           for name,(shape,dtype) in self.fields.items()}}
+        with open(os.path.join(self.directory,'meta.json'),'w') as f:
+            json.dump(meta,f)
+
+    def arrays(self):
+        """
+        Inputs
+        ------
+
+        Raises/Returns
+        --------------
+            [dict]: field name -> (len(self),) + field shape array.
+
+        Explanations
+        ------------
+            Returns the in-memory rows when nothing was spilled, a view of
+            the current chunk when no chunk is full and else a concatenation
+            of the chunks. Otherwise, closes the buffer and memory-maps the
+            files.
+        """
+
+        if self.directory is None or self.numSpilled == 0:
+            if not self.chunks:
+                return {name: buffer[:self.pos]
+                        for name,buffer in self.buffers.items()}
+            return {name: np.concatenate(self.rows(name))
+                    for name in self.fields}
+        self.close()
+        return TrajectoryBuffer.load(self.directory)
+
+    @staticmethod
+    def load(directory):
+        """
+        Inputs
+        ------
+            directory [str]: a directory written by a closed buffer.
+
+        Raises/Returns
+        --------------
+            [dict]: field name -> read-only np.memmap of the records.
+
+        Explanations
+        ------------
+            Memory-maps recorded trajectories without copying them.
+        """
+
+        with open(os.path.join(directory,'meta.json')) as f:
+            meta = json.load(f)
+        length = meta['length']
+        arrays = {}
+        for name,field in meta['fields'].items():
+            shape = (length,) + tuple(field['shape'])
+            if length == 0:
+                arrays[name] = np.empty(shape,dtype=field['dtype'])
+                continue
+            arrays[name] = np.memmap(os.path.join(directory,name + '.bin'),
+                                     dtype=field['dtype'],mode='r',
+                                     shape=shape)
+        return arrays
@@ -16,6 +16,8 @@ License
 """
 import numpy as np
 from MDP.spaces.space import Space
+from MDP.batch import flattenBatch
+from sampling.sequential import sequentialMean
 
 class Transition():
     """
@@ -26,7 +28,7 @@ class Transition():
         probability density defining the next state of a continuous state MDP.
     """ 
     
-    def __init__(self,sSpace,aSpace):
+    def __init__(self,sSpace,aSpace,nSpace=None):
         """
         Inputs
         ------
@@ -35,6 +37,10 @@ class Transition():
 
             aSpace [Space]: MDP action space. It is needed mostly to check
                             the feasibility of a state.
+            
+            nSpace [Space]: MDP exogenous noise space. It is needed to
+                            sample the noise in getNextState and
+                            estimateNextState.
                             
         Raises/Returns
         --------------
@@ -48,6 +54,7 @@ class Transition():
         
         self.sSpace = sSpace
         self.aSpace = aSpace
+        self.nSpace = nSpace
 
     def getNextState(self, curState,curAction,numNextState=None):
         """
@@ -69,13 +76,59 @@ class Transition():
         
         Explanations
         ------------
-            This function generates a batch of MDP next states.
+            This function generates a batch of MDP next states. All noise
+            samples are drawn from nSpace at once and pushed through a
+            single call to getNextStatesBatch.
         """
         
         assert(self.sSpace.isStateFeasble(curState))
         assert(self.aSpace.isStateActionFeasble(curState,curAction))
+        assert(self.nSpace is not None),"nSpace is needed to sample the noise"
+        if numNextState is None:
+            numNextState = 1
+        assert(isinstance(numNextState,int) and numNextState > 0),"The number\
+        of samples should be a positive integer"
+        
+        exoSamples = np.asarray(self.nSpace.sample(numNextState))
+        return self.getNextStatesBatch(np.asarray(curState)[np.newaxis],
+                                       np.asarray(curAction)[np.newaxis],
+                                       exoSamples[np.newaxis])[0]
+    
+    def estimateNextState(self, curState,curAction,fn=None,absTol=None,
+                          relTol=None,confidence=0.95,initial=32,
+                          maxSamples=65536):
+        """
+        Inputs
+        ------
+            curState [list]: current state vector.
+            
+            curAction [list]: current action vector.
+            
+            fn [callable]: optional, maps a (n, sDim) array of next states
+                           to a (n, ...) array, e.g. a value function.
+                           Defaults to the next states themselves.
+            
+            absTol, relTol, confidence, initial, maxSamples: the stopping
+                rule, see sampling.sequential.sequentialMean.
+                               
+        Raises/Returns
+        --------------
+            [dict]: 'estimate' of E[fn(next state)], its 'stdError', the
+                    'numSamples' used and whether it 'converged'.
+        
+        Explanations
+        ------------
+            Estimates the expected (function of the) next state with an
+            adaptive number of samples: batches of growing size are drawn
+            until the confidence interval is narrow enough.
+        """
         
-        pass
+        def draw(n):
+            nextStates = self.getNextState(curState,curAction,n)
+            return nextStates if fn is None else fn(nextStates)
+        
+        return sequentialMean(draw,absTol,relTol,confidence,initial,
+                              maxSamples=maxSamples)
     
     def getNextStateWithExoSamples(self, curState,curAction,exoSamples):
         """
@@ -102,3 +155,34 @@ class Transition():
         assert(self.aSpace.isStateActionFeasble(curState,curAction))
         raise NotImplementedError
 
+    def getNextStatesBatch(self, curStates,curActions,exoSamples):
+        """
+        Inputs
+        ------
+            curStates [ndarray]: (N, sDim) array of current states.
+
+            curActions [ndarray]: (N, aDim) array of current actions.
+
+            exoSamples [ndarray]: (N, nDim) array with one exogenous sample
+                                  per state-action pair, or (N, M, nDim)
+                                  array with M samples per pair.
+
+        Raises/Returns
+        --------------
+            [ndarray]: (N, sDim) or (N, M, sDim) array of next states.
+
+        Explanations
+        ------------
+            This function generates the next states of a batch of
+            state-action pairs. The default implementation loops over
+            getNextStateWithExoSamples, subclasses should override it with
+            an array implementation for speed.
+        """
+        states,actions,noise,leadShape = flattenBatch(curStates,
+                                                      curActions,
+                                                      exoSamples)
+        nextStates = np.asarray([self.getNextStateWithExoSamples(states[k],
+                                                                 actions[k],
+                                                                 noise[k])
+                                 for k in range(states.shape[0])])
+        return nextStates.reshape(leadShape + (-1,))
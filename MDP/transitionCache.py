@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+GitHub Homepage
+----------------
+    https://github.com/ADP-Benchmarks
+
+Contact information
+-------------------
+    ADP.Benchmarks@gmail.com.
+
+License
+-------
+    The MIT License
+"""
+
+import numpy as np
+from MDP.cache import LRUCache
+from MDP.spaces.encoding import encodeExact, exactKey
+
+class TransitionCache():
+    """
+    Description
+    -----------
+        This class provides the next-state distributions of a discrete MDP
+        built lazily, one state-action pair at a time, for MDPs too large
+        to compile with compileMDP. A distribution is the sorted keys of
+        the reachable next states and their probabilities, obtained by
+        pushing the noise outcomes through the transition. Distributions
+        are kept in an LRU cache under a byte budget.
+    """
+
+    def __init__(self, mdp, numNoiseSamples=None, maxBytes=2**26,
+                 maxSize=None):
+        """
+        Inputs
+        ------
+            mdp [MDP]: an MDP with discrete, encodable state and action
+                       spaces.
+
+            numNoiseSamples [int]: if None, the noise space is enumerated and
+                                   must be discrete, each outcome having
+                                   probability 1/K. Else, this many noise
+                                   samples are drawn once and shared by all
+                                   state-action pairs, as in compileMDP.
+
+            maxBytes [int]: the byte budget of the cached distributions.
+
+            maxSize [int]: optional, the maximum number of distributions.
+
+        Raises/Returns
+        --------------
+
+        Explanations
+        ------------
+            The constructor of TransitionCache object.
+        """
+
+        assert(not mdp.sSpace.isContinuous and not mdp.aSpace.isContinuous
+               ),"Only discrete state and action spaces can be cached"
+
+        self.mdp = mdp
+        self.sSpace = mdp.sSpace
+        self.aSpace = mdp.aSpace
+        if numNoiseSamples is None:
+            assert(not mdp.nSpace.isContinuous),"A continuous noise space\
+            should be sampled, set numNoiseSamples"
+            self.noise = mdp.nSpace.enumerate()
+        else:
+            self.noise = np.asarray(mdp.nSpace.sample(numNoiseSamples))
+        self.cache = LRUCache(maxSize=maxSize,maxBytes=maxBytes)
+
+    def key(self, state, action):
+        """
+        Returns the cache key of a state-action pair, its encoded state and
+        action, or None if either is not an exact point of its space, since
+        its key would alias the one of a nearby point.
+        """
+        stateKey = exactKey(self.sSpace,state)
+        actionKey = exactKey(self.aSpace,action)
+        if stateKey is None or actionKey is None:
+            return None
+        return (stateKey,actionKey)
+
+    def distribution(self, state, action):
+        """
+        Inputs
+        ------
+            state [ndarray]: the state vector.
+
+            action [ndarray]: a feasible action vector.
+
+        Raises/Returns
+        --------------
+            keys [ndarray]: (k,) sorted keys of the reachable next states.
+
+            probs [ndarray]: (k,) their probabilities.
+
+        Explanations
+        ------------
+            Returns the cached distribution, or builds it with one call to
+            getNextStatesBatch over all noise outcomes and caches it.
+            Returned arrays are shared with the cache and read-only. Pairs
+            without an exact key bypass the cache.
+        """
+
+        key = self.key(state,action)
+        if key is not None:
+            entry = self.cache.get(key)
+            if entry is not None:
+                return entry
+
+        assert(self.aSpace.isStateActionFeasble(state,action))
+        nextStates = self.mdp.transition.getNextStatesBatch(
+                            np.asarray(state)[np.newaxis],
+                            np.asarray(action)[np.newaxis],
+                            self.noise[np.newaxis])[0]
+        violations = self.sSpace.isStateFeasbleBatch(nextStates)[1]
+        assert(violations.size == 0),"Next states should belong to the\
+        state space"
+        keys,exact = encodeExact(self.sSpace,nextStates)
+        assert(np.all(exact)),"Next states should be points of the state\
+        space, round them in the transition"
+        keys,counts = np.unique(keys,return_counts=True)
+        probs = counts/self.noise.shape[0]
+        keys.flags.writeable = False
+        probs.flags.writeable = False
+        if key is not None:
+            self.cache.put(key,(keys,probs))
+        return keys, probs
+
+    def nextStates(self, state, action):
+        """
+        Inputs
+        ------
+            state [ndarray]: the state vector.
+
+            action [ndarray]: a feasible action vector.
+
+        Raises/Returns
+        --------------
+            states [ndarray]: (k, sDim) reachable next states.
+
+            probs [ndarray]: (k,) their probabilities.
+
+        Explanations
+        ------------
+            Decoded counterpart of distribution.
+        """
+        keys,probs = self.distribution(state,action)
+        return self.sSpace.decode(keys), probs
+
+    def expectation(self, state, action, values):
+        """
+        Inputs
+        ------
+            state [ndarray]: the state vector.
+
+            action [ndarray]: a feasible action vector.
+
+            values [ndarray]: (cardinality,) values indexed by state key.
+
+        Raises/Returns
+        --------------
+            [float]: the expected value of the next state.
+
+        Explanations
+        ------------
+            Computes sum_j P(j|s,a) values[j] from the cached distribution.
+        """
+        keys,probs = self.distribution(state,action)
+        return float(probs @ np.asarray(values)[keys])
+
+    def stats(self):
+        """
+        Returns the statistics of the underlying LRUCache.
+        """
+        return self.cache.stats()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+GitHub Homepage
+----------------
+    https://github.com/ADP-Benchmarks
+
+Contact information
+-------------------
+    ADP.Benchmarks@gmail.com.
+
+License
+-------
+    The MIT License
+"""
+
+import numpy as np
+from MDP.vectorMDP import VectorMDP
+
+class VectorEnv:
+    """
+    Description
+    -----------
+        This class adapts an MDP to the vectorized environment interface of
+        RL training loops: step always returns (obs, reward, terminated,
+        truncated, info) arrays, whatever the horizon and absorbing states
+        of the MDP. Finished copies are reset in-place within the step, the
+        returned observations then being the initial states, and the last
+        observations of the finished episodes are kept in info['final_obs'].
+
+        The returned arrays are preallocated buffers overwritten by the
+        next step, they should be copied to be kept.
+    """
+
+    def __init__(self, mdp, numEnvs, maxEpisodeSteps=None, negateCosts=True):
+        """
+        Inputs
+        ------
+            mdp [MDP]: the MDP that is replicated.
+
+            numEnvs [int]: the number of MDP copies stepped together.
+
+            maxEpisodeSteps [int]: optional, truncates the episodes of
+                                   infinite horizon MDPs after this many
+                                   steps. Finite horizon MDPs are truncated
+                                   at their horizon.
+
+            negateCosts [bool]: if True, the costs of min-cost MDPs are
+                                returned as negative rewards, so that
+                                rewards are always maximized.
+
+        Raises/Returns
+        --------------
+
+        Explanations
+        ------------
+            The constructor of VectorEnv class.
+        """
+
+        self.vec = VectorMDP(mdp,numEnvs)
+        self.numEnvs = numEnvs
+        if mdp.isFiniteHorizon:
+            self.horizon = mdp.isFiniteHorizon
+        else:
+            self.horizon = maxEpisodeSteps
+        self.sign = -1.0 if negateCosts and mdp.objective.isMinCost else 1.0
+
+        states = self.vec.currStates
+        self.obs = np.empty_like(states)
+        self.finalObs = np.empty_like(states)
+        self.rewards = np.empty(numEnvs,dtype=float)
+        self.terminated = np.zeros(numEnvs,dtype=bool)
+        self.truncated = np.zeros(numEnvs,dtype=bool)
+        self.dones = np.zeros(numEnvs,dtype=bool)
+
+    def reset(self, seed=None):
+        '''
+        Resets every copy
+        -----------------
+        Inputs
+        ------
+        seed [int or SeedSequence]: optional, re-seeds the noise space.
+
+        Returns
+        -------
+        obs [ndarray]: (numEnvs, sDim) initial observations.
+
+        info [dict]: empty.
+
+        '''
+        if seed is not None:
+            self.vec.nSpace.seed(seed)
+        self.vec.reset()
+        self.obs[...] = self.vec.currStates
+        return self.obs, {}
+
+    def step(self, actions, force_noise=None):
+        '''
+        Takes one step in every copy
+        ----------------------------
+        Inputs
+        ------
+        actions [ndarray]: (numEnvs, aDim) array of actions.
+
+        force_noise [ndarray]: optional, (numEnvs, nDim) noise vectors, see
+                               VectorMDP.step.
+
+        Explanations
+        ------------
+        Runs VectorMDP.advance, with the same transitions and terminal rule
+        as VectorMDP.step, then resets the finished copies.
+
+        Returns
+        -------
+        obs [ndarray]: (numEnvs, sDim) observations, the initial states for
+                       the copies that were reset.
+
+        reward [ndarray]: (numEnvs,) rewards.
+
+        terminated [ndarray]: (numEnvs,) True where an absorbing state was
+                              reached, see VectorMDP.advance.
+
+        truncated [ndarray]: (numEnvs,) True where the horizon was reached
+                             without termination.
+
+        info [dict]: 't' the (numEnvs,) periods of the new observations,
+                     'noise' the noise outcomes and 'final_obs' the next
+                     states before the resets, valid where terminated or
+                     truncated.
+
+        '''
+        vec = self.vec
+        nextStates,rewards,terminated,truncated,noise = vec.advance(
+                                            actions,force_noise,self.horizon)
+        np.multiply(rewards,self.sign,out=self.rewards)
+        self.terminated[...] = terminated
+        self.truncated[...] = truncated
+        np.logical_or(self.terminated,self.truncated,out=self.dones)
+
+        self.finalObs[...] = nextStates
+        vec.reset(self.dones)
+        self.obs[...] = vec.currStates
+        return (self.obs,self.rewards,self.terminated,self.truncated,
+                {'t': vec.t,'noise': noise,'final_obs': self.finalObs})
+
+    def close(self):
+        '''
+        Releases the environment, for interface compatibility.
+        '''
+        pass
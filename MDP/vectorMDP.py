@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+GitHub Homepage
+----------------
+    https://github.com/ADP-Benchmarks
+
+Contact information
+-------------------
+    ADP.Benchmarks@gmail.com.
+
+License
+-------
+    The MIT License
+"""
+
+import numpy as np
+from MDP.MDP import MDP
+
+class VectorMDP:
+    """
+    Description
+    -----------
+        This class runs numEnvs copies of an MDP in lock-step. The current
+        states are stored as a single (numEnvs, sDim) array and every call
+        to step advances all copies at once.
+    """
+
+    def __init__(self, mdp, numEnvs):
+        """
+        Inputs
+        ------
+            mdp [MDP]: the MDP that is replicated.
+
+            numEnvs [int]: the number of MDP copies stepped together.
+
+        Raises/Returns
+        --------------
+
+        Explanations
+        ------------
+            The constructor of VectorMDP class. The spaces, transition and
+            objective of mdp are shared by all copies.
+        """
+
+        assert(isinstance(mdp,MDP))
+        assert(isinstance(numEnvs,int) and numEnvs > 0),"The number of\
+        environments should be a positive integer"
+
+        self.mdp = mdp
+        self.numEnvs = numEnvs
+        self.sSpace = mdp.sSpace
+        self.aSpace = mdp.aSpace
+        self.nSpace = mdp.nSpace
+        self.sDim = mdp.sDim
+        self.aDim = mdp.aDim
+        self.nDim = mdp.nDim
+        self.transition = mdp.transition
+        self.objective = mdp.objective
+        self.isFiniteHorizon = mdp.isFiniteHorizon
+        self.isAveCost = mdp.isAveCost
+
+        self.initState = np.asarray(mdp.initState).reshape(self.sDim)
+        self.terminalSet = mdp.terminalSet
+
+        # Next states are checked against this type at every step
+        dtype = float if self.sSpace.isContinuous else self.initState.dtype
+        self.currStates = np.empty((numEnvs,self.sDim),dtype=dtype)
+        self.t = np.zeros(numEnvs,dtype=np.int64)
+        self.scenarios = None
+        self.scenarioStart = None
+        self.scenarioIndex = None
+        self.scenarioStep = np.zeros(numEnvs,dtype=np.int64)
+        self.reset()
+
+    def step(self, actions, force_noise=None):
+        '''
+        Takes one step in every copy of the MDP.
+        ----------------------------------------
+        Inputs
+        ------
+        actions [ndarray]: (numEnvs, aDim) array of current actions, one row
+                           per copy.
+
+        force_noise [ndarray]: optional, a (numEnvs, nDim) array of exogenous
+                               noise vectors. If not provided, the noise is
+                               read from the scenarios set by setScenarios
+                               or, without scenarios, numEnvs noise vectors
+                               are sampled in a single call.
+
+        Returns
+        -------
+        nextStates [ndarray]: (numEnvs, sDim) next states at t+1, before any
+                              reset is applied.
+
+        rewards [ndarray]: (numEnvs,) rewards/costs.
+
+        dones [ndarray]: (numEnvs,) boolean flags, True for the copies that
+                         reached the end of the horizon or an absorbing
+                         state. These copies are reset in-place.
+
+        info [dict]: 't' holds the (numEnvs,) periods after the step and
+                     'noise' the (numEnvs, nDim) noise outcomes.
+
+        '''
+
+        nextStates,rewards,terminated,truncated,noise = self.advance(
+                                                    actions,force_noise)
+        dones = terminated | truncated
+        self.reset(dones)
+        return nextStates, rewards, dones, {'t': self.t.copy(),
+                                            'noise': noise}
+
+    def advance(self, actions, force_noise=None, horizon=None):
+        '''
+        Moves every copy to its next state, without any reset
+        ------------------------------------------------------
+        Inputs
+        ------
+        actions [ndarray]: (numEnvs, aDim) array of current actions.
+
+        force_noise [ndarray]: optional, see step.
+
+        horizon [int]: optional, the number of periods after which episodes
+                       are truncated. Defaults to the horizon of finite
+                       horizon MDPs.
+
+        Returns
+        -------
+        nextStates [ndarray]: (numEnvs, sDim) next states.
+
+        rewards [ndarray]: (numEnvs,) rewards/costs.
+
+        terminated [ndarray]: (numEnvs,) True where an absorbing state was
+                              reached. As in MDP.step, absorbing states are
+                              only checked for infinite horizon MDPs.
+
+        truncated [ndarray]: (numEnvs,) True where the horizon was reached
+                             without termination.
+
+        noise [ndarray]: (numEnvs, nDim) noise outcomes.
+
+        Explanations
+        ------------
+        The step logic shared by step and VectorEnv.step, which reset the
+        finished copies. The periods t count the steps since the last reset
+        of each copy.
+
+        '''
+
+        actions = np.asarray(actions).reshape(self.numEnvs,self.aDim)
+        noise = self.drawNoise(force_noise)
+
+        nextStates = self.transition.getNextStatesBatch(self.currStates,
+                                                        actions,
+                                                        noise)
+        rewards = self.objective.getObjectivesBatch(self.currStates,
+                                                    actions,
+                                                    noise)
+        # Increment the periods
+        self.t += 1
+        if horizon is None:
+            horizon = self.isFiniteHorizon
+
+        if self.isFiniteHorizon or self.terminalSet is None:
+            terminated = np.zeros(self.numEnvs,dtype=bool)
+        else:
+            terminated = self.isTerminal(nextStates)
+        if horizon:
+            truncated = (self.t >= horizon) & ~terminated
+        else:
+            truncated = np.zeros(self.numEnvs,dtype=bool)
+
+        nextStates = np.asarray(nextStates)
+        if not np.can_cast(nextStates.dtype,self.currStates.dtype):
+            # e.g. float next states of a discrete space stored as integers,
+            # that would be truncated
+            stored = nextStates.astype(self.currStates.dtype)
+            if not np.array_equal(stored,nextStates):
+                raise ValueError('The transition returned %s next states '
+                                 'that are not exactly representable as %s '
+                                 'states: round them in the transition or '
+                                 'give a %s initial state' % (
+                                 nextStates.dtype,self.currStates.dtype,
+                                 nextStates.dtype))
+        self.currStates[...] = nextStates
+        return nextStates, rewards, terminated, truncated, noise
+
+    def drawNoise(self, force_noise=None):
+        '''
+        Draws the noise of one step of every copy
+        -----------------------------------------
+        Inputs
+        ------
+        force_noise [ndarray]: optional, a (numEnvs, nDim) array of exogenous
+                               noise vectors, returned as is.
+
+        Returns
+        -------
+        [ndarray]: (numEnvs, nDim) noise vectors, read from the scenarios
+                   set by setScenarios or, without scenarios, sampled in a
+                   single call.
+
+        '''
+        if force_noise is not None:
+            noise = np.asarray(force_noise)
+        elif self.scenarios is not None:
+            numPaths,length = self.scenarios.shape[:2]
+            if np.any(self.scenarioIndex >= numPaths):
+                raise ValueError('The scenario store has %d paths, all of '
+                                 'them were replayed: generate more '
+                                 'scenarios' % numPaths)
+            if np.any(self.scenarioStep >= length):
+                raise ValueError('The scenarios have %d steps, step %d was '
+                                 'requested: generate longer scenarios or '
+                                 'reset the copies' % (length,
+                                 int(self.scenarioStep.max()) + 1))
+            noise = self.scenarios[self.scenarioIndex,self.scenarioStep]
+            self.scenarioStep += 1
+        else:
+            noise = np.asarray(self.nSpace.sample(self.numEnvs))
+        return noise.reshape(self.numEnvs,self.nDim)
+
+    def setScenarios(self, store, episodes):
+        '''
+        Replays stored noise paths
+        --------------------------
+        Inputs
+        ------
+        store [ScenarioStore]: the store holding the noise paths. If None,
+                               noise is sampled from nSpace again.
+
+        episodes [ndarray]: (numEnvs,) scenario indices, one per copy.
+
+        Returns
+        -------
+
+        Explanations
+        ------------
+        Copy i reads its noise from path episodes[i], from its start. When
+        copy i finishes an episode and is reset by step, it moves on to the
+        path episodes[i] + numEnvs, then episodes[i] + 2*numEnvs, etc., so
+        that successive episodes of a copy replay different paths. With
+        episodes = arange(numEnvs), the copies go through the paths of the
+        store in order. A full reset, reset() without mask, rewinds every
+        copy to the start of path episodes[i].
+
+        '''
+        if store is None:
+            self.scenarios = None
+            self.scenarioStart = None
+            self.scenarioIndex = None
+        else:
+            self.scenarios = store.paths
+            self.scenarioStart = np.asarray(episodes,dtype=np.int64
+                                            ).reshape(self.numEnvs)
+            self.scenarioIndex = self.scenarioStart.copy()
+        self.scenarioStep[...] = 0
+
+    def isTerminal(self, states):
+        '''
+        Checks a batch of states against the absorbing states
+        ------------------------------------------------------
+        Inputs
+        ------
+        states [ndarray]: (N, sDim) array of states.
+
+        Returns
+        -------
+        [ndarray]: (N,) boolean mask, True for the absorbing states.
+
+        '''
+        if self.terminalSet is None:
+            return np.zeros(states.shape[0],dtype=bool)
+        return self.terminalSet.containsBatch(states)
+
+    def reset(self, mask=None):
+        '''
+        Resets copies back to the initial state
+        ---------------------------------------
+        Inputs
+        ------
+        mask [ndarray]: optional, (numEnvs,) boolean mask of the copies
+                        to reset, which move on to their next scenario, see
+                        setScenarios. If not provided, every copy is reset
+                        and rewound to its first scenario.
+
+        Returns
+        -------
+        currStates [ndarray]: (numEnvs, sDim) current states after the reset.
+
+        t [ndarray]: (numEnvs,) current periods, only returned for finite
+                     horizon MDPs.
+
+        '''
+        if mask is None:
+            self.currStates[...] = self.initState
+            self.t[...] = 0
+            self.scenarioStep[...] = 0
+            if self.scenarios is not None:
+                self.scenarioIndex[...] = self.scenarioStart
+        else:
+            self.currStates[mask] = self.initState
+            self.t[mask] = 0
+            self.scenarioStep[mask] = 0
+            if self.scenarios is not None:
+                # The reset copies move on to their next scenario
+                self.scenarioIndex[mask] += self.numEnvs
+        if self.isFiniteHorizon:
+            return (self.currStates,self.t)
+        else:
+            return self.currStates
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+GitHub Homepage
+----------------
+    https://github.com/ADP-Benchmarks
+
+Contact information
+-------------------
+    ADP.Benchmarks@gmail.com.
+
+License
+-------
+    The MIT License
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+import numpy as np
+from MDP.spaces.cube import Cube
+from MDP.spaces.ball import Ball
+from MDP.transition import Transition
+from MDP.objective import Objective
+from MDP.MDP import MDP
+from MDP.vectorMDP import VectorMDP
+
+"""
+Explanations
+------------
+    Performance benchmarks for spaces, samplers and MDP stepping.
+
+    Run the suite and write the results to a JSON file:
+        python -m benchmarks.benchmark run --output results.json
+    Compare two result files, exiting with status 1 on regressions:
+        python -m benchmarks.benchmark compare base.json new.json
+"""
+
+class ShiftTransition(Transition):
+    """
+    Description
+    -----------
+        Benchmark transition s' = clip(s + a - w) onto the state space, with
+        both a per-pair and a batched implementation.
+    """
+    def getNextStateWithExoSamples(self, curState,curAction,exoSamples):
+        return np.clip(np.asarray(curState) + np.asarray(curAction)
+                       - np.asarray(exoSamples),
+                       self.sSpace.low,self.sSpace.high)
+
+    def getNextStatesBatch(self, curStates,curActions,exoSamples):
+        exoSamples = np.asarray(exoSamples)
+        if exoSamples.ndim == 3:
+            curStates = np.asarray(curStates)[:,np.newaxis]
+            curActions = np.asarray(curActions)[:,np.newaxis]
+        return np.clip(curStates + curActions - exoSamples,
+                       self.sSpace.low,self.sSpace.high)
+
+class LinearObjective(Objective):
+    """
+    Description
+    -----------
+        Benchmark cost sum(s) + sum(a), with both a per-pair and a batched
+        implementation.
+    """
+    def getObjectiveWithExoSamples(self,curState,curAction,exoSamples):
+        return float(np.sum(curState) + np.sum(curAction))
+
+    def getObjectivesBatch(self,curStates,curActions,exoSamples):
+        exoSamples = np.asarray(exoSamples)
+        cost = np.sum(curStates,axis=-1) + np.sum(curActions,axis=-1)
+        if exoSamples.ndim == 3:
+            cost = cost[:,np.newaxis]
+        return np.broadcast_to(cost,exoSamples.shape[:-1]).astype(float)
+
+def makeCubeMDP(dim, isContinuous, horizon):
+    """
+    Builds a dim-dimensional benchmark MDP on [0,10]^dim.
+    """
+    sSpace = Cube(np.tile([0,10],(dim,1)),isContinuous=isContinuous,seed=0)
+    aSpace = Cube(np.tile([0,2],(dim,1)),isContinuous=isContinuous,seed=1)
+    nSpace = Cube(np.tile([0,2],(dim,1)),isContinuous=isContinuous,seed=2)
+    return MDP(initState=np.full(dim,5),
+               sSpace=sSpace,
+               aSpace=aSpace,
+               nSpace=nSpace,
+               transition=ShiftTransition(sSpace,aSpace),
+               objective=LinearObjective(sSpace,aSpace),
+               isFiniteHorizon=horizon)
+
+def measure(fn, itemsPerCall, numCalls, warmup=10):
+    """
+    Inputs
+    ------
+        fn [callable]: the benchmarked call, without arguments.
+
+        itemsPerCall [int]: the number of items (samples, states, steps)
+                            processed by one call.
+
+        numCalls [int]: the number of timed calls.
+
+        warmup [int]: the number of untimed calls made first.
+
+    Raises/Returns
+    --------------
+        [dict]: 'throughput' in items/sec, 'latency' percentiles of one
+                call in seconds and 'peakMemory' in bytes.
+
+    Explanations
+    ------------
+        Times numCalls calls one by one, then measures the peak traced
+        memory of a separate untimed call with tracemalloc.
+    """
+
+    for _ in range(warmup):
+        fn()
+    latency = np.empty(numCalls)
+    clock = time.perf_counter
+    for i in range(numCalls):
+        start = clock()
+        fn()
+        latency[i] = clock() - start
+
+    tracemalloc.start()
+    fn()
+    peakMemory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {'throughput': itemsPerCall*numCalls/float(latency.sum()),
+            'latency': {'mean': float(latency.mean()),
+                        'p50': float(np.percentile(latency,50)),
+                        'p90': float(np.percentile(latency,90)),
+                        'p99': float(np.percentile(latency,99))},
+            'peakMemory': int(peakMemory)}
+
+def benchmarkCases(quick=False):
+    """
+    Inputs
+    ------
+        quick [bool]: if True, only the smallest instances are generated.
+
+    Raises/Returns
+    --------------
+        [generator]: (name, params, fn, itemsPerCall, unit) tuples.
+
+    Explanations
+    ------------
+        Generates the parameterized benchmark instances.
+    """
+
+    dims = (2,) if quick else (2,16)
+    batches = (1,1024) if quick else (1,1024,65536)
+
+    for dim in dims:
+        for isContinuous in (True,False):
+            for batch in batches:
+                params = {'dim': dim, 'continuous': isContinuous,
+                          'batch': batch}
+                cube = Cube(np.tile([0,10],(dim,1)),
+                            isContinuous=isContinuous,seed=0)
+                yield ('cube.sample',params,
+                       lambda c=cube,n=batch: c.sample(n),batch,'samples/s')
+                ball = Ball(np.zeros(dim),10.0,isContinuous=isContinuous,
+                            seed=0)
+                yield ('ball.sample',params,
+                       lambda b=ball,n=batch: b.sample(n),batch,'samples/s')
+
+        for batch in batches:
+            params = {'dim': dim, 'batch': batch}
+            cube = Cube(np.tile([0.,10.],(dim,1)),seed=0)
+            states = cube.sample(batch)
+            yield ('cube.isStateFeasbleBatch',params,
+                   lambda c=cube,s=states: c.isStateFeasbleBatch(s),
+                   batch,'states/s')
+            ball = Ball(np.zeros(dim),10.0,seed=0)
+            states = ball.sample(batch)
+            yield ('ball.isStateFeasbleBatch',params,
+                   lambda b=ball,s=states: b.isStateFeasbleBatch(s),
+                   batch,'states/s')
+            ball = Ball(np.zeros(dim),10.0,isContinuous=False,seed=0)
+            states = ball.sample(batch)
+            yield ('ball.encode',params,
+                   lambda b=ball,s=states: b.encode(s),batch,'states/s')
+        params = {'dim': dim}
+        cube = Cube(np.tile([0.,10.],(dim,1)),seed=0)
+        state = cube.sample(1)[0]
+        yield ('cube.isStateFeasble',params,
+               lambda c=cube,s=state: c.isStateFeasble(s),1,'states/s')
+
+        for isContinuous in (True,False):
+            for horizon in (10,1000):
+                params = {'dim': dim, 'continuous': isContinuous,
+                          'horizon': horizon}
+                mdp = makeCubeMDP(dim,isContinuous,horizon)
+                action = np.ones(dim,dtype=int)
+                yield ('mdp.step',params,
+                       lambda m=mdp,a=action: m.step(a),1,'steps/s')
+                for numEnvs in batches[1:]:
+                    vparams = dict(params,numEnvs=numEnvs)
+                    vmdp = VectorMDP(mdp,numEnvs)
+                    actions = np.ones((numEnvs,dim),dtype=int)
+                    yield ('vectorMDP.step',vparams,
+                           lambda v=vmdp,a=actions: v.step(a),numEnvs,
+                           'steps/s')
+
+def run(quick=False, numCalls=200):
+    """
+    Inputs
+    ------
+        quick [bool]: if True, only the smallest instances are run.
+
+        numCalls [int]: the number of timed calls per instance.
+
+    Raises/Returns
+    --------------
+        [dict]: 'meta', the environment description, and 'results', one
+                entry per instance.
+
+    Explanations
+    ------------
+        Runs the benchmark suite.
+    """
+
+    results = []
+    for name,params,fn,itemsPerCall,unit in benchmarkCases(quick):
+        result = {'name': name, 'params': params, 'unit': unit}
+        result.update(measure(fn,itemsPerCall,numCalls))
+        results.append(result)
+        print('%-28s %-60s %14.1f %s' % (name,json.dumps(params),
+                                          result['throughput'],unit))
+    meta = {'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S')}
+    return {'meta': meta, 'results': results}
+
+def resultKey(result):
+    """
+    Returns the key identifying an instance across result files.
+    """
+    return result['name'] + json.dumps(result['params'],sort_keys=True)
+
+def compare(base, new, threshold=0.1):
+    """
+    Inputs
+    ------
+        base [dict]: the reference results, as returned by run.
+
+        new [dict]: the results to check.
+
+        threshold [float]: the tolerated relative throughput loss.
+
+    Raises/Returns
+    --------------
+        [list]: (key, baseThroughput, newThroughput, ratio, isRegression)
+                tuples for the instances present in both files.
+
+    Explanations
+    ------------
+        Compares the throughput of matching instances. An instance is a
+        regression when its throughput drops below (1-threshold) times the
+        reference.
+    """
+
+    baseResults = {resultKey(r): r for r in base['results']}
+    rows = []
+    for result in new['results']:
+        key = resultKey(result)
+        if key not in baseResults:
+            continue
+        old = baseResults[key]['throughput']
+        ratio = result['throughput']/old
+        rows.append((key,old,result['throughput'],ratio,
+                     ratio < 1.0 - threshold))
+    return rows
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='ADP-Benchmarks performance'
+                                                 ' suite')
+    commands = parser.add_subparsers(dest='command',required=True)
+    runParser = commands.add_parser('run',help='run the benchmark suite')
+    runParser.add_argument('--output',default='bench_results.json')
+    runParser.add_argument('--quick',action='store_true')
+    runParser.add_argument('--calls',type=int,default=200)
+    compareParser = commands.add_parser('compare',
+                                        help='compare two result files')
+    compareParser.add_argument('base')
+    compareParser.add_argument('new')
+    compareParser.add_argument('--threshold',type=float,default=0.1)
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        results = run(args.quick,args.calls)
+        with open(args.output,'w') as f:
+            json.dump(results,f,indent=2)
+        return 0
+
+    with open(args.base) as f:
+        base = json.load(f)
+    with open(args.new) as f:
+        new = json.load(f)
+    rows = compare(base,new,args.threshold)
+    for key,old,current,ratio,isRegression in rows:
+        print('%-80s %14.1f %14.1f %6.2fx %s' % (key,old,current,ratio,
+                                                 'REGRESSION' if isRegression
+                                                 else ''))
+    return 1 if any(row[4] for row in rows) else 0
+
+if __name__== "__main__":
+    sys.exit(main())
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+GitHub Homepage
+----------------
+    https://github.com/ADP-Benchmarks
+
+Contact information
+-------------------
+    ADP.Benchmarks@gmail.com.
+
+License
+-------
+    The MIT License
+"""
+
+import copy
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from statistics import NormalDist
+import numpy as np
+
+def runEpisode(mdp, policy, seed, horizon, discount=1.0, inPlace=False):
+    """
+    Inputs
+    ------
+        mdp [MDP]: the MDP.
+
+        policy [callable]: maps the current state to an action.
+
+        seed [SeedSequence]: the random stream of the episode, used to
+                             re-seed the noise space.
+
+        horizon [int]: the maximum number of steps.
+
+        discount [float]: the discount factor applied to the rewards.
+
+        inPlace [bool]: if True, the noise space of mdp is re-seeded and
+                        mdp is reset and stepped. Else, the episode runs on
+                        a copy and mdp is left untouched.
+
+    Raises/Returns
+    --------------
+        [float]: the discounted return of the episode.
+
+    Explanations
+    ------------
+        Runs one episode, stopping after horizon steps or when an
+        absorbing state is reached.
+    """
+
+    if not inPlace:
+        mdp = copy.deepcopy(mdp)
+    mdp.nSpace.seed(seed)
+    mdp.reset()
+    total = 0.0
+    weight = 1.0
+    for _ in range(horizon):
+        out = mdp.step(policy(mdp.currState))
+        total += weight*out[1]
+        weight *= discount
+        if len(out) == 4 and out[2]:
+            break
+    return total
+
+def _runEpisodes(mdp, policy, seeds, horizon, discount, shmName,
+                 numEpisodes, start):
+    """
+    Runs the episodes start, ..., start+len(seeds)-1 in a worker process and
+    writes their returns into the shared returns array.
+    """
+    shm = shared_memory.SharedMemory(name=shmName)
+    try:
+        returns = np.ndarray((numEpisodes,),dtype=np.float64,buffer=shm.buf)
+        for k,seed in enumerate(seeds):
+            returns[start + k] = runEpisode(mdp,policy,seed,horizon,discount,
+                                            inPlace=True)
+        del returns
+    finally:
+        shm.close()
+
+def evaluatePolicy(mdp, policy, numEpisodes, horizon=None, discount=1.0,
+                   numWorkers=1, seed=None, confidence=0.95):
+    """
+    Inputs
+    ------
+        mdp [MDP]: the MDP. It is pickled to the worker processes, so its
+                   transition and objective should be picklable.
+
+        policy [callable]: maps the current state to an action. It should
+                           be picklable, e.g. a module-level function.
+
+        numEpisodes [int]: the number of episodes.
+
+        horizon [int]: the number of steps per episode. Defaults to the
+                       horizon of finite horizon MDPs, and is required for
+                       infinite horizon MDPs.
+
+        discount [float]: the discount factor applied to the rewards.
+
+        numWorkers [int]: the number of worker processes. With 1, the
+                          episodes run in the calling process.
+
+        seed [int or SeedSequence]: the root seed.
+
+        confidence [float]: the level of the confidence interval.
+
+    Raises/Returns
+    --------------
+        [dict]: 'mean', 'variance', 'stdError', 'ciLow', 'ciHigh',
+                'numEpisodes' and 'returns', the (numEpisodes,) returns.
+
+    Explanations
+    ------------
+        Monte Carlo policy evaluation. Every episode gets its own child
+        stream of np.random.SeedSequence(seed).spawn, and episodes are
+        split into contiguous chunks over a process pool whose workers
+        write their returns into a shared memory array. Since an episode
+        depends only on its own stream, the returns are bit-identical for
+        any number of workers. The episodes run on copies of mdp, whose
+        state and noise stream are left untouched.
+    """
+
+    assert(isinstance(numEpisodes,int) and numEpisodes > 0)
+    assert(isinstance(numWorkers,int) and numWorkers > 0)
+    if horizon is None:
+        assert(mdp.isFiniteHorizon),"horizon is required for infinite\
+        horizon MDPs"
+        horizon = mdp.isFiniteHorizon
+
+    if not isinstance(seed,np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    seeds = seed.spawn(numEpisodes)
+
+    if numWorkers > 1:
+        # Checked up front, a pickling error in the pool is obscure
+        try:
+            pickle.dumps((mdp,policy))
+            error = None
+        except Exception as e:
+            error = repr(e)
+        assert(error is None),("With numWorkers > 1, the MDP and the policy"
+        " should be picklable, e.g. module-level functions rather than"
+        " lambdas or closures: " + str(error))
+
+    if numWorkers == 1:
+        # One copy for all the episodes, each of them re-seeds it
+        episodeMDP = copy.deepcopy(mdp)
+        returns = np.array([runEpisode(episodeMDP,policy,s,horizon,discount,
+                                       inPlace=True)
+                            for s in seeds])
+    else:
+        shm = shared_memory.SharedMemory(create=True,size=8*numEpisodes)
+        try:
+            bounds = np.linspace(0,numEpisodes,numWorkers + 1).astype(int)
+            with ProcessPoolExecutor(max_workers=numWorkers) as pool:
+                futures = [pool.submit(_runEpisodes,mdp,policy,
+                                       seeds[lo:hi],horizon,discount,
+                                       shm.name,numEpisodes,lo)
+                           for lo,hi in zip(bounds[:-1],bounds[1:])
+                           if hi > lo]
+                for future in futures:
+                    future.result()
+            returns = np.ndarray((numEpisodes,),dtype=np.float64,
+                                 buffer=shm.buf).copy()
+        finally:
+            shm.close()
+            shm.unlink()
+
+    mean = float(returns.mean())
+    variance = float(returns.var(ddof=1)) if numEpisodes > 1 else 0.0
+    stdError = (variance/numEpisodes) ** 0.5
+    z = NormalDist().inv_cdf(0.5 + confidence/2)
+    return {'mean': mean,
+            'variance': variance,
+            'stdError': stdError,
+            'ciLow': mean - z*stdError,
+            'ciHigh': mean + z*stdError,
+            'numEpisodes': numEpisodes,
+            'returns': returns}
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+GitHub Homepage
+----------------
+    https://github.com/ADP-Benchmarks
+
+Contact information
+-------------------
+    ADP.Benchmarks@gmail.com.
+
+License
+-------
+    The MIT License
+"""
+
+import numpy as np
+from functools import partial
+from MDP.spaces.cube import Cube
+from MDP.MDP import MDP
+from MDP.kernels import KernelTransition, KernelObjective
+
+"""
+Explanations
+------------
+    Finite horizon selling of dim assets, each sold at most once. The state
+    is (price level of each asset, whether each asset is still held), the
+    action whether to sell each asset now, and the noise the price moves:
+        price' = clip(price + w, 0, numPrices - 1)
+        held'  = held * (1 - sell)
+    Selling a held asset earns basePrice + price. Assets still held at the
+    horizon are worth liquidationValue, see terminalValues.
+"""
+
+def assetSellingTransitionKernel(numPrices, states, actions, noise):
+    """
+    Returns the next (prices, holdings), see the module explanations.
+    """
+    dim = actions.shape[1]
+    price = np.clip(states[:,:dim] + noise,0,numPrices - 1)
+    held = states[:,dim:]*(1 - actions)
+    return np.concatenate((price,held),axis=1)
+
+def assetSellingObjectiveKernel(basePrice, states, actions, noise):
+    """
+    Returns the period revenues, see AssetSellingObjective.
+    """
+    dim = actions.shape[1]
+    sold = states[:,dim:]*actions
+    return np.sum((basePrice + states[:,:dim])*sold,axis=1).astype(np.float64)
+
+
+class AssetSellingTransition(KernelTransition):
+    """
+    Description
+    -----------
+        Bounded random walk of the prices and holdings update.
+    """
+
+    def __init__(self, sSpace, aSpace, numPrices, nSpace=None, jit=True):
+        super(AssetSellingTransition,self).__init__(
+            sSpace,aSpace,partial(assetSellingTransitionKernel,numPrices),jit,
+            nSpace)
+        self.numPrices = numPrices
+
+
+class AssetSellingObjective(KernelObjective):
+    """
+    Description
+    -----------
+        Revenue of the assets sold in the period.
+    """
+
+    def __init__(self, sSpace, aSpace, basePrice, nSpace=None, jit=True):
+        super(AssetSellingObjective,self).__init__(
+            sSpace,aSpace,partial(assetSellingObjectiveKernel,basePrice),jit,
+            isDeterministic=True,isMinCost=False,nSpace=nSpace)
+        self.basePrice = basePrice
+
+
+
+def makeAssetSelling(dim=1, numPrices=10, maxPriceMove=2, basePrice=1.0,
+                     horizon=10, seed=None):
+    """
+    Inputs
+    ------
+        dim [int]: the number of assets.
+
+        numPrices [int]: the number of price levels.
+
+        maxPriceMove [int]: price moves are uniform on
+                            {-maxPriceMove, ..., maxPriceMove}.
+
+        basePrice [float]: the price of level 0.
+
+        horizon [int]: the selling deadline.
+
+        seed [int]: optional, the seed of the noise space.
+
+    Raises/Returns
+    --------------
+        [MDP]: the asset selling MDP, holding every asset at the middle
+               price.
+
+    Explanations
+    ------------
+        Builds a dim-asset selling MDP on discrete cubes.
+    """
+
+    assert(horizon),"Asset selling has a finite horizon"
+    sSpace = Cube(np.vstack([np.tile([0,numPrices - 1],(dim,1)),
+                             np.tile([0,1],(dim,1))]),isContinuous=False)
+    aSpace = Cube(np.tile([0,1],(dim,1)),isContinuous=False)
+    nSpace = Cube(np.tile([-maxPriceMove,maxPriceMove],(dim,1)),
+                  isContinuous=False,seed=seed)
+    initState = np.concatenate([np.full(dim,numPrices//2),
+                                np.ones(dim)]).astype(np.int64)
+    return MDP(initState=initState,
+               sSpace=sSpace,
+               aSpace=aSpace,
+               nSpace=nSpace,
+               transition=AssetSellingTransition(sSpace,aSpace,numPrices,
+                                                 nSpace),
+               objective=AssetSellingObjective(sSpace,aSpace,basePrice,
+                                               nSpace),
+               isFiniteHorizon=horizon)
+
+def terminalValues(mdp, liquidationValue=0.0):
+    """
+    Inputs
+    ------
+        mdp [MDP]: an MDP built by makeAssetSelling.
+
+        liquidationValue [float]: the value of an asset held at the horizon.
+
+    Raises/Returns
+    --------------
+        [ndarray]: (cardinality,) terminal values of the states, in key
+                   order, for solvers.exact.backwardInduction.
+
+    Explanations
+    ------------
+        Unsold assets are worth liquidationValue each at the deadline.
+    """
+    states = mdp.sSpace.enumerate()
+    dim = mdp.aDim
+    return liquidationValue*np.sum(states[:,dim:],axis=1).astype(float)
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+GitHub Homepage
+----------------
+    https://github.com/ADP-Benchmarks
+
+Contact information
+-------------------
+    ADP.Benchmarks@gmail.com.
+
+License
+-------
+    The MIT License
+"""
+
+import numpy as np
+from functools import partial
+from MDP.spaces.cube import Cube
+from MDP.MDP import MDP
+from MDP.kernels import KernelTransition, KernelObjective
+
+"""
+Explanations
+------------
+    Energy storage arbitrage with dim batteries facing a common price. The
+    state is (price level, charge of each battery), the action the energy
+    bought (positive) or sold (negative) by each battery, and the noise the
+    price move. Requests beyond the battery limits are cut:
+        charge' = clip(charge + a, 0, capacity)
+        price'  = clip(price + w, 0, numPrices - 1)
+    The reward is the trading revenue at the current price,
+    basePrice + price, minus a per-unit wear cost on the energy moved.
+"""
+
+def energyTransitionKernel(capacity, numPrices, states, actions, noise):
+    """
+    Returns the next (price, charges), see the module explanations.
+    """
+    price = np.clip(states[:,:1] + noise,0,numPrices - 1)
+    charge = np.clip(states[:,1:] + actions,0,capacity)
+    return np.concatenate((price,charge),axis=1)
+
+def energyObjectiveKernel(capacity, basePrice, wearCost, states, actions,
+                          noise):
+    """
+    Returns the period revenues, see EnergyObjective.
+    """
+    charge = states[:,1:]
+    moved = np.clip(charge + actions,0,capacity) - charge
+    price = basePrice + states[:,0]
+    return np.sum(-price[:,np.newaxis]*moved
+                  - wearCost*np.abs(moved),axis=1).astype(np.float64)
+
+
+class EnergyTransition(KernelTransition):
+    """
+    Description
+    -----------
+        Battery charge balance and bounded random walk of the price.
+    """
+
+    def __init__(self, sSpace, aSpace, capacity, numPrices, nSpace=None,
+                 jit=True):
+        super(EnergyTransition,self).__init__(
+            sSpace,aSpace,partial(energyTransitionKernel,capacity,numPrices),
+            jit,nSpace)
+        self.capacity = capacity
+        self.numPrices = numPrices
+
+
+class EnergyObjective(KernelObjective):
+    """
+    Description
+    -----------
+        Trading revenue minus wear cost.
+    """
+
+    def __init__(self, sSpace, aSpace, capacity, basePrice, wearCost,
+                 nSpace=None, jit=True):
+        super(EnergyObjective,self).__init__(
+            sSpace,aSpace,partial(energyObjectiveKernel,capacity,basePrice,
+                                  wearCost),jit,
+            isDeterministic=True,isMinCost=False,nSpace=nSpace)
+        self.capacity = capacity
+        self.basePrice = basePrice
+        self.wearCost = wearCost
+
+
+
+def makeEnergyStorage(dim=1, capacity=6, maxRate=2, numPrices=8,
+                      maxPriceMove=1, basePrice=1.0, wearCost=0.2,
+                      horizon=False, seed=None):
+    """
+    Inputs
+    ------
+        dim [int]: the number of batteries.
+
+        capacity [int]: the capacity of each battery.
+
+        maxRate [int]: the largest energy bought or sold per period.
+
+        numPrices [int]: the number of price levels.
+
+        maxPriceMove [int]: price moves are uniform on
+                            {-maxPriceMove, ..., maxPriceMove}.
+
+        basePrice [float]: the price of level 0.
+
+        wearCost [float]: the cost per unit of energy moved.
+
+        horizon [int]: the horizon, or False for an infinite horizon.
+
+        seed [int]: optional, the seed of the noise space.
+
+    Raises/Returns
+    --------------
+        [MDP]: the storage MDP, starting empty at the middle price.
+
+    Explanations
+    ------------
+        Builds a dim-battery energy arbitrage MDP on discrete cubes.
+    """
+
+    sSpace = Cube(np.vstack([[0,numPrices - 1],
+                             np.tile([0,capacity],(dim,1))]),
+                  isContinuous=False)
+    aSpace = Cube(np.tile([-maxRate,maxRate],(dim,1)),isContinuous=False)
+    nSpace = Cube(np.array([[-maxPriceMove,maxPriceMove]]),
+                  isContinuous=False,seed=seed)
+    initState = np.zeros(dim + 1,dtype=np.int64)
+    initState[0] = numPrices//2
+    return MDP(initState=initState,
+               sSpace=sSpace,
+               aSpace=aSpace,
+               nSpace=nSpace,
+               transition=EnergyTransition(sSpace,aSpace,capacity,numPrices,
+                                           nSpace),
+               objective=EnergyObjective(sSpace,aSpace,capacity,basePrice,
+                                         wearCost,nSpace),
+               isFiniteHorizon=horizon)
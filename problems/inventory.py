@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+GitHub Homepage
+----------------
+    https://github.com/ADP-Benchmarks
+
+Contact information
+-------------------
+    ADP.Benchmarks@gmail.com.
+
+License
+-------
+    The MIT License
+"""
+
+import numpy as np
+from functools import partial
+from MDP.spaces.cube import Cube
+from MDP.MDP import MDP
+from MDP.kernels import KernelTransition, KernelObjective
+
+"""
+Explanations
+------------
+    Multi-product inventory control with joint replenishment and lost
+    sales. The state is the stock of each of the dim products, the action
+    the order quantities and the noise the demands, all integers. Orders
+    are delivered immediately up to the storage capacity and unmet demand
+    is lost:
+        s' = max(min(s + a, capacity) - w, 0)
+    The cost is a fixed ordering cost paid whenever any product is
+    ordered, plus per-unit ordering, holding and lost-sales costs.
+"""
+
+def inventoryTransitionKernel(capacity, states, actions, noise):
+    """
+    Returns the next stocks, see the module explanations.
+    """
+    stock = np.minimum(states + actions,capacity)
+    return np.maximum(stock - noise,0)
+
+def inventoryObjectiveKernel(capacity, fixedCost, orderCost, holdingCost,
+                             lostSalesCost, states, actions, noise):
+    """
+    Returns the period costs, see InventoryObjective.
+    """
+    stock = np.minimum(states + actions,capacity)
+    left = np.maximum(stock - noise,0)
+    lost = np.maximum(noise - stock,0)
+    return (fixedCost*(np.sum(actions > 0,axis=1) > 0)
+            + np.sum(orderCost*actions + holdingCost*left
+                     + lostSalesCost*lost,axis=1))
+
+
+class InventoryTransition(KernelTransition):
+    """
+    Description
+    -----------
+        Lost-sales inventory balance equation.
+    """
+
+    def __init__(self, sSpace, aSpace, capacity, nSpace=None, jit=True):
+        super(InventoryTransition,self).__init__(
+            sSpace,aSpace,partial(inventoryTransitionKernel,capacity),jit,
+            nSpace)
+        self.capacity = capacity
+
+
+class InventoryObjective(KernelObjective):
+    """
+    Description
+    -----------
+        Joint replenishment cost: fixedCost if anything is ordered, plus
+        orderCost per ordered unit, holdingCost per unit left in stock and
+        lostSalesCost per unit of unmet demand.
+    """
+
+    def __init__(self, sSpace, aSpace, capacity, fixedCost, orderCost,
+                 holdingCost, lostSalesCost, nSpace=None, jit=True):
+        super(InventoryObjective,self).__init__(
+            sSpace,aSpace,partial(inventoryObjectiveKernel,capacity,fixedCost,
+                                  orderCost,holdingCost,lostSalesCost),jit,
+            isDeterministic=False,isMinCost=True,nSpace=nSpace)
+        self.capacity = capacity
+        self.fixedCost = fixedCost
+        self.orderCost = orderCost
+        self.holdingCost = holdingCost
+        self.lostSalesCost = lostSalesCost
+
+
+
+def makeInventory(dim=1, capacity=10, maxOrder=5, maxDemand=4, fixedCost=4.0,
+                  orderCost=2.0, holdingCost=1.0, lostSalesCost=6.0,
+                  horizon=False, seed=None):
+    """
+    Inputs
+    ------
+        dim [int]: the number of products.
+
+        capacity [int]: the storage capacity of each product.
+
+        maxOrder [int]: the largest order quantity of each product.
+
+        maxDemand [int]: demands are uniform on {0, ..., maxDemand}.
+
+        fixedCost, orderCost, holdingCost, lostSalesCost [float]: the
+            cost parameters.
+
+        horizon [int]: the horizon, or False for an infinite horizon.
+
+        seed [int]: optional, the seed of the noise space.
+
+    Raises/Returns
+    --------------
+        [MDP]: the inventory MDP, starting with empty stocks.
+
+    Explanations
+    ------------
+        Builds a dim-product inventory control MDP on discrete cubes.
+    """
+
+    sSpace = Cube(np.tile([0,capacity],(dim,1)),isContinuous=False)
+    aSpace = Cube(np.tile([0,maxOrder],(dim,1)),isContinuous=False)
+    nSpace = Cube(np.tile([0,maxDemand],(dim,1)),isContinuous=False,
+                  seed=seed)
+    return MDP(initState=np.zeros(dim,dtype=np.int64),
+               sSpace=sSpace,
+               aSpace=aSpace,
+               nSpace=nSpace,
+               transition=InventoryTransition(sSpace,aSpace,capacity,nSpace),
+               objective=InventoryObjective(sSpace,aSpace,capacity,fixedCost,
+                                            orderCost,holdingCost,
+                                            lostSalesCost,nSpace),
+               isFiniteHorizon=horizon)
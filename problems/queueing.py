@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+GitHub Homepage
+----------------
+    https://github.com/ADP-Benchmarks
+
+Contact information
+-------------------
+    ADP.Benchmarks@gmail.com.
+
+License
+-------
+    The MIT License
+"""
+
+import numpy as np
+from functools import partial
+from MDP.spaces.cube import Cube
+from MDP.MDP import MDP
+from MDP.kernels import KernelTransition, KernelObjective
+
+"""
+Explanations
+------------
+    Admission control of dim parallel finite-buffer queues in discrete
+    time. The state is the queue lengths and the action whether each queue
+    admits its arrivals (0 or 1). In every period, each queue completes a
+    service with probability serviceProbs, then receives an arrival with
+    probability arrivalProbs. The noise holds one uniform integer in
+    {0, ..., resolution - 1} per event, an event occurring when its integer
+    is below probability*resolution:
+        q' = min(max(q - served, 0) + admit*arrived, buffer)
+    The reward of each admitted job is paid on admission, and every job
+    in the system costs holdingCost per period.
+"""
+
+def queueingTransitionKernel(buffer, arrivalThresholds, serviceThresholds,
+                             states, actions, noise):
+    """
+    Returns the next queue lengths, see the module explanations.
+    """
+    dim = states.shape[1]
+    served = noise[:,dim:] < serviceThresholds
+    arrived = noise[:,:dim] < arrivalThresholds
+    remaining = np.maximum(states - served,0)
+    admitted = (actions*arrived)*(remaining < buffer)
+    return remaining + admitted
+
+def queueingObjectiveKernel(buffer, arrivalThresholds, serviceThresholds,
+                            admissionReward, holdingCost, states, actions,
+                            noise):
+    """
+    Returns the period rewards, see QueueingObjective.
+    """
+    # Same events as queueingTransitionKernel, inlined so that both kernels
+    # can be compiled
+    dim = states.shape[1]
+    served = noise[:,dim:] < serviceThresholds
+    arrived = noise[:,:dim] < arrivalThresholds
+    remaining = np.maximum(states - served,0)
+    admitted = (actions*arrived)*(remaining < buffer)
+    return np.sum(admissionReward*admitted
+                  - holdingCost*(remaining + admitted),axis=1)
+
+
+class QueueingTransition(KernelTransition):
+    """
+    Description
+    -----------
+        Queue length dynamics under admission control.
+    """
+
+    def __init__(self, sSpace, aSpace, buffer, arrivalThresholds,
+                 serviceThresholds, nSpace=None, jit=True):
+        super(QueueingTransition,self).__init__(
+            sSpace,aSpace,partial(queueingTransitionKernel,buffer,
+                                  arrivalThresholds,serviceThresholds),jit,
+            nSpace)
+        self.buffer = buffer
+        self.arrivalThresholds = arrivalThresholds
+        self.serviceThresholds = serviceThresholds
+
+
+class QueueingObjective(KernelObjective):
+    """
+    Description
+    -----------
+        Admission rewards minus holding costs.
+    """
+
+    def __init__(self, sSpace, aSpace, buffer, arrivalThresholds,
+                 serviceThresholds, admissionReward, holdingCost,
+                 nSpace=None, jit=True):
+        admissionReward = np.broadcast_to(np.asarray(admissionReward,
+                                                     dtype=float),
+                                          (sSpace.dim,)).copy()
+        super(QueueingObjective,self).__init__(
+            sSpace,aSpace,partial(queueingObjectiveKernel,buffer,
+                                  arrivalThresholds,serviceThresholds,
+                                  admissionReward,holdingCost),jit,
+            isDeterministic=False,isMinCost=False,nSpace=nSpace)
+        self.buffer = buffer
+        self.arrivalThresholds = arrivalThresholds
+        self.serviceThresholds = serviceThresholds
+        self.admissionReward = admissionReward
+        self.holdingCost = holdingCost
+
+
+
+def makeQueueing(dim=1, buffer=8, arrivalProbs=0.6, serviceProbs=0.5,
+                 admissionReward=4.0, holdingCost=1.0, resolution=10,
+                 horizon=False, seed=None):
+    """
+    Inputs
+    ------
+        dim [int]: the number of queues.
+
+        buffer [int]: the buffer size of each queue.
+
+        arrivalProbs [float or ndarray]: the arrival probability of each
+                                         queue, a multiple of 1/resolution.
+
+        serviceProbs [float or ndarray]: the service probability of each
+                                         queue, a multiple of 1/resolution.
+
+        admissionReward [float or ndarray]: the reward per admitted job.
+
+        holdingCost [float]: the cost per job and period.
+
+        resolution [int]: the number of values of each noise component.
+
+        horizon [int]: the horizon, or False for an infinite horizon.
+
+        seed [int]: optional, the seed of the noise space.
+
+    Raises/Returns
+    --------------
+        [MDP]: the admission control MDP, starting with empty queues.
+
+    Explanations
+    ------------
+        Builds a dim-queue admission control MDP on discrete cubes.
+    """
+
+    arrivalThresholds = np.round(np.broadcast_to(arrivalProbs,(dim,))
+                                 *resolution).astype(np.int64)
+    serviceThresholds = np.round(np.broadcast_to(serviceProbs,(dim,))
+                                 *resolution).astype(np.int64)
+    sSpace = Cube(np.tile([0,buffer],(dim,1)),isContinuous=False)
+    aSpace = Cube(np.tile([0,1],(dim,1)),isContinuous=False)
+    nSpace = Cube(np.tile([0,resolution - 1],(2*dim,1)),isContinuous=False,
+                  seed=seed)
+    return MDP(initState=np.zeros(dim,dtype=np.int64),
+               sSpace=sSpace,
+               aSpace=aSpace,
+               nSpace=nSpace,
+               transition=QueueingTransition(sSpace,aSpace,buffer,
+                                             arrivalThresholds,
+                                             serviceThresholds,nSpace),
+               objective=QueueingObjective(sSpace,aSpace,buffer,
+                                           arrivalThresholds,
+                                           serviceThresholds,
+                                           admissionReward,holdingCost,
+                                           nSpace),
+               isFiniteHorizon=horizon)
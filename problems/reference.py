@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+GitHub Homepage
+----------------
+    https://github.com/ADP-Benchmarks
+
+Contact information
+-------------------
+    ADP.Benchmarks@gmail.com.
+
+License
+-------
+    The MIT License
+"""
+
+import json
+import os
+import numpy as np
+from MDP.tabular import compileMDP
+from solvers.exact import policyIteration, backwardInduction
+from problems.inventory import makeInventory
+from problems.energy import makeEnergyStorage
+from problems.queueing import makeQueueing
+from problems.assetSelling import makeAssetSelling, terminalValues
+
+"""
+Explanations
+------------
+    Registry of small benchmark instances and their optimal values from the
+    initial state, computed exactly by compiling the MDPs and solving them
+    with policy iteration (infinite horizon) or backward induction (finite
+    horizon). The values are cached in references.json next to this file,
+    regenerate it after changing an instance with:
+        python -m problems.reference
+"""
+
+PROBLEMS = {'inventory': makeInventory,
+            'energyStorage': makeEnergyStorage,
+            'queueing': makeQueueing,
+            'assetSelling': makeAssetSelling}
+
+INSTANCES = {
+    'inventory-1': {'problem': 'inventory','discount': 0.95,
+                    'params': {'dim': 1}},
+    'inventory-2': {'problem': 'inventory','discount': 0.95,
+                    'params': {'dim': 2,'capacity': 6,'maxOrder': 3,
+                               'maxDemand': 3}},
+    'energyStorage-1': {'problem': 'energyStorage','discount': 0.95,
+                        'params': {'dim': 1}},
+    'energyStorage-2': {'problem': 'energyStorage','discount': 0.95,
+                        'params': {'dim': 2,'capacity': 4,'maxRate': 1}},
+    'queueing-1': {'problem': 'queueing','discount': 0.95,
+                   'params': {'dim': 1}},
+    'queueing-2': {'problem': 'queueing','discount': 0.95,
+                   'params': {'dim': 2,'buffer': 5,
+                              'arrivalProbs': [0.6,0.3],
+                              'admissionReward': [4.0,6.0]}},
+    'assetSelling-1': {'problem': 'assetSelling','discount': 1.0,
+                       'params': {'dim': 1}},
+    'assetSelling-2': {'problem': 'assetSelling','discount': 1.0,
+                       'params': {'dim': 2,'numPrices': 6,'horizon': 6}},
+}
+
+CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                     'references.json')
+
+def makeProblem(name, seed=None):
+    """
+    Inputs
+    ------
+        name [str]: an instance of INSTANCES.
+
+        seed [int]: optional, the seed of the noise space.
+
+    Raises/Returns
+    --------------
+        [MDP]: the MDP of the instance.
+
+    Explanations
+    ------------
+        Builds a registered instance.
+    """
+    assert(name in INSTANCES),"Unknown instance " + name
+    instance = INSTANCES[name]
+    return PROBLEMS[instance['problem']](seed=seed,**instance['params'])
+
+def computeReference(name):
+    """
+    Inputs
+    ------
+        name [str]: an instance of INSTANCES.
+
+    Raises/Returns
+    --------------
+        [dict]: 'value' the optimal value of the initial state, with the
+                'problem', 'params', 'discount', 'horizon', 'solver',
+                'numStates' and 'numActions' of the instance.
+
+    Explanations
+    ------------
+        Solves the instance exactly. Finite horizon instances are solved
+        by backward induction over the horizon of the MDP, the others by
+        policy iteration.
+    """
+    instance = INSTANCES[name]
+    mdp = makeProblem(name)
+    model = compileMDP(mdp)
+    key = int(mdp.sSpace.encode(np.asarray(mdp.initState)))
+    if mdp.isFiniteHorizon:
+        terminal = (terminalValues(mdp) if instance['problem'] ==
+                    'assetSelling' else None)
+        V,_,_ = backwardInduction(model,mdp.isFiniteHorizon,terminal,
+                                  instance['discount'])
+        value,solver = V[0,key],'backwardInduction'
+    else:
+        V,_,_ = policyIteration(model,instance['discount'])
+        value,solver = V[key],'policyIteration'
+    return {'problem': instance['problem'],
+            'params': instance['params'],
+            'discount': instance['discount'],
+            'horizon': mdp.isFiniteHorizon or None,
+            'solver': solver,
+            'numStates': model.numStates,
+            'numActions': model.numActions,
+            'value': float(value)}
+
+def loadReferences():
+    """
+    Returns the cached references, an empty dict without cache file.
+    """
+    if not os.path.exists(CACHE):
+        return {}
+    with open(CACHE) as f:
+        return json.load(f)
+
+def referenceValue(name):
+    """
+    Inputs
+    ------
+        name [str]: an instance of INSTANCES.
+
+    Raises/Returns
+    --------------
+        [float]: the optimal value of the initial state.
+
+    Explanations
+    ------------
+        Reads the cached value, or recomputes it when the cache is missing
+        or was built for other parameters.
+    """
+    assert(name in INSTANCES),"Unknown instance " + name
+    cached = loadReferences().get(name)
+    instance = INSTANCES[name]
+    if (cached is None or cached['params'] != instance['params']
+            or cached['discount'] != instance['discount']):
+        cached = computeReference(name)
+    return cached['value']
+
+def writeReferences(names=None):
+    """
+    Inputs
+    ------
+        names [list]: optional, the instances to recompute, all by default.
+
+    Raises/Returns
+    --------------
+        [dict]: the references written.
+
+    Explanations
+    ------------
+        Recomputes references and updates the cache file.
+    """
+    references = loadReferences()
+    for name in (names or INSTANCES):
+        references[name] = computeReference(name)
+    with open(CACHE,'w') as f:
+        json.dump(references,f,indent=2,sort_keys=True)
+    return references
+
+
+if __name__ == "__main__":
+    for name,reference in writeReferences().items():
+        print('%-16s %12.6f  (%d states, %d actions)' % (
+              name,reference['value'],reference['numStates'],
+              reference['numActions']))
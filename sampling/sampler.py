@@ -19,17 +19,189 @@ import numpy as np
 # from scipy.stats import uniform
 
 
-class CubeSampler():
+class Sampler():
+    """
+    Description
+    -----------
+        This class provides the block-buffered sampling machinery shared by
+        the space samplers. Samples are drawn blockSize at a time from a
+        private np.random.Generator and handed out as consecutive slices of
+        the current block.
+
+        The points of the unit hypercube underlying each block are generated
+        by one of the following methods:
+            'uniform': i.i.d. uniform draws.
+            'lhs':     Latin hypercube sampling, one stratum per sample and
+                       dimension within each block.
+            'sobol':   scrambled Sobol sequence.
+            'halton':  scrambled Halton sequence.
+        The quasi-Monte Carlo methods ('sobol', 'halton') require scipy.
+        Subclasses set unitDim, the dimension of the unit hypercube, before
+        calling the constructor. Quasi-Monte Carlo blocks are consumed
+        entirely: the rows left in a block are handed out before the next
+        block, so that no point of the sequence is skipped. The Sobol block
+        size is rounded up to a power of 2, as required by the balance
+        properties of the sequence.
+    """
+    methods = ('uniform','lhs','sobol','halton')
+
+    def __init__(self,blockSize=1024,seed=None,method='uniform'):
+        """
+        Inputs
+        ------
+            blockSize [int]: the number of samples pre-drawn at once, rounded
+                             up to a power of 2 for 'sobol'.
+
+            seed [int, SeedSequence or Generator]: optional, the seed of the
+                                                   private random generator.
+
+            method [str]: the sampling method, one of Sampler.methods.
+
+        Raises/Returns
+        --------------
+
+        Explanations
+        ------------
+            The constructor of Sampler object.
+        """
+
+        assert(isinstance(blockSize,int) and blockSize > 0),"Block size\
+        should be a positive integer"
+        assert(method in self.methods),"Unknown sampling method"
+
+        if method == 'sobol':
+            blockSize = 1 << (blockSize - 1).bit_length()
+        self.blockSize = blockSize
+        self.method = method
+        self.seed(seed)
+
+    def seed(self,seed=None):
+        """
+        Inputs
+        ------
+            seed [int, SeedSequence or Generator]: the new seed.
+
+        Raises/Returns
+        --------------
+
+        Explanations
+        ------------
+            Re-creates the random generator and discards the buffered block.
+            Quasi-Monte Carlo sequences restart with a new scrambling.
+        """
+
+        self.rng = np.random.default_rng(seed)
+        self.buffer = None
+        self.pos = 0
+        if self.method == 'sobol':
+            from scipy.stats import qmc
+            self.engine = qmc.Sobol(d=self.unitDim,scramble=True,seed=self.rng)
+        elif self.method == 'halton':
+            from scipy.stats import qmc
+            self.engine = qmc.Halton(d=self.unitDim,scramble=True,seed=self.rng)
+        else:
+            self.engine = None
+
+    def unitSample(self,numSamples):
+        """
+        Inputs
+        ------
+            numSamples [int]: the number of samples.
+
+        Raises/Returns
+        --------------
+            [ndarray]: (numSamples, unitDim) array of points in [0,1)^unitDim.
+
+        Explanations
+        ------------
+            Generates points of the unit hypercube with the sampling method.
+        """
+
+        if self.method == 'uniform':
+            return self.rng.random((numSamples,self.unitDim))
+        elif self.method == 'lhs':
+            strata = self.rng.permuted(np.tile(np.arange(numSamples),
+                                               (self.unitDim,1)),axis=1).T
+            return (strata + self.rng.random((numSamples,self.unitDim))
+                    )/numSamples
+        else:
+            return self.engine.random(numSamples)
+
+    def drawBlock(self,numSamples):
+        """
+        Inputs
+        ------
+            numSamples [int]: the number of samples.
+
+        Raises/Returns
+        --------------
+            [ndarray]: (numSamples, dim) array of fresh samples.
+
+        Explanations
+        ------------
+            Draws samples directly from the random generator.
+        """
+        raise NotImplementedError
+
+    def sample(self,numSamples=1):
+        """
+        Inputs
+        ------
+            numSamples [int]: the number of samples.
+
+        Raises/Returns
+        --------------
+            [ndarray]: (numSamples, dim) array of samples.
+
+        Explanations
+        ------------
+            Hands out the next numSamples rows of the current block and draws
+            a new block once the current one is exhausted. With the
+            quasi-Monte Carlo methods, the rows left in the current block are
+            followed by as many whole new blocks as needed. Otherwise,
+            requests larger than blockSize bypass the buffer and the rows
+            left are dropped. A new block is a new array, so previously
+            returned slices are never overwritten.
+        """
+
+        if self.buffer is None or self.pos + numSamples > self.buffer.shape[0]:
+            if self.engine is not None:
+                blocks = ([] if self.buffer is None
+                          else [self.buffer[self.pos:]])
+                available = sum(block.shape[0] for block in blocks)
+                while available < numSamples:
+                    blocks.append(self.drawBlock(self.blockSize))
+                    available += self.blockSize
+                self.buffer = (blocks[0] if len(blocks) == 1
+                               else np.concatenate(blocks))
+            elif numSamples > self.blockSize:
+                return self.drawBlock(numSamples)
+            else:
+                self.buffer = self.drawBlock(self.blockSize)
+            self.pos = 0
+        sample = self.buffer[self.pos:self.pos + numSamples]
+        self.pos += numSamples
+        return sample
+
+
+class CubeSampler(Sampler):
     """
     Description
     -----------
         This class provides an implementation of a uniform sampling from a hypercube.
     """     
-    def __init__(self,cube):
+    def __init__(self,cube,blockSize=1024,seed=None,method='uniform'):
         """
         Inputs
         ------
             cube [Cube]: a Cube object
+
+            blockSize [int]: the number of samples pre-drawn at once.
+
+            seed [int, SeedSequence or Generator]: optional, the seed of the
+                                                   private random generator.
+
+            method [str]: the sampling method, one of Sampler.methods.
                 
         Raises/Returns
         --------------
@@ -45,9 +217,11 @@ class CubeSampler():
         self.dim       = cube.dim
         self.shape = cube.shape
         self.isContinuous = cube.isContinuous
+        self.unitDim = self.shape[0]
+        super(CubeSampler,self).__init__(blockSize,seed,method)
         
     
-    def sample(self,numSamples=1):
+    def drawBlock(self,numSamples):
         """
         Inputs
         ------
@@ -55,50 +229,51 @@ class CubeSampler():
             
         Raises/Returns
         --------------
-            [list]: a list of samples from the hypercube. 
+            [ndarray]: (numSamples, dim) array of samples from the hypercube.
             
         Explanations
         ------------
             This function samples a batch of uniform points in a hypercube.
+            Discrete hypercubes are sampled uniformly over the integer points
+            of [low, high], bounds included.
         """ 
         
-        '''
-        TODO: 
-            shall we consider latin hypercube sampling? it is more uniformly distributed in high dimesion.
-        '''
+        if self.method != 'uniform':
+            u = self.unitSample(numSamples)
+            if self.isContinuous:
+                return self.low + (self.high - self.low)*u
+            else:
+                sample = self.low + np.floor((self.high - self.low + 1)*u)
+                return np.minimum(sample,self.high).astype('int32')
         
-        sample = np.random.uniform(low=self.low, 
-                                   high=self.high,
-                                   size=(numSamples,self.shape[0])) 
         if self.isContinuous:
-            # return np.asarray([list(uniform(self.intervals[i][0],
-            #                               self.intervals[i][1]).rvs(numSamples))
-            #                 for i in range(self.dim)]
-            #                 ).T
-            
-            # vectorized sampling
-            # widths = self.high - self.low
-            # return self.low + widths*np.random.uniform(
-            #                               size=(numSamples, self.shape[0]))
-            return sample
-        
+            return self.rng.uniform(low=self.low,
+                                    high=self.high,
+                                    size=(numSamples,self.shape[0]))
         else:
+            return self.rng.integers(low=self.low,
+                                     high=self.high,
+                                     size=(numSamples,self.shape[0]),
+                                     endpoint=True).astype('int32')
 
-            sample = np.floor(sample)
-
-            return sample.astype('int32')            
-
-class BallSampler():
+class BallSampler(Sampler):
     """
     Description
     -----------
         This class provides an implementation of a uniform sampling from a ball.
     """      
-    def __init__(self, ball):
+    def __init__(self,ball,blockSize=1024,seed=None,method='uniform'):
         """
         Inputs
         ------
             ball [Ball]: a Ball object
+
+            blockSize [int]: the number of samples pre-drawn at once.
+
+            seed [int, SeedSequence or Generator]: optional, the seed of the
+                                                   private random generator.
+
+            method [str]: the sampling method, one of Sampler.methods.
                 
         Raises/Returns
         --------------
@@ -113,8 +288,13 @@ class BallSampler():
         self.dim = ball.dim
         self.shape = ball.shape
         self.isContinuous = ball.isContinuous
+        # Discrete balls draw one lattice point index per sample, the
+        # lattice index of the ball is only built on the first draw
+        self.ball = ball
+        self.unitDim = self.dim + 1 if self.isContinuous else 1
+        super(BallSampler,self).__init__(blockSize,seed,method)
     
-    def sample(self,numSamples):
+    def drawBlock(self,numSamples):
         """
         Inputs
         ------
@@ -122,13 +302,25 @@ class BallSampler():
             
         Raises/Returns
         --------------
-            [list]: a list of samples from the ball. 
+            [ndarray]: (numSamples, dim) array of samples from the ball.
             
         Explanations
         ------------
             This function samples a batch of uniform points in a ball.
+            Discrete balls are sampled exactly uniformly over their lattice
+            points by drawing integer indices and decoding them.
         """ 
         
+        if not self.isContinuous:
+            lattice = self.ball.lattice
+            numPoints = lattice.cardinality
+            if self.method == 'uniform':
+                index = self.rng.integers(numPoints,size=numSamples)
+            else:
+                index = np.minimum(np.floor(numPoints*self.unitSample(
+                                   numSamples)[:, 0]),numPoints - 1).astype(int)
+            return lattice.decode(index)
+        
         def random_vector_in_unit_ball():
             """
             Returns
@@ -138,19 +330,91 @@ class BallSampler():
             Explanations
             ------------
                 The algorithm is according to Theorem 1 of https://arxiv.org/pdf/math/0503650.pdf 
+                with z exponentially distributed with parameter 1/2.
             """
-            x = np.random.normal(loc=0.0, scale=1.0, size=(numSamples, self.dim))
-            z = np.random.exponential(scale=1.0, size=(numSamples,))
+            x = self.rng.normal(loc=0.0, scale=1.0, size=(numSamples, self.dim))
+            z = self.rng.exponential(scale=2.0, size=(numSamples,))
             d = (np.sum(np.square(x), axis=1) + z) ** 0.5
             d = d[:, np.newaxis]
             return x / d
         
-        unit_sample = random_vector_in_unit_ball()
-        sample = unit_sample * self.radius + self.center
-        if self.isContinuous:
-            return sample.tolist()
+        def unit_cube_to_unit_ball():
+            """
+            Returns
+            --------------
+                [ndarray] numSamples points in a unit ball.
+            
+            Explanations
+            ------------
+                Maps points of the (dim+1)-dimensional unit hypercube to the
+                unit ball: the first dim coordinates give a direction through
+                the inverse normal CDF and the last one the radius u**(1/dim).
+                Low-discrepancy inputs give low-discrepancy outputs.
+            """
+            from scipy.special import ndtri
+            u = np.clip(self.unitSample(numSamples),1e-12,1.0 - 1e-12)
+            x = ndtri(u[:, :self.dim])
+            r = u[:, self.dim] ** (1.0/self.dim)
+            return x / np.linalg.norm(x, axis=1)[:, np.newaxis] * r[:, np.newaxis]
+        
+        if self.method == 'uniform':
+            unit_sample = random_vector_in_unit_ball()
+        else:
+            unit_sample = unit_cube_to_unit_ball()
+        return unit_sample * self.radius + self.center
+
+class FiniteSetSampler(Sampler):
+    """
+    Description
+    -----------
+        This class provides an implementation of a uniform sampling from a
+        finite set of points.
+    """
+    def __init__(self,finiteSet,blockSize=1024,seed=None,method='uniform'):
+        """
+        Inputs
+        ------
+            finiteSet [FiniteSet]: a FiniteSet object
+
+            blockSize [int]: the number of samples pre-drawn at once.
+
+            seed [int, SeedSequence or Generator]: optional, the seed of the
+                                                   private random generator.
+
+            method [str]: the sampling method, one of Sampler.methods.
+
+        Raises/Returns
+        --------------
+
+        Explanations
+        ------------
+            The constructor of FiniteSetSampler object.
+        """
+
+        self.points = finiteSet.points
+        self.unitDim = 1
+        super(FiniteSetSampler,self).__init__(blockSize,seed,method)
+
+    def drawBlock(self,numSamples):
+        """
+        Inputs
+        ------
+            numSamples [int]: the number of samples.
+
+        Raises/Returns
+        --------------
+            [ndarray]: (numSamples, dim) array of points of the set.
+
+        Explanations
+        ------------
+            This function samples a batch of points uniformly from the set,
+            by drawing integer indices.
+        """
+
+        numPoints = self.points.shape[0]
+        if self.method == 'uniform':
+            index = self.rng.integers(numPoints,size=numSamples)
         else:
-            sample_center_zero = sample - self.center
-            sample_center_zero_discrete = sample_center_zero.astype(int) # remove the decimal directly
-            sample_discrete = sample_center_zero_discrete + self.center
-            return sample_discrete
\ No newline at end of file
+            index = np.minimum(np.floor(numPoints*self.unitSample(
+                               numSamples)[:, 0]),numPoints - 1).astype(int)
+        return self.points[index]
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+GitHub Homepage
+----------------
+    https://github.com/ADP-Benchmarks
+
+Contact information
+-------------------
+    ADP.Benchmarks@gmail.com.
+
+License
+-------
+    The MIT License
+"""
+
+import numpy as np
+
+class ScenarioStore():
+    """
+    Description
+    -----------
+        This class stores pre-generated exogenous noise paths, that is a
+        (numEpisodes, horizon, nDim) array. Replaying the same paths for
+        several policies gives common random numbers and removes sampling
+        from policy evaluation. Stores can be kept in a .npy file that is
+        memory-mapped on load.
+    """
+
+    def __init__(self, paths):
+        """
+        Inputs
+        ------
+            paths [ndarray]: (numEpisodes, horizon, nDim) array or memmap
+                             of noise paths.
+
+        Raises/Returns
+        --------------
+
+        Explanations
+        ------------
+            The constructor of ScenarioStore object.
+        """
+
+        assert(paths.ndim == 3),"paths should be a (numEpisodes, horizon,\
+        nDim) array"
+
+        self.paths = paths
+        self.numEpisodes, self.horizon, self.nDim = paths.shape
+
+    @classmethod
+    def generate(cls, nSpace, numEpisodes, horizon, filename=None,
+                 dtype=None, seed=None):
+        """
+        Inputs
+        ------
+            nSpace [Space]: the MDP exogenous noise space.
+
+            numEpisodes [int]: the number of noise paths.
+
+            horizon [int]: the length of each path.
+
+            filename [str]: optional, the .npy file the paths are written to.
+                            If not provided, the paths are kept in memory.
+
+            dtype [dtype]: optional, the storage type, e.g. 'float32' for a
+                           compact store. Defaults to the sample type.
+
+            seed [int, SeedSequence or Generator]: optional, re-seeds nSpace
+                                                   before sampling.
+
+        Raises/Returns
+        --------------
+            [ScenarioStore]: the generated store.
+
+        Explanations
+        ------------
+            Samples numEpisodes paths of length horizon from nSpace, one
+            episode block at a time.
+        """
+
+        assert(isinstance(numEpisodes,int) and numEpisodes > 0)
+        assert(isinstance(horizon,int) and horizon > 0)
+
+        if seed is not None:
+            nSpace.seed(seed)
+        first = np.asarray(nSpace.sample(horizon))
+        dtype = first.dtype if dtype is None else np.dtype(dtype)
+        shape = (numEpisodes,horizon,nSpace.dim)
+        if filename is None:
+            paths = np.empty(shape,dtype=dtype)
+        else:
+            paths = np.lib.format.open_memmap(filename,mode='w+',
+                                              dtype=dtype,shape=shape)
+        paths[0] = first
+        for episode in range(1,numEpisodes):
+            paths[episode] = nSpace.sample(horizon)
+        if filename is not None:
+            paths.flush()
+        return cls(paths)
+
+    @classmethod
+    def load(cls, filename, mmap=True):
+        """
+        Inputs
+        ------
+            filename [str]: the .npy file written by generate.
+
+            mmap [bool]: if True, the file is memory-mapped read-only, else
+                         it is read into memory.
+
+        Raises/Returns
+        --------------
+            [ScenarioStore]: the loaded store.
+
+        Explanations
+        ------------
+            Loads a store written by generate.
+        """
+
+        return cls(np.load(filename,mmap_mode='r' if mmap else None))
+
+    def path(self, episode):
+        """
+        Inputs
+        ------
+            episode [int]: the scenario index.
+
+        Raises/Returns
+        --------------
+            [ndarray]: (horizon, nDim) noise path of the scenario.
+
+        Explanations
+        ------------
+            Returns one noise path, without copying.
+        """
+
+        return self.paths[episode]
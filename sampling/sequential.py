@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+GitHub Homepage
+----------------
+    https://github.com/ADP-Benchmarks
+
+Contact information
+-------------------
+    ADP.Benchmarks@gmail.com.
+
+License
+-------
+    The MIT License
+"""
+
+from statistics import NormalDist
+import numpy as np
+
+class RunningMoments():
+    """
+    Description
+    -----------
+        This class keeps the running count, mean and sum of squared
+        deviations of a stream of (possibly vector) observations. Batches
+        are merged with the pairwise update of Chan et al., which is
+        numerically stable for large counts.
+    """
+
+    def __init__(self):
+        """
+        Inputs
+        ------
+
+        Raises/Returns
+        --------------
+
+        Explanations
+        ------------
+            The constructor of RunningMoments object.
+        """
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def update(self, batch):
+        """
+        Inputs
+        ------
+            batch [ndarray]: (n, ...) array of n observations.
+
+        Raises/Returns
+        --------------
+
+        Explanations
+        ------------
+            Merges the moments of the batch into the running moments.
+        """
+        batch = np.asarray(batch,dtype=float)
+        n = batch.shape[0]
+        if n == 0:
+            return
+        mean = batch.mean(axis=0)
+        m2 = np.sum(np.square(batch - mean),axis=0)
+        total = self.count + n
+        delta = mean - self.mean
+        self.mean = self.mean + delta*n/total
+        self.m2 = self.m2 + m2 + np.square(delta)*self.count*n/total
+        self.count = total
+
+    @property
+    def variance(self):
+        """
+        The unbiased sample variance.
+        """
+        if self.count < 2:
+            return np.zeros_like(self.mean)
+        return self.m2/(self.count - 1)
+
+    @property
+    def stdError(self):
+        """
+        The standard error of the mean.
+        """
+        if self.count == 0:
+            return np.zeros_like(self.mean)
+        return np.sqrt(self.variance/self.count)
+
+
+def sequentialMean(draw, absTol=None, relTol=None, confidence=0.95,
+                   initial=32, growth=2.0, maxSamples=65536):
+    """
+    Inputs
+    ------
+        draw [callable]: draw(n) returns a (n, ...) array of n independent
+                         observations.
+
+        absTol [float]: optional, the target half-width of the confidence
+                        interval.
+
+        relTol [float]: optional, the target half-width relative to the
+                        magnitude of the mean.
+
+        confidence [float]: the level of the confidence interval.
+
+        initial [int]: the size of the first batch, and the minimal number
+                       of samples.
+
+        growth [float]: each new batch grows the total number of samples
+                        by this factor.
+
+        maxSamples [int]: the sample budget.
+
+    Raises/Returns
+    --------------
+        [dict]: 'estimate' the mean, 'stdError' its standard error,
+                'numSamples' the number of samples used and 'converged'
+                whether the tolerance was met within the budget.
+
+    Explanations
+    ------------
+        Draws batches of geometrically growing size and stops once the
+        normal confidence interval half-width z*stdError is below absTol
+        or below relTol*|mean|, for every component of vector observations.
+        With both tolerances given, meeting either one suffices.
+    """
+
+    assert(absTol is not None or relTol is not None),"Set absTol or relTol"
+    assert(isinstance(initial,int) and initial > 1)
+    assert(growth > 1 and maxSamples >= initial)
+
+    z = NormalDist().inv_cdf(0.5 + confidence/2)
+    moments = RunningMoments()
+    n = initial
+    while True:
+        moments.update(draw(n))
+        halfWidth = z*moments.stdError
+        met = np.zeros(np.shape(halfWidth),dtype=bool)
+        if absTol is not None:
+            met |= halfWidth <= absTol
+        if relTol is not None:
+            met |= halfWidth <= relTol*np.abs(moments.mean)
+        converged = bool(np.all(met))
+        if converged or moments.count >= maxSamples:
+            break
+        n = min(int(np.ceil(moments.count*(growth - 1))),
+                maxSamples - moments.count)
+
+    estimate = moments.mean
+    stdError = moments.stdError
+    if np.ndim(estimate) == 0:
+        estimate,stdError = float(estimate),float(stdError)
+    return {'estimate': estimate,
+            'stdError': stdError,
+            'numSamples': moments.count,
+            'converged': converged}
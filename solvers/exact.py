@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+GitHub Homepage
+----------------
+    https://github.com/ADP-Benchmarks
+
+Contact information
+-------------------
+    ADP.Benchmarks@gmail.com.
+
+License
+-------
+    The MIT License
+"""
+
+import time
+import numpy as np
+
+"""
+Explanations
+------------
+    Exact dynamic programming solvers for compiled TabularModel objects.
+    Every solver works on costs internally; rewards of max-reward models
+    are negated on the way in and values on the way out. Policies are
+    (numStates,) arrays of action keys of the model action space, they can
+    be mapped to action vectors by model.aSpace.decode. Each solver returns
+    the values, the policy and a dict of iteration statistics. Policy
+    iteration requires scipy, imported on first use like the models.
+"""
+
+def _costs(model):
+    """
+    Returns the (numActions, numStates) costs with infeasible pairs at +inf,
+    and the sign mapping costs back to the model objective.
+    """
+    sign = 1.0 if model.isMinCost else -1.0
+    cost = np.where(model.actionMask,sign*model.C,np.inf)
+    return cost,sign
+
+def _qValues(model, cost, V, discount):
+    """
+    Returns the (numActions, numStates) Q-values cost + discount * P V.
+    """
+    PV = np.vstack([model.P[a] @ V for a in range(model.numActions)])
+    return cost + discount*PV
+
+def _policyMatrix(model, policy):
+    """
+    Returns the sparse transition matrix of policy, row i being row i of
+    P[policy[i]].
+    """
+    import scipy.sparse as sp
+    Ppi = sp.csr_matrix((model.numStates,model.numStates))
+    for a in range(model.numActions):
+        rows = (policy == a).astype(float)
+        if rows.any():
+            Ppi = Ppi + sp.diags(rows) @ model.P[a]
+    return Ppi.tocsr()
+
+def valueIteration(model, discount, tol=1e-8, maxIter=10000, V0=None):
+    """
+    Inputs
+    ------
+        model [TabularModel]: the compiled MDP.
+
+        discount [float]: the discount factor, in [0,1).
+
+        tol [float]: stops when the sup-norm change of V is below tol.
+
+        maxIter [int]: the maximum number of iterations.
+
+        V0 [ndarray]: optional, (numStates,) initial values.
+
+    Raises/Returns
+    --------------
+        V [ndarray]: (numStates,) optimal values.
+
+        policy [ndarray]: (numStates,) greedy action keys.
+
+        stats [dict]: 'iterations', 'residual', 'residuals' and 'time'.
+
+    Explanations
+    ------------
+        Discounted value iteration, each sweep being one sparse product per
+        action.
+    """
+
+    assert(0 <= discount < 1),"The discount factor should be in [0,1)"
+    start = time.perf_counter()
+    cost,sign = _costs(model)
+    V = np.zeros(model.numStates) if V0 is None else sign*np.asarray(V0,
+                                                                dtype=float)
+    residuals = []
+    for it in range(1,maxIter + 1):
+        Q = _qValues(model,cost,V,discount)
+        newV = Q.min(axis=0)
+        residuals.append(float(np.max(np.abs(newV - V))))
+        V = newV
+        if residuals[-1] < tol:
+            break
+    policy = _qValues(model,cost,V,discount).argmin(axis=0)
+    stats = {'iterations': it, 'residual': residuals[-1],
+             'residuals': residuals, 'time': time.perf_counter() - start}
+    return sign*V, policy, stats
+
+def policyIteration(model, discount, tol=1e-8, maxIter=1000, evalSweeps=None,
+                    policy0=None):
+    """
+    Inputs
+    ------
+        model [TabularModel]: the compiled MDP.
+
+        discount [float]: the discount factor, in [0,1).
+
+        tol [float]: for modified policy iteration, stops when the Bellman
+                     residual is below tol.
+
+        maxIter [int]: the maximum number of improvement steps.
+
+        evalSweeps [int]: if None, each policy is evaluated exactly by a
+                          sparse linear solve. Else, it is evaluated
+                          approximately by evalSweeps value updates
+                          (modified policy iteration).
+
+        policy0 [ndarray]: optional, (numStates,) initial action keys. The
+                           default is the first feasible action of each
+                           state.
+
+    Raises/Returns
+    --------------
+        V [ndarray]: (numStates,) values of the final policy.
+
+        policy [ndarray]: (numStates,) action keys.
+
+        stats [dict]: 'iterations', 'residual', 'residuals' and 'time'.
+
+    Explanations
+    ------------
+        (Modified) policy iteration. Exact policy iteration stops when the
+        greedy policy no longer changes.
+    """
+
+    assert(0 <= discount < 1),"The discount factor should be in [0,1)"
+    start = time.perf_counter()
+    cost,sign = _costs(model)
+    states = np.arange(model.numStates)
+    if policy0 is None:
+        policy = np.argmax(model.actionMask,axis=0)
+    else:
+        policy = np.asarray(policy0,dtype=np.int64)
+    V = np.zeros(model.numStates)
+    residuals = []
+    for it in range(1,maxIter + 1):
+        Ppi = _policyMatrix(model,policy)
+        cpi = cost[policy,states]
+        if evalSweeps is None:
+            import scipy.sparse as sp
+            from scipy.sparse.linalg import spsolve
+            V = spsolve(sp.identity(model.numStates,format='csc')
+                        - discount*Ppi.tocsc(),cpi)
+        else:
+            for _ in range(evalSweeps):
+                V = cpi + discount*(Ppi @ V)
+        Q = _qValues(model,cost,V,discount)
+        newPolicy = Q.argmin(axis=0)
+        # Keep the current action on ties to avoid cycling
+        keep = Q[policy,states] <= Q[newPolicy,states]
+        newPolicy[keep] = policy[keep]
+        residuals.append(float(np.max(np.abs(Q.min(axis=0) - V))))
+        stable = np.array_equal(newPolicy,policy)
+        policy = newPolicy
+        if (evalSweeps is None and stable) or (evalSweeps is not None
+                                               and residuals[-1] < tol):
+            break
+    stats = {'iterations': it, 'residual': residuals[-1],
+             'residuals': residuals, 'time': time.perf_counter() - start}
+    return sign*V, policy, stats
+
+def backwardInduction(model, horizon, terminalValues=None, discount=1.0):
+    """
+    Inputs
+    ------
+        model [TabularModel]: the compiled MDP.
+
+        horizon [int]: the number of periods.
+
+        terminalValues [ndarray]: optional, (numStates,) values at the end
+                                  of the horizon, zero by default.
+
+        discount [float]: the discount factor.
+
+    Raises/Returns
+    --------------
+        V [ndarray]: (horizon+1, numStates) optimal values, V[t] being the
+                     value-to-go from period t.
+
+        policy [ndarray]: (horizon, numStates) action keys of every period.
+
+        stats [dict]: 'iterations' and 'time'.
+
+    Explanations
+    ------------
+        Finite-horizon backward induction storing per-period policies.
+    """
+
+    assert(isinstance(horizon,int) and horizon > 0)
+    start = time.perf_counter()
+    cost,sign = _costs(model)
+    V = np.zeros((horizon + 1,model.numStates))
+    if terminalValues is not None:
+        V[horizon] = sign*np.asarray(terminalValues,dtype=float)
+    policy = np.zeros((horizon,model.numStates),dtype=np.int64)
+    for t in range(horizon - 1,-1,-1):
+        Q = _qValues(model,cost,V[t + 1],discount)
+        policy[t] = Q.argmin(axis=0)
+        V[t] = Q[policy[t],np.arange(model.numStates)]
+    stats = {'iterations': horizon, 'time': time.perf_counter() - start}
+    return sign*V, policy, stats
+
+def relativeValueIteration(model, tol=1e-8, maxIter=10000, refState=0,
+                           tau=1.0):
+    """
+    Inputs
+    ------
+        model [TabularModel]: the compiled MDP.
+
+        tol [float]: stops when the span of the change of the relative
+                     values is below tol.
+
+        maxIter [int]: the maximum number of iterations.
+
+        refState [int]: the key of the reference state, whose relative
+                        value is pinned to zero.
+
+        tau [float]: aperiodicity transformation factor in (0,1], the
+                     chain is replaced by tau*P + (1-tau)*I. Use tau < 1
+                     for periodic chains.
+
+    Raises/Returns
+    --------------
+        gain [float]: the optimal average cost/reward per period.
+
+        h [ndarray]: (numStates,) relative values.
+
+        policy [ndarray]: (numStates,) action keys.
+
+        stats [dict]: 'iterations', 'residual', 'residuals' and 'time'.
+
+    Explanations
+    ------------
+        Relative value iteration for average-cost MDPs.
+    """
+
+    assert(0 < tau <= 1)
+    start = time.perf_counter()
+    cost,sign = _costs(model)
+    h = np.zeros(model.numStates)
+    residuals = []
+    for it in range(1,maxIter + 1):
+        Q = _qValues(model,cost,h,tau) + (1.0 - tau)*h
+        Th = Q.min(axis=0)
+        diff = Th - h
+        residuals.append(float(np.max(diff) - np.min(diff)))
+        gain = Th[refState]
+        h = Th - gain
+        if residuals[-1] < tol:
+            break
+    Q = _qValues(model,cost,h,tau) + (1.0 - tau)*h
+    policy = Q.argmin(axis=0)
+    stats = {'iterations': it, 'residual': residuals[-1],
+             'residuals': residuals, 'time': time.perf_counter() - start}
+    return sign*gain, sign*tau*h, policy, stats
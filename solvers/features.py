@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+GitHub Homepage
+----------------
+    https://github.com/ADP-Benchmarks
+
+Contact information
+-------------------
+    ADP.Benchmarks@gmail.com.
+
+License
+-------
+    The MIT License
+"""
+
+from itertools import combinations_with_replacement
+import numpy as np
+
+class Features():
+    """
+    Description
+    -----------
+        This class provides a generic implementation of the basis functions
+        of a linear value function architecture V(s) = phi(s) . theta.
+    """
+
+    def __init__(self, numFeatures):
+        """
+        Inputs
+        ------
+            numFeatures [int]: the number of basis functions.
+
+        Raises/Returns
+        --------------
+
+        Explanations
+        ------------
+            The constructor of Features object.
+        """
+        self.numFeatures = numFeatures
+
+    def transform(self, states):
+        """
+        Inputs
+        ------
+            states [ndarray]: (..., dim) array of states.
+
+        Raises/Returns
+        --------------
+            [ndarray]: (..., numFeatures) array of basis function values.
+
+        Explanations
+        ------------
+            Evaluates the basis functions on a batch of states.
+        """
+        raise NotImplementedError
+
+    def evaluate(self, states, theta):
+        """
+        Inputs
+        ------
+            states [ndarray]: (..., dim) array of states.
+
+            theta [ndarray]: (numFeatures,) weights.
+
+        Raises/Returns
+        --------------
+            [ndarray]: (...) values phi(s) . theta.
+
+        Explanations
+        ------------
+            Evaluates the linear architecture. Subclasses with sparse
+            features override it to avoid building the feature matrix.
+        """
+        return self.transform(states) @ theta
+
+
+class PolynomialFeatures(Features):
+    """
+    Description
+    -----------
+        All monomials of the state components up to a total degree, the
+        constant included. States are first rescaled from [low, high] to
+        [-1, 1] to keep the least squares problems well conditioned.
+    """
+
+    def __init__(self, low, high, degree=2):
+        """
+        Inputs
+        ------
+            low [ndarray]: the lower bounds of the states, e.g. Cube.low.
+
+            high [ndarray]: the upper bounds of the states, e.g. Cube.high.
+
+            degree [int]: the maximal total degree.
+
+        Raises/Returns
+        --------------
+
+        Explanations
+        ------------
+            The constructor of PolynomialFeatures object.
+        """
+
+        self.low = np.atleast_1d(np.asarray(low,dtype=float))
+        self.high = np.atleast_1d(np.asarray(high,dtype=float))
+        dim = self.low.shape[0]
+        exponents = [np.zeros(dim,dtype=int)]
+        for d in range(1,degree + 1):
+            for combo in combinations_with_replacement(range(dim),d):
+                exponents.append(np.bincount(combo,minlength=dim))
+        self.exponents = np.array(exponents)
+        super(PolynomialFeatures,self).__init__(self.exponents.shape[0])
+
+    def transform(self, states):
+        x = 2.0*(np.asarray(states,dtype=float) - self.low)/(
+                 self.high - self.low) - 1.0
+        return np.prod(x[...,np.newaxis,:] ** self.exponents,axis=-1)
+
+
+class RBFFeatures(Features):
+    """
+    Description
+    -----------
+        Gaussian radial basis functions exp(-|s-c|^2/(2 width^2)) around
+        given centers, plus a constant.
+    """
+
+    def __init__(self, centers, width):
+        """
+        Inputs
+        ------
+            centers [ndarray]: (numCenters, dim) centers, e.g. sampled from
+                               the state space.
+
+            width [float]: the common width of the basis functions.
+
+        Raises/Returns
+        --------------
+
+        Explanations
+        ------------
+            The constructor of RBFFeatures object.
+        """
+
+        self.centers = np.asarray(centers,dtype=float)
+        self.width = width
+        super(RBFFeatures,self).__init__(self.centers.shape[0] + 1)
+
+    def transform(self, states):
+        states = np.asarray(states,dtype=float)
+        sqDist = (np.sum(np.square(states),axis=-1)[...,np.newaxis]
+                  - 2.0*states @ self.centers.T
+                  + np.sum(np.square(self.centers),axis=1))
+        rbf = np.exp(-np.maximum(sqDist,0.0)/(2.0*self.width ** 2))
+        ones = np.ones(states.shape[:-1] + (1,))
+        return np.concatenate([ones,rbf],axis=-1)
+
+
+class TileFeatures(Features):
+    """
+    Description
+    -----------
+        Tile coding: numTilings grids of numTiles cells per dimension over
+        [low, high], each shifted by a random fraction of a cell. Every
+        state activates exactly one binary feature per tiling.
+    """
+
+    def __init__(self, low, high, numTiles=8, numTilings=8, seed=None):
+        """
+        Inputs
+        ------
+            low [ndarray]: the lower bounds of the states.
+
+            high [ndarray]: the upper bounds of the states.
+
+            numTiles [int]: the number of cells per dimension of a grid.
+
+            numTilings [int]: the number of shifted grids.
+
+            seed [int]: optional, the seed of the grid shifts.
+
+        Raises/Returns
+        --------------
+
+        Explanations
+        ------------
+            The constructor of TileFeatures object.
+        """
+
+        self.low = np.atleast_1d(np.asarray(low,dtype=float))
+        self.high = np.atleast_1d(np.asarray(high,dtype=float))
+        self.numTiles = numTiles
+        self.numTilings = numTilings
+        dim = self.low.shape[0]
+        self.offsets = np.random.default_rng(seed).random((numTilings,dim))
+        # Shifted grids need one extra cell per dimension
+        self.tilesPerTiling = (numTiles + 1) ** dim
+        self.strides = (numTiles + 1) ** np.arange(dim - 1,-1,-1)
+        super(TileFeatures,self).__init__(numTilings*self.tilesPerTiling)
+
+    def active(self, states):
+        """
+        Returns the (..., numTilings) indices of the active features.
+        """
+        states = np.asarray(states,dtype=float)
+        x = (states - self.low)/(self.high - self.low)*self.numTiles
+        cells = np.floor(x[...,np.newaxis,:] + self.offsets).astype(np.int64)
+        cells = np.clip(cells,0,self.numTiles)
+        return (cells @ self.strides
+                + np.arange(self.numTilings)*self.tilesPerTiling)
+
+    def transform(self, states):
+        active = self.active(states)
+        phi = np.zeros(active.shape[:-1] + (self.numFeatures,))
+        np.put_along_axis(phi,active,1.0,axis=-1)
+        return phi
+
+    def evaluate(self, states, theta):
+        return np.sum(theta[self.active(states)],axis=-1)
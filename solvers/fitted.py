@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+GitHub Homepage
+----------------
+    https://github.com/ADP-Benchmarks
+
+Contact information
+-------------------
+    ADP.Benchmarks@gmail.com.
+
+License
+-------
+    The MIT License
+"""
+
+import time
+import numpy as np
+from solvers.lookahead import Lookahead
+
+class RecursiveLeastSquares():
+    """
+    Description
+    -----------
+        This class provides a block recursive least squares estimator of
+        linear weights theta, with an exponential forgetting factor. Each
+        update folds a batch of (features, targets) into the running
+        normal equations A theta = b, in information form, which stays
+        well conditioned for large batches.
+    """
+
+    def __init__(self, numFeatures, forgetting=1.0, ridge=1e-6):
+        """
+        Inputs
+        ------
+            numFeatures [int]: the number of weights.
+
+            forgetting [float]: the forgetting factor in (0,1], older
+                                batches are weighted by forgetting**age.
+
+            ridge [float]: the ridge regularization added to A.
+
+        Raises/Returns
+        --------------
+
+        Explanations
+        ------------
+            The constructor of RecursiveLeastSquares object.
+        """
+
+        assert(0 < forgetting <= 1)
+        self.theta = np.zeros(numFeatures)
+        self.A = np.zeros((numFeatures,numFeatures))
+        self.b = np.zeros(numFeatures)
+        self.forgetting = forgetting
+        self.ridge = ridge
+
+    def update(self, Phi, y):
+        """
+        Inputs
+        ------
+            Phi [ndarray]: (N, numFeatures) features of the batch.
+
+            y [ndarray]: (N,) targets of the batch.
+
+        Raises/Returns
+        --------------
+            [ndarray]: the updated weights.
+
+        Explanations
+        ------------
+            Discounts the past statistics, adds the batch and re-solves the
+            (numFeatures, numFeatures) normal equations.
+        """
+
+        self.A = self.forgetting*self.A + Phi.T @ Phi
+        self.b = self.forgetting*self.b + Phi.T @ y
+        self.theta = np.linalg.solve(self.A + self.ridge*np.eye(self.A.shape[0]),
+                                     self.b)
+        return self.theta
+
+
+class FittedValueIteration():
+    """
+    Description
+    -----------
+        This class provides fitted value iteration with a linear value
+        function architecture for discounted MDPs whose state spaces are
+        too large to enumerate. Every iteration samples states from sSpace,
+        computes sample-average Bellman targets over noise sampled from
+        nSpace with a batched Lookahead, and refits the weights by
+        regularized least squares or recursive least squares. Weights are
+        fitted to costs, i.e. to negated rewards of max-reward MDPs.
+    """
+
+    def __init__(self, mdp, features, discount, numStates=1024,
+                 numNoise=32, actions=None, numActions=64, ridge=1e-6,
+                 rls=None, maxBatch=2**20):
+        """
+        Inputs
+        ------
+            mdp [MDP]: the MDP.
+
+            features [Features]: the basis functions.
+
+            discount [float]: the discount factor, in [0,1).
+
+            numStates [int]: the number of sampled states per iteration.
+
+            numNoise [int]: the number of noise samples per state-action
+                            pair.
+
+            actions [ndarray]: optional, (numCandidates, aDim) candidate
+                               actions. Defaults to every action of a
+                               discrete action space, or numActions actions
+                               sampled from a continuous one.
+
+            numActions [int]: the number of sampled candidate actions.
+
+            ridge [float]: the ridge regularization of the least squares.
+
+            rls [RecursiveLeastSquares]: optional, if given the weights are
+                                         updated incrementally by it instead
+                                         of being refitted.
+
+            maxBatch [int]: the maximal number of transitions evaluated in
+                            one batched call.
+
+        Raises/Returns
+        --------------
+
+        Explanations
+        ------------
+            The constructor of FittedValueIteration object.
+        """
+
+        assert(0 <= discount < 1),"The discount factor should be in [0,1)"
+
+        self.mdp = mdp
+        self.features = features
+        self.discount = discount
+        self.numStates = numStates
+        self.numNoise = numNoise
+        self.ridge = ridge
+        self.rls = rls
+        self.sign = 1.0 if mdp.objective.isMinCost else -1.0
+        if actions is None:
+            if mdp.aSpace.isContinuous:
+                actions = np.asarray(mdp.aSpace.sample(numActions))
+            else:
+                actions = mdp.aSpace.enumerate()
+        self.actions = np.asarray(actions)
+        self.theta = np.zeros(features.numFeatures)
+        self.lookahead = Lookahead(mdp,valueFn=self.value,discount=discount,
+                                   numNoise=numNoise,actions=self.actions,
+                                   maxBatch=maxBatch)
+
+    def value(self, states):
+        """
+        Inputs
+        ------
+            states [ndarray]: (..., sDim) array of states.
+
+        Raises/Returns
+        --------------
+            [ndarray]: (...) approximate values.
+
+        Explanations
+        ------------
+            Evaluates the fitted value function.
+        """
+        return self.sign*self.features.evaluate(states,self.theta)
+
+    def greedyAction(self, states, numNoise=None):
+        """
+        Inputs
+        ------
+            states [ndarray]: (N, sDim) array of states.
+
+            numNoise [int]: optional, the number of noise samples.
+
+        Raises/Returns
+        --------------
+            [ndarray]: (N, aDim) greedy actions among the candidates.
+
+        Explanations
+        ------------
+            One-step greedy policy with respect to the fitted values.
+        """
+
+        noise = np.asarray(self.mdp.nSpace.sample(numNoise or self.numNoise))
+        return self.lookahead.best(states,noise)[0]
+
+    def iterate(self, numIter=50, tol=1e-6):
+        """
+        Inputs
+        ------
+            numIter [int]: the maximum number of iterations.
+
+            tol [float]: stops when the largest change of the fitted values
+                         on the sampled states is below tol.
+
+        Raises/Returns
+        --------------
+            theta [ndarray]: the fitted weights.
+
+            stats [dict]: 'iterations', 'residual', 'residuals' and 'time'.
+
+        Explanations
+        ------------
+            Runs fitted value iteration.
+        """
+
+        start = time.perf_counter()
+        residuals = []
+        for it in range(1,numIter + 1):
+            states = np.asarray(self.mdp.sSpace.sample(self.numStates))
+            noise = np.asarray(self.mdp.nSpace.sample(self.numNoise))
+            targets = self.sign*self.lookahead.best(states,noise)[1]
+            Phi = self.features.transform(states)
+            old = Phi @ self.theta
+            if self.rls is not None:
+                self.theta = self.rls.update(Phi,targets).copy()
+            else:
+                A = Phi.T @ Phi + self.ridge*np.eye(Phi.shape[1])
+                self.theta = np.linalg.solve(A,Phi.T @ targets)
+            residuals.append(float(np.max(np.abs(Phi @ self.theta - old))))
+            if residuals[-1] < tol:
+                break
+        stats = {'iterations': it, 'residual': residuals[-1],
+                 'residuals': residuals, 'time': time.perf_counter() - start}
+        return self.theta, stats
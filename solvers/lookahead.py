@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+GitHub Homepage
+----------------
+    https://github.com/ADP-Benchmarks
+
+Contact information
+-------------------
+    ADP.Benchmarks@gmail.com.
+
+License
+-------
+    The MIT License
+"""
+
+import numpy as np
+
+class Lookahead():
+    """
+    Description
+    -----------
+        This class provides one-step lookahead action selection: for every
+        state s it returns the action minimizing (maximizing for rewards)
+        the sample average of cost(s,a,w) + discount * V(f(s,a,w)) over
+        noise samples w. All state x action x noise combinations are
+        evaluated as broadcasted batches, in chunks of at most maxBatch
+        transitions, the state-action pairs being built for blocks of
+        states.
+    """
+
+    def __init__(self, mdp, valueFn=None, discount=1.0, numNoise=32,
+                 actions=None, numActions=64, maxBatch=2**20):
+        """
+        Inputs
+        ------
+            mdp [MDP]: the MDP.
+
+            valueFn [callable]: optional, maps a (..., sDim) array of states
+                                to their (...) values. If None, the policy
+                                is myopic.
+
+            discount [float]: the discount factor applied to valueFn.
+
+            numNoise [int]: the number of noise samples per call.
+
+            actions [ndarray]: optional, (numCandidates, aDim) fixed
+                               candidate actions. Defaults to every action
+                               of a discrete action space. For continuous
+                               action spaces, numActions candidates are
+                               sampled at every call instead.
+
+            numActions [int]: the number of sampled candidate actions.
+
+            maxBatch [int]: the maximal number of transitions evaluated in
+                            one batched call.
+
+        Raises/Returns
+        --------------
+
+        Explanations
+        ------------
+            The constructor of Lookahead object.
+        """
+
+        self.mdp = mdp
+        self.valueFn = valueFn
+        self.discount = discount
+        self.numNoise = numNoise
+        self.numActions = numActions
+        self.maxBatch = maxBatch
+        self.sign = 1.0 if mdp.objective.isMinCost else -1.0
+        if actions is None and not mdp.aSpace.isContinuous:
+            actions = mdp.aSpace.enumerate()
+        self.actions = None if actions is None else np.asarray(actions)
+
+    def best(self, states, noise=None):
+        """
+        Inputs
+        ------
+            states [ndarray]: (N, sDim) array of states.
+
+            noise [ndarray]: optional, (M, nDim) noise samples shared by
+                             all pairs. Sampled from nSpace if not given.
+
+        Raises/Returns
+        --------------
+            actions [ndarray]: (N, aDim) best actions.
+
+            values [ndarray]: (N,) their Q-values, nan for states without
+                              any feasible candidate.
+
+        Explanations
+        ------------
+            Enumerates the candidate actions, filters them with
+            isStateActionFeasbleBatch and evaluates the feasible pairs
+            against every noise sample.
+        """
+
+        states = np.asarray(states)
+        if noise is None:
+            noise = np.asarray(self.mdp.nSpace.sample(self.numNoise))
+        noise = np.asarray(noise)
+        if self.actions is None:
+            candidates = np.asarray(self.mdp.aSpace.sample(self.numActions))
+        else:
+            candidates = self.actions
+
+        N,A,M = states.shape[0],candidates.shape[0],noise.shape[0]
+        choice = np.zeros(N,dtype=np.int64)
+        bestQ = np.full(N,np.inf)
+        # Pairs are only built for a block of state rows at a time, so that
+        # the memory footprint is bounded by maxBatch, not by N*A
+        chunk = max(1,self.maxBatch//M)
+        rows = max(1,chunk//A)
+        for lo in range(0,N,rows):
+            hi = min(N,lo + rows)
+            pairStates = np.repeat(states[lo:hi],A,axis=0)
+            pairActions = np.tile(candidates,(hi - lo,1))
+            feasible = np.flatnonzero(
+                self.mdp.aSpace.isStateActionFeasbleBatch(pairStates,
+                                                          pairActions)[0])
+            Q = np.full((hi - lo)*A,np.inf)
+            for start in range(0,feasible.shape[0],chunk):
+                idx = feasible[start:start + chunk]
+                Q[idx] = self.qValues(pairStates[idx],pairActions[idx],noise)
+            Q = Q.reshape(hi - lo,A)
+            choice[lo:hi] = Q.argmin(axis=1)
+            bestQ[lo:hi] = Q[np.arange(hi - lo),choice[lo:hi]]
+
+        bestQ = np.where(np.isfinite(bestQ),self.sign*bestQ,np.nan)
+        return candidates[choice], bestQ
+
+    def qValues(self, states, actions, noise):
+        """
+        Inputs
+        ------
+            states [ndarray]: (K, sDim) array of states.
+
+            actions [ndarray]: (K, aDim) array of actions.
+
+            noise [ndarray]: (M, nDim) noise samples.
+
+        Raises/Returns
+        --------------
+            [ndarray]: (K,) sample-average Q-values, in cost terms.
+
+        Explanations
+        ------------
+            Evaluates K state-action pairs against M noise samples in one
+            batched transition and objective call.
+        """
+
+        # A read-only view, the noise samples are not copied per pair
+        noise = np.broadcast_to(noise,(states.shape[0],) + noise.shape)
+        costs = self.mdp.objective.getObjectivesBatch(states,actions,noise)
+        if self.valueFn is not None:
+            nextStates = self.mdp.transition.getNextStatesBatch(states,
+                                                                actions,noise)
+            costs = costs + self.discount*self.valueFn(nextStates)
+        return self.sign*np.mean(costs,axis=1)
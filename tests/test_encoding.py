@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+GitHub Homepage
+----------------
+    https://github.com/ADP-Benchmarks
+
+Contact information
+-------------------
+    ADP.Benchmarks@gmail.com.
+
+License
+-------
+    The MIT License
+"""
+
+import numpy as np
+import pytest
+from MDP.spaces.ball import Ball
+from MDP.spaces.cube import Cube
+from MDP.spaces.encoding import TerminalSet, encodeExact, exactKey
+
+def test_cube_keys_round_trip():
+    cube = Cube(np.array([[0,3],[-2,2],[1,1]]),isContinuous=False)
+    points = cube.enumerate()
+    assert points.shape[0] == cube.cardinality == 20
+    keys,exact = encodeExact(cube,points)
+    assert np.array_equal(keys,np.arange(20)) and exact.all()
+
+def test_inexact_states_are_flagged():
+    cube = Cube(np.array([[0,10],[0,10]]),isContinuous=False)
+    keys,exact = encodeExact(cube,np.array([[0,0],[0.5,0.9],[2,3]]))
+    assert np.array_equal(exact,[True,False,True])
+    assert exactKey(cube,[0.5,0.9]) is None
+    assert exactKey(cube,[2,3]) == 2*11 + 3
+
+@pytest.mark.parametrize('maxBitmask',[2**26,1])
+def test_terminal_set_does_not_alias(maxBitmask):
+    cube = Cube(np.array([[0,10],[0,10]]),isContinuous=False)
+    terminal = TerminalSet(cube,[[0,0],[4,5]],maxBitmask=maxBitmask)
+    states = np.array([[0,0],[0.5,0.9],[4,5],[4.2,5],[11,0],[-1,0]])
+    assert np.array_equal(terminal.containsBatch(states),
+                          [True,False,True,False,False,False])
+    assert not terminal.contains([0.5,0.9])
+
+def test_terminal_set_on_a_ball():
+    ball = Ball(np.zeros(2),2.0,isContinuous=False)
+    terminal = TerminalSet(ball,[[1,1]])
+    assert np.array_equal(terminal.containsBatch(
+                            np.array([[1,1],[1.5,1],[3,3]])),
+                          [True,False,False])
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+GitHub Homepage
+----------------
+    https://github.com/ADP-Benchmarks
+
+Contact information
+-------------------
+    ADP.Benchmarks@gmail.com.
+
+License
+-------
+    The MIT License
+"""
+
+import numpy as np
+import pytest
+from MDP.tabular import compileMDP
+from problems.reference import makeProblem, loadReferences
+from solvers.exact import (valueIteration, policyIteration,
+                           relativeValueIteration)
+
+INSTANCES = ['inventory-1','queueing-1','energyStorage-1']
+
+def averageValue(model, policy):
+    """
+    Returns the long-run average cost/reward of a unichain policy, from the
+    stationary distribution of its transition matrix.
+    """
+    states = np.arange(model.numStates)
+    Ppi = np.array([model.P[a][i].toarray()[0]
+                    for i,a in zip(states,policy)])
+    A = np.vstack([Ppi.T - np.eye(model.numStates),
+                   np.ones(model.numStates)])
+    b = np.zeros(model.numStates + 1)
+    b[-1] = 1.0
+    pi = np.linalg.lstsq(A,b,rcond=None)[0]
+    return float(pi @ model.C[policy,states])
+
+@pytest.mark.parametrize('name',INSTANCES)
+def test_value_and_policy_iteration_agree(name):
+    model = compileMDP(makeProblem(name))
+    V1,policy1,_ = valueIteration(model,0.95,tol=1e-10)
+    V2,policy2,_ = policyIteration(model,0.95)
+    assert np.allclose(V1,V2,atol=1e-6)
+    assert np.array_equal(policy1,policy2)
+    key = int(model.sSpace.encode(np.asarray(makeProblem(name).initState)))
+    assert np.isclose(V2[key],loadReferences()[name]['value'])
+
+@pytest.mark.parametrize('name',INSTANCES)
+def test_relative_value_iteration_gain(name):
+    model = compileMDP(makeProblem(name))
+    gain,h,policy,_ = relativeValueIteration(model,tol=1e-10,tau=0.5)
+    assert np.isclose(gain,averageValue(model,policy),rtol=1e-6)
+    # Vanishing discount: (1 - discount) V tends to the optimal gain
+    V,_,_ = policyIteration(model,0.9999)
+    assert np.allclose((1 - 0.9999)*V,gain,rtol=2e-2)
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+GitHub Homepage
+----------------
+    https://github.com/ADP-Benchmarks
+
+Contact information
+-------------------
+    ADP.Benchmarks@gmail.com.
+
+License
+-------
+    The MIT License
+"""
+
+import itertools
+import time
+import numpy as np
+import pytest
+from MDP.spaces.ball import Ball
+from MDP.spaces.lattice import LatticeIndex
+
+def bruteForce(center, radius):
+    """
+    Returns the lattice points of the ball in lexicographic order of their
+    offsets.
+    """
+    bound = int(np.floor(radius))
+    offsets = [z for z in itertools.product(range(-bound,bound + 1),
+                                            repeat=center.shape[0])
+               if sum(v*v for v in z) <= radius ** 2]
+    return np.array(offsets) + center
+
+@pytest.mark.parametrize('dim,radius,shift',[(1,2.5,0.0),(2,1.0,0.5),
+                                             (3,2.3,1.0),(4,3.0,-2.0),
+                                             (3,0.0,0.0)])
+def test_rank_unrank_bijection(dim, radius, shift):
+    center = np.full(dim,shift)
+    lattice = LatticeIndex(center,radius)
+    points = bruteForce(center,radius)
+    assert lattice.cardinality == points.shape[0]
+    keys = np.arange(lattice.cardinality)
+    assert np.array_equal(lattice.index(points),keys)
+    assert np.array_equal(lattice.decode(keys),points)
+    assert np.array_equal(lattice.enumerate(),points)
+
+def test_non_lattice_points_are_rejected():
+    lattice = LatticeIndex(np.zeros(3),2.3)
+    points = np.array([[0.5,0,0],[3,0,0],[2,2,0],[0,0,0]])
+    assert np.array_equal(lattice.index(points),[-1,-1,-1,
+                          lattice.index(np.zeros(3))])
+    assert np.array_equal(lattice.contains(points),[False,False,False,True])
+
+def test_large_balls():
+    start = time.perf_counter()
+    lattice = LatticeIndex(np.zeros(16),10.0)
+    assert time.perf_counter() - start < 1.0
+    keys = np.random.default_rng(0).integers(0,lattice.cardinality,1000)
+    assert np.array_equal(lattice.index(lattice.decode(keys)),keys)
+    with pytest.raises(AssertionError,match='too many lattice'):
+        LatticeIndex(np.zeros(64),10.0)
+
+def test_discrete_ball_is_lazy():
+    ball = Ball(np.zeros(8),4.0,isContinuous=False,seed=0)
+    assert ball._lattice is None
+    assert ball.isStateFeasble(np.zeros(8))
+    assert not ball.isStateFeasble(np.full(8,0.5))
+    assert ball._lattice is None
+    samples = ball.sample(100)
+    assert ball.isStateFeasbleBatch(samples)[1].size == 0
+    assert np.array_equal(ball.decode(ball.encode(samples)),samples)
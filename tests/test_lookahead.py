@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+GitHub Homepage
+----------------
+    https://github.com/ADP-Benchmarks
+
+Contact information
+-------------------
+    ADP.Benchmarks@gmail.com.
+
+License
+-------
+    The MIT License
+"""
+
+import numpy as np
+from solvers.lookahead import Lookahead
+from problems.inventory import makeInventory
+
+def totalStock(states):
+    return np.sum(states,axis=-1).astype(float)
+
+def test_chunking_does_not_change_the_choice():
+    mdp = makeInventory(dim=2,capacity=6,maxOrder=3,maxDemand=3,seed=0)
+    states = mdp.sSpace.enumerate()
+    noise = mdp.nSpace.sample(16)
+    reference = Lookahead(mdp,totalStock,0.9).best(states,noise)
+    for maxBatch in (100,16,1):
+        actions,values = Lookahead(mdp,totalStock,0.9,
+                                   maxBatch=maxBatch).best(states,noise)
+        assert np.array_equal(actions,reference[0])
+        assert np.array_equal(values,reference[1])
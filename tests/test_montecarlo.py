@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+GitHub Homepage
+----------------
+    https://github.com/ADP-Benchmarks
+
+Contact information
+-------------------
+    ADP.Benchmarks@gmail.com.
+
+License
+-------
+    The MIT License
+"""
+
+import numpy as np
+import pytest
+from evaluation.montecarlo import evaluatePolicy, runEpisode
+from problems.inventory import makeInventory
+
+def orderUpTo(state):
+    return np.maximum(5 - np.asarray(state),0)
+
+def test_parallel_matches_serial():
+    mdp = makeInventory(horizon=20)
+    serial = evaluatePolicy(mdp,orderUpTo,50,seed=3,numWorkers=1)
+    parallel = evaluatePolicy(mdp,orderUpTo,50,seed=3,numWorkers=4)
+    assert np.array_equal(serial['returns'],parallel['returns'])
+    assert serial['mean'] == parallel['mean']
+
+def test_unpicklable_policy_is_reported():
+    mdp = makeInventory(horizon=5)
+    with pytest.raises(AssertionError,match='picklable'):
+        evaluatePolicy(mdp,lambda s: orderUpTo(s),4,seed=0,numWorkers=2)
+
+def test_caller_mdp_is_untouched():
+    mdp = makeInventory(horizon=5,seed=1)
+    expected = makeInventory(horizon=5,seed=1).nSpace.sample(3)
+    runEpisode(mdp,orderUpTo,np.random.SeedSequence(0),5)
+    evaluatePolicy(mdp,orderUpTo,4,seed=0)
+    assert np.array_equal(mdp.nSpace.sample(3),expected)
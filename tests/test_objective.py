@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+GitHub Homepage
+----------------
+    https://github.com/ADP-Benchmarks
+
+Contact information
+-------------------
+    ADP.Benchmarks@gmail.com.
+
+License
+-------
+    The MIT License
+"""
+
+import numpy as np
+from MDP.spaces.cube import Cube
+from benchmarks.benchmark import LinearObjective
+
+def makeObjective():
+    sSpace = Cube(np.array([[0,10]]),isContinuous=False)
+    aSpace = Cube(np.array([[0,10]]),isContinuous=False)
+    nSpace = Cube(np.array([[0,3]]),isContinuous=False,seed=0)
+    return LinearObjective(sSpace,aSpace,isDeterministic=False,
+                           isMinCost=True,nSpace=nSpace,cacheSize=8)
+
+def test_exact_pairs_are_memoized():
+    objective = makeObjective()
+    first = objective.exceptObjective(np.array([2]),np.array([1]),100)
+    again = objective.exceptObjective(np.array([2]),np.array([1]),100)
+    assert first == again == 3.0
+    assert objective.cache.stats()['hits'] == 1
+
+def test_inexact_pairs_do_not_alias_cached_entries():
+    objective = makeObjective()
+    objective.exceptObjective(np.array([2]),np.array([1]),100)
+    assert objective.cacheKey(np.array([2.7]),np.array([1.9]),100) is None
+    value = objective.exceptObjective(np.array([2.7]),np.array([1.9]),100)
+    assert np.isclose(value,4.6)
+    assert objective.cache.stats()['hits'] == 0
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+GitHub Homepage
+----------------
+    https://github.com/ADP-Benchmarks
+
+Contact information
+-------------------
+    ADP.Benchmarks@gmail.com.
+
+License
+-------
+    The MIT License
+"""
+
+import pickle
+import numpy as np
+import pytest
+from problems.reference import PROBLEMS
+
+@pytest.mark.parametrize('name',sorted(PROBLEMS))
+def test_pickle_round_trip(name):
+    mdp = PROBLEMS[name](seed=0)
+    copy = pickle.loads(pickle.dumps(mdp))
+    states = mdp.sSpace.enumerate()[:20]
+    actions = np.zeros((states.shape[0],mdp.aDim),dtype=np.int64)
+    noise = mdp.nSpace.sample(5)[np.newaxis]
+    assert np.array_equal(
+        mdp.transition.getNextStatesBatch(states,actions,noise),
+        copy.transition.getNextStatesBatch(states,actions,noise))
+    assert np.array_equal(
+        mdp.objective.getObjectivesBatch(states,actions,noise),
+        copy.objective.getObjectivesBatch(states,actions,noise))
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+GitHub Homepage
+----------------
+    https://github.com/ADP-Benchmarks
+
+Contact information
+-------------------
+    ADP.Benchmarks@gmail.com.
+
+License
+-------
+    The MIT License
+"""
+
+import numpy as np
+import pytest
+from MDP.vectorMDP import VectorMDP
+from problems.inventory import makeInventory
+from sampling.scenarios import ScenarioStore
+
+def orderUpTo(state):
+    return np.maximum(5 - np.asarray(state),0)
+
+def replay(mdp, store, episode, numSteps):
+    mdp.setScenario(store,episode)
+    mdp.reset()
+    rewards = []
+    for _ in range(numSteps):
+        out = mdp.step(orderUpTo(mdp.currState))
+        rewards.append(out[1])
+    return np.array(rewards)
+
+def test_generate_is_reproducible(tmp_path):
+    nSpace = makeInventory().nSpace
+    first = ScenarioStore.generate(nSpace,4,10,seed=7)
+    second = ScenarioStore.generate(nSpace,4,10,seed=7,
+                                    filename=str(tmp_path/'paths.npy'))
+    loaded = ScenarioStore.load(str(tmp_path/'paths.npy'))
+    assert np.array_equal(first.paths,second.paths)
+    assert np.array_equal(first.paths,loaded.paths)
+
+def test_common_random_numbers():
+    store = ScenarioStore.generate(makeInventory().nSpace,3,10,seed=0)
+    first = replay(makeInventory(seed=1),store,2,10)
+    second = replay(makeInventory(seed=2),store,2,10)
+    assert np.array_equal(first,second)
+    mdp = makeInventory()
+    mdp.setScenario(store,2)
+    for noise in store.path(2):
+        assert np.array_equal(mdp.step(orderUpTo(mdp.currState))[2]['noise'],
+                              noise)
+
+def test_step_past_the_scenario_end():
+    store = ScenarioStore.generate(makeInventory().nSpace,1,3,seed=0)
+    mdp = makeInventory()
+    replay(mdp,store,0,3)
+    with pytest.raises(ValueError,match='3 steps'):
+        mdp.step(orderUpTo(mdp.currState))
+
+def test_vector_copies_move_on_to_next_scenario():
+    horizon,numEnvs = 3,2
+    store = ScenarioStore.generate(makeInventory().nSpace,6,horizon,seed=0)
+    vec = VectorMDP(makeInventory(horizon=horizon),numEnvs)
+    vec.setScenarios(store,np.arange(numEnvs))
+    actions = np.zeros((numEnvs,1),dtype=np.int64)
+    for episode in range(0,6,numEnvs):
+        for t in range(horizon):
+            noise = vec.step(actions)[3]['noise']
+            assert np.array_equal(noise,store.paths[episode:episode + numEnvs,
+                                                    t])
+    with pytest.raises(ValueError,match='6 paths'):
+        vec.step(actions)
+    vec.reset()
+    assert np.array_equal(vec.step(actions)[3]['noise'],store.paths[:2,0])
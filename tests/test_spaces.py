@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+GitHub Homepage
+----------------
+    https://github.com/ADP-Benchmarks
+
+Contact information
+-------------------
+    ADP.Benchmarks@gmail.com.
+
+License
+-------
+    The MIT License
+"""
+
+import numpy as np
+from MDP.spaces.ball import Ball
+from MDP.spaces.cube import Cube
+from MDP.spaces.product import ProductSpace
+
+def test_product_encoder_is_lazy():
+    ball = Ball(np.zeros(16),10.0,isContinuous=False,seed=0)
+    cube = Cube(np.array([[0,3]]),isContinuous=False,seed=0)
+    product = ProductSpace([ball,cube])
+    points = np.zeros((3,17),dtype=np.int64)
+    points[1,:16] = 2
+    points[2,16] = 3
+    assert product.isStateFeasbleBatch(points)[1].size == 0
+    assert ball._lattice is None
+    points = np.concatenate([ball.sample(50),cube.sample(50)],axis=1)
+    keys = product.encode(points)
+    assert np.array_equal(product.decode(keys),points)
+    assert product.cardinality == ball.cardinality*4
+
+def test_continuous_product_is_not_encodable():
+    product = ProductSpace([Cube(np.array([[0.,1.]])),
+                            Cube(np.array([[0,3]]),isContinuous=False)])
+    assert product.encoder is None and product.cardinality is None
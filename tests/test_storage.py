@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+GitHub Homepage
+----------------
+    https://github.com/ADP-Benchmarks
+
+Contact information
+-------------------
+    ADP.Benchmarks@gmail.com.
+
+License
+-------
+    The MIT License
+"""
+
+import numpy as np
+import pytest
+from MDP.tabular import compileMDP
+from MDP.storage import saveModel, loadModel, saveSolution, loadSolution
+from problems.reference import makeProblem
+from solvers.exact import policyIteration
+
+@pytest.mark.parametrize('mmap',[True,False])
+@pytest.mark.parametrize('saveEncodings',[True,False])
+def test_model_round_trip(tmp_path, mmap, saveEncodings):
+    mdp = makeProblem('inventory-2')
+    model = compileMDP(mdp)
+    saveModel(model,str(tmp_path),saveEncodings)
+    if saveEncodings:
+        loaded = loadModel(str(tmp_path),mmap=mmap)
+    else:
+        loaded = loadModel(str(tmp_path),mdp.sSpace,mdp.aSpace,mmap=mmap)
+    assert (loaded.numStates,loaded.numActions) == (model.numStates,
+                                                    model.numActions)
+    assert np.array_equal(loaded.C,model.C)
+    assert np.array_equal(loaded.actionMask,model.actionMask)
+    assert loaded.isMinCost == model.isMinCost
+    for P,Q in zip(model.P,loaded.P):
+        assert (P != Q).nnz == 0
+    assert np.array_equal(loaded.sSpace.enumerate(),mdp.sSpace.enumerate())
+    assert np.array_equal(policyIteration(loaded,0.95)[0],
+                          policyIteration(model,0.95)[0])
+
+def test_solution_round_trip(tmp_path):
+    model = compileMDP(makeProblem('queueing-1'))
+    V,policy,stats = policyIteration(model,0.95)
+    saveSolution(str(tmp_path),V,policy,stats)
+    V2,policy2,stats2 = loadSolution(str(tmp_path))
+    assert np.array_equal(V,V2) and np.array_equal(policy,policy2)
+    assert stats2['iterations'] == stats['iterations']
+    assert 'residuals' not in stats2
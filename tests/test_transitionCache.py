@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+GitHub Homepage
+----------------
+    https://github.com/ADP-Benchmarks
+
+Contact information
+-------------------
+    ADP.Benchmarks@gmail.com.
+
+License
+-------
+    The MIT License
+"""
+
+import numpy as np
+import pytest
+from MDP.transitionCache import TransitionCache
+from problems.inventory import makeInventory
+
+def test_inexact_pairs_do_not_alias_cached_entries():
+    cache = TransitionCache(makeInventory())
+    cache.distribution(np.array([2]),np.array([1]))
+    assert cache.key(np.array([2]),np.array([1])) is not None
+    assert cache.key(np.array([2.7]),np.array([1.9])) is None
+    with pytest.raises(AssertionError):
+        cache.distribution(np.array([2.7]),np.array([1.9]))
+    assert cache.stats()['hits'] == 0
+
+def test_distribution_is_cached():
+    cache = TransitionCache(makeInventory())
+    keys,probs = cache.distribution(np.array([2]),np.array([1]))
+    again = cache.distribution(np.array([2]),np.array([1]))
+    assert again[0] is keys and again[1] is probs
+    assert cache.stats()['hits'] == 1
+    assert np.isclose(probs.sum(),1.0)
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+GitHub Homepage
+----------------
+    https://github.com/ADP-Benchmarks
+
+Contact information
+-------------------
+    ADP.Benchmarks@gmail.com.
+
+License
+-------
+    The MIT License
+"""
+
+import numpy as np
+import pytest
+from MDP.MDP import MDP
+from MDP.vectorMDP import VectorMDP
+from MDP.vectorEnv import VectorEnv
+from problems.inventory import makeInventory
+
+def makeAbsorbing(horizon):
+    base = makeInventory(seed=0)
+    return MDP(initState=np.array([2]),sSpace=base.sSpace,aSpace=base.aSpace,
+               nSpace=base.nSpace,transition=base.transition,
+               objective=base.objective,isFiniteHorizon=horizon,
+               terminalStates=[[0]])
+
+@pytest.mark.parametrize('horizon',[False,4])
+def test_vector_apis_agree(horizon):
+    numEnvs = 8
+    vec = VectorMDP(makeAbsorbing(horizon),numEnvs)
+    env = VectorEnv(makeAbsorbing(horizon),numEnvs,negateCosts=False)
+    rng = np.random.default_rng(0)
+    actions = np.zeros((numEnvs,1),dtype=np.int64)
+    for _ in range(12):
+        noise = rng.integers(0,5,size=(numEnvs,1))
+        nextStates,rewards,dones,info = vec.step(actions,noise)
+        obs,envRewards,terminated,truncated,envInfo = env.step(actions,noise)
+        assert np.array_equal(envInfo['final_obs'],nextStates)
+        assert np.array_equal(envRewards,rewards)
+        assert np.array_equal(terminated | truncated,dones)
+        assert np.array_equal(obs,vec.currStates)
+        if horizon:
+            assert not terminated.any()
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+GitHub Homepage
+----------------
+    https://github.com/ADP-Benchmarks
+
+Contact information
+-------------------
+    ADP.Benchmarks@gmail.com.
+
+License
+-------
+    The MIT License
+"""
+
+import numpy as np
+import pytest
+from MDP.vectorMDP import VectorMDP
+from problems.inventory import makeInventory
+
+def test_inexact_next_states_are_rejected():
+    numEnvs = 3
+    vec = VectorMDP(makeInventory(),numEnvs)
+    actions = np.ones((numEnvs,1),dtype=np.int64)
+    # Integral float next states are stored exactly
+    vec.step(actions,np.zeros((numEnvs,1)))
+    assert np.array_equal(vec.currStates,np.ones((numEnvs,1)))
+    with pytest.raises(ValueError,match='not exactly representable'):
+        vec.step(actions,np.full((numEnvs,1),0.5))